@@ -44,5 +44,8 @@ async def run_migrations_online() -> None:
 
 if context.is_offline_mode():
     run_migrations_offline()
+elif (connection := config.attributes.get("connection")) is not None:
+    # Called from app.database.migrate_schema on an open startup connection
+    do_run_migrations(connection)
 else:
     asyncio.run(run_migrations_online())
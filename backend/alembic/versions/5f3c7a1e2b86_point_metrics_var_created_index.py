@@ -0,0 +1,23 @@
+"""point_metrics_var_created_index
+
+Revision ID: 5f3c7a1e2b86
+Revises: e81b5c3a9d47
+Create Date: 2026-10-15 12:48:51.093374
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5f3c7a1e2b86'
+down_revision: Union[str, None] = 'e81b5c3a9d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_pm_var_created', 'point_metrics', ['variable', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pm_var_created', table_name='point_metrics')
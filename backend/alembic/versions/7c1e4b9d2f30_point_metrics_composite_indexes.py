@@ -0,0 +1,31 @@
+"""point_metrics_composite_indexes
+
+Revision ID: 7c1e4b9d2f30
+Revises: 12589288566b
+Create Date: 2026-10-15 09:12:44.310215
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e4b9d2f30'
+down_revision: Union[str, None] = '12589288566b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_pm_var_lead_created', 'point_metrics', ['variable', 'lead_hour', sa.text('created_at DESC')], unique=False)
+    op.create_index('ix_pm_var_lat_lon', 'point_metrics', ['variable', 'lat', 'lon'], unique=False)
+    op.drop_index(op.f('ix_point_metrics_variable'), table_name='point_metrics')
+    op.drop_index(op.f('ix_point_metrics_lead_hour'), table_name='point_metrics')
+
+
+def downgrade() -> None:
+    op.create_index(op.f('ix_point_metrics_lead_hour'), 'point_metrics', ['lead_hour'], unique=False)
+    op.create_index(op.f('ix_point_metrics_variable'), 'point_metrics', ['variable'], unique=False)
+    op.drop_index('ix_pm_var_lat_lon', table_name='point_metrics')
+    op.drop_index('ix_pm_var_lead_created', table_name='point_metrics')
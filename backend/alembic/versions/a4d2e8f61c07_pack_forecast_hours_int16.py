@@ -0,0 +1,50 @@
+"""pack_forecast_hours_int16
+
+Revision ID: a4d2e8f61c07
+Revises: 7c1e4b9d2f30
+Create Date: 2026-10-15 11:03:27.518904
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2e8f61c07'
+down_revision: Union[str, None] = '7c1e4b9d2f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # integer[] -> big-endian int16 bytes (see app.models.model_run.PackedInt16List).
+    # Postgres won't take a subquery in ALTER ... USING, so copy via a new column.
+    op.add_column('model_runs', sa.Column('forecast_hours_packed', sa.LargeBinary(), nullable=True))
+    op.execute(
+        """
+        UPDATE model_runs SET forecast_hours_packed = coalesce(
+            (SELECT string_agg(int2send(h::smallint), ''::bytea ORDER BY i)
+             FROM unnest(forecast_hours) WITH ORDINALITY AS t(h, i)),
+            ''::bytea)
+        """
+    )
+    op.drop_column('model_runs', 'forecast_hours')
+    op.alter_column('model_runs', 'forecast_hours_packed', new_column_name='forecast_hours', nullable=False)
+
+
+def downgrade() -> None:
+    op.add_column('model_runs', sa.Column('forecast_hours_array', postgresql.ARRAY(sa.INTEGER()), nullable=True))
+    op.execute(
+        """
+        UPDATE model_runs SET forecast_hours_array = ARRAY(
+            -- lead hours are non-negative, so no sign extension is needed
+            SELECT (get_byte(forecast_hours, 2 * i) << 8)
+                   | get_byte(forecast_hours, 2 * i + 1)
+            FROM generate_series(0, length(forecast_hours) / 2 - 1) AS i
+            ORDER BY i)
+        """
+    )
+    op.drop_column('model_runs', 'forecast_hours')
+    op.alter_column('model_runs', 'forecast_hours_array', new_column_name='forecast_hours', nullable=False)
@@ -0,0 +1,36 @@
+"""point_geo_bucket
+
+Revision ID: b27d9e04c5a1
+Revises: 5f3c7a1e2b86
+Create Date: 2026-10-15 13:21:37.664108
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b27d9e04c5a1'
+down_revision: Union[str, None] = '5f3c7a1e2b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.models.divergence._GEO_BUCKET_SQL
+GEO_BUCKET_SQL = 'CAST(floor(lat * 2) AS INTEGER) * 10000 + CAST(floor(lon * 2) AS INTEGER)'
+
+
+def upgrade() -> None:
+    op.add_column('point_metrics', sa.Column('geo_bucket', sa.Integer(), sa.Computed(GEO_BUCKET_SQL, persisted=True), nullable=False))
+    op.add_column('model_point_values', sa.Column('geo_bucket', sa.Integer(), sa.Computed(GEO_BUCKET_SQL, persisted=True), nullable=False))
+    op.create_index('ix_pm_var_geo_bucket', 'point_metrics', ['variable', 'geo_bucket'], unique=False)
+    op.create_index('ix_mpv_var_geo_bucket', 'model_point_values', ['variable', 'geo_bucket'], unique=False)
+    op.drop_index('ix_pm_var_lat_lon', table_name='point_metrics')
+
+
+def downgrade() -> None:
+    op.create_index('ix_pm_var_lat_lon', 'point_metrics', ['variable', 'lat', 'lon'], unique=False)
+    op.drop_index('ix_mpv_var_geo_bucket', table_name='model_point_values')
+    op.drop_index('ix_pm_var_geo_bucket', table_name='point_metrics')
+    op.drop_column('model_point_values', 'geo_bucket')
+    op.drop_column('point_metrics', 'geo_bucket')
@@ -0,0 +1,27 @@
+"""alert_events_indexes
+
+Revision ID: e81b5c3a9d47
+Revises: a4d2e8f61c07
+Create Date: 2026-10-15 12:26:08.417530
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e81b5c3a9d47'
+down_revision: Union[str, None] = 'a4d2e8f61c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_alert_events_active', 'alert_events', [sa.text('triggered_at DESC')], unique=False, postgresql_where=sa.text('resolved = false'))
+    op.create_index('ix_alert_events_triggered', 'alert_events', [sa.text('triggered_at DESC')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alert_events_triggered', table_name='alert_events')
+    op.drop_index('ix_alert_events_active', table_name='alert_events', postgresql_where=sa.text('resolved = false'))
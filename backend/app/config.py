@@ -41,6 +41,15 @@ class Settings(BaseSettings):
         logger.info("DATABASE_URL after normalization: %s", _redact_url(url))
         return self
 
+    # Connection pool for the async engine.  Set DB_USE_NULL_POOL=true when
+    # running behind an external pooler (e.g. pgbouncer) so connections are
+    # not pooled twice; the size settings are then ignored.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
+    db_pool_pre_ping: bool = True
+    db_use_null_pool: bool = False
+
     data_store_path: Path = Path("./data")
     scheduler_enabled: bool = True
     # Create ORM tables automatically on startup (set to true in production).
@@ -53,6 +62,16 @@ class Settings(BaseSettings):
     # Overrides the idempotent check in ingest_and_process.  Intended for
     # Docker deploys where model data should be refreshed on every restart.
     force_model_reload: bool = False
+    # Manually triggered ingestion (POST /api/admin/trigger): number of
+    # concurrent workers and how many jobs may wait before new triggers get 429.
+    ingest_workers: int = 1
+    ingest_queue_size: int = 16
+    # Keep each model's regridded fields as .npy under DATA_STORE_PATH/regrid
+    # so later divergence recomputes of the same cycle skip regridding.
+    regrid_cache_enabled: bool = False
+    # Seconds that /divergence/summary and /divergence/grid/snapshots bodies
+    # are served from the in-process cache (0 disables it).
+    response_cache_ttl_seconds: float = 60.0
     # Alerting
     alert_webhook_url: str = ""
     alert_check_enabled: bool = True
@@ -1,15 +1,33 @@
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from pathlib import Path
 
+from sqlalchemy import inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import _redact_url, settings
 
 logger = logging.getLogger(__name__)
 
 logger.info("Creating async engine with URL: %s", _redact_url(settings.database_url))
-engine = create_async_engine(settings.database_url, echo=False)
+
+
+def _engine_kwargs() -> dict:
+    if settings.db_use_null_pool:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+engine = create_async_engine(settings.database_url, echo=False, **_engine_kwargs())
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
@@ -17,6 +35,67 @@ class Base(DeclarativeBase):
     pass
 
 
+# Schema created by create_all before startup ran migrations matches this
+# revision exactly, so such databases are stamped here and then upgraded.
+PRE_MIGRATION_REVISION = "12589288566b"
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
+
+
+def migrate_schema(connection) -> None:
+    """Bring the schema on *connection* up to date (``DATABASE_AUTO_CREATE``).
+
+    ``create_all`` never alters existing tables, so on PostgreSQL the Alembic
+    migrations run here:
+
+    - empty database: ``create_all``, then stamp ``head``;
+    - tables but no ``alembic_version`` (created by ``create_all`` on an
+      older release): stamp :data:`PRE_MIGRATION_REVISION`, then upgrade;
+    - otherwise: ``upgrade head``.
+
+    Other dialects only get ``create_all``.  Runs inside the caller's
+    transaction, via ``Connection.run_sync``.
+    """
+    import app.models  # noqa: F401 — registers all models with Base
+
+    if connection.dialect.name != "postgresql":
+        Base.metadata.create_all(connection)
+        return
+
+    from alembic.config import Config
+
+    from alembic import command
+
+    cfg = Config()
+    cfg.set_main_option("script_location", str(ALEMBIC_DIR))
+    cfg.attributes["connection"] = connection
+
+    inspector = inspect(connection)
+    if not inspector.has_table("alembic_version"):
+        if not inspector.has_table("model_runs"):
+            Base.metadata.create_all(connection)
+            command.stamp(cfg, "head")
+            return
+        logger.info("Stamping unversioned schema at %s", PRE_MIGRATION_REVISION)
+        command.stamp(cfg, PRE_MIGRATION_REVISION)
+    command.upgrade(cfg, "head")
+
+
 async def get_db() -> AsyncGenerator[AsyncSession]:
     async with async_session() as session:
         yield session
+
+
+async def warm_pool() -> None:
+    """Open ``db_pool_size`` connections up front so early requests don't pay
+    for connection setup.  Does nothing when pooling is disabled."""
+    if settings.db_use_null_pool:
+        return
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(
+                stack.enter_async_context(engine.connect())
+                for _ in range(settings.db_pool_size)
+            )
+        )
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    logger.info("Warmed DB connection pool with %d connections", len(conns))
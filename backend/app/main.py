@@ -6,7 +6,7 @@ from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 
 # Configure logging early so app.* loggers are visible in Render logs.
 logging.basicConfig(
@@ -16,6 +16,7 @@ logging.basicConfig(
 
 from app.config import settings  # noqa: E402
 from app.routers import admin, alerts, divergence, forecasts, verification  # noqa: E402
+from app.static import CachedStaticFiles  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,8 @@ async def _seed_initial_data():
     Called as a background task during startup so the server is already
     accepting requests while data is being fetched.
 
-    Each model is ingested independently (no data accumulation in memory).
+    Models are launched concurrently but each is ingested independently
+    (no data accumulation in memory).
     After all models finish, ``recompute_cycle_divergence`` computes
     cross-model metrics in a memory-efficient per-lead-hour loop.
 
@@ -74,8 +76,8 @@ async def _seed_initial_data():
     ecmwf_init_time = _latest_cycle(availability_delay_hours=9)
 
     logger.info("Seeding initial data for models: %s (cycle %s)", models, init_time)
-    n_success = 0
-    for model in models:
+
+    async def _seed_model(model: str) -> bool:
         if model == "AIGFS":
             model_init = aigfs_init_time
         elif model == "ECMWF":
@@ -83,19 +85,22 @@ async def _seed_initial_data():
         else:
             model_init = init_time
         try:
-            data = await ingest_and_process(
-                model,
-                init_time=model_init,
-                force=force,
-            )
-            if data is not None:
-                n_success += 1
-                # Free the returned data immediately — divergence will
-                # re-fetch per-lead-hour later with much lower memory.
-                del data
+            data = await ingest_and_process(model, init_time=model_init, force=force)
+            # Only report success — the returned data is dropped right away
+            # rather than held until every model finishes; divergence
+            # re-fetches per-lead-hour later with much lower memory.
+            return data is not None
         except Exception:
             logger.exception("Seed ingestion failed for %s", model)
-        gc.collect()
+            return False
+        finally:
+            gc.collect()
+
+    # Launch every model at once; ingest_and_process's ingestion lock
+    # serialises the fetches (to bound memory), so the gather only queues
+    # the models behind it in turn.
+    results = await asyncio.gather(*(_seed_model(m) for m in models))
+    n_success = sum(results)
 
     # Compute cross-model divergence for each unique init_time.
     unique_init_times = {init_time, aigfs_init_time, ecmwf_init_time}
@@ -130,10 +135,11 @@ async def lifespan(app: FastAPI):
         settings.seed_data_on_startup,
     )
 
-    # Optionally create all ORM tables on first boot (set DATABASE_AUTO_CREATE=true
-    # in production environments that don't use Alembic migrations).
+    # Optionally create the ORM tables on first boot and apply pending Alembic
+    # migrations on later ones (set DATABASE_AUTO_CREATE=true in production
+    # environments that don't run ``alembic upgrade`` themselves).
     if settings.database_auto_create:
-        from app.database import Base, engine
+        from app.database import engine, migrate_schema
 
         # On managed platforms (e.g. Render) the database may still be
         # starting when the web service boots.  Retry with backoff.
@@ -141,8 +147,8 @@ async def lifespan(app: FastAPI):
             try:
                 logger.info("Attempting DB connection (attempt %d/5)…", attempt + 1)
                 async with engine.begin() as conn:
-                    await conn.run_sync(Base.metadata.create_all)
-                logger.info("Database tables created successfully.")
+                    await conn.run_sync(migrate_schema)
+                logger.info("Database schema is up to date.")
                 break
             except Exception as exc:
                 logger.error(
@@ -157,12 +163,25 @@ async def lifespan(app: FastAPI):
                 )
                 await asyncio.sleep(wait)
 
+    # Open the pool's connections before the first requests arrive.
+    from app.database import warm_pool
+
+    try:
+        await warm_pool()
+    except Exception as exc:
+        logger.warning("Could not pre-warm DB connection pool: %s", exc)
+
     # Start the ingestion scheduler if enabled.
     if settings.scheduler_enabled:
         from app.services.scheduler import scheduler
 
         scheduler.start()
 
+    # Workers for manually triggered ingestion (POST /api/admin/trigger).
+    from app.services.ingest_queue import ingestion_queue
+
+    ingestion_queue.start()
+
     # Kick off data seeding in the background so the app starts serving immediately.
     seed_task = None
     if settings.seed_data_on_startup:
@@ -173,6 +192,12 @@ async def lifespan(app: FastAPI):
     if seed_task and not seed_task.done():
         seed_task.cancel()
 
+    await ingestion_queue.stop()
+
+    from app.services.alerts import close_webhook_client
+
+    await close_webhook_client()
+
     if settings.scheduler_enabled:
         from app.services.scheduler import scheduler
 
@@ -193,6 +218,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# JSON bodies (grid, decomposition, list endpoints) compress well.  Responses
+# that already carry a Content-Encoding, e.g. the precompressed frontend
+# assets, pass through untouched.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 app.include_router(forecasts.router, prefix="/api")
 app.include_router(divergence.router, prefix="/api")
@@ -212,4 +241,8 @@ async def health():
 # ---------------------------------------------------------------------------
 _frontend_dist = Path(__file__).parent.parent / "frontend_dist"
 if _frontend_dist.exists():
-    app.mount("/", StaticFiles(directory=_frontend_dist, html=True), name="frontend")
+    app.mount(
+        "/",
+        CachedStaticFiles(directory=_frontend_dist, html=True),
+        name="frontend",
+    )
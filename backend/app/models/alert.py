@@ -1,7 +1,16 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -31,6 +40,18 @@ class AlertRule(Base):
 
 class AlertEvent(Base):
     __tablename__ = "alert_events"
+    __table_args__ = (
+        # Dashboard poll: unresolved events, newest first.  Partial, so it
+        # only holds the (few) active events.
+        Index(
+            "ix_alert_events_active",
+            text("triggered_at DESC"),
+            postgresql_where=text("resolved = false"),
+            sqlite_where=text("resolved = 0"),
+        ),
+        # Unfiltered event list, newest first
+        Index("ix_alert_events_triggered", text("triggered_at DESC")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
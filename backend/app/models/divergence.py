@@ -1,16 +1,83 @@
+import math
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    Computed,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    and_,
+)
 from sqlalchemy.dialects.postgresql import JSON, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
 from app.database import Base
 
+# Point rows carry a ``geo_bucket`` key naming the 0.5° grid cell they fall
+# in, so a "near (lat, lon)" lookup becomes an equality/IN seek on a
+# (variable, geo_bucket) index instead of two float range scans.
+GEO_BUCKETS_PER_DEGREE = 2
+_GEO_BUCKET_SQL = (
+    f"CAST(floor(lat * {GEO_BUCKETS_PER_DEGREE}) AS INTEGER) * 10000"
+    f" + CAST(floor(lon * {GEO_BUCKETS_PER_DEGREE}) AS INTEGER)"
+)
+
+
+def geo_bucket(lat: float, lon: float) -> int:
+    """Python twin of the ``geo_bucket`` column expression."""
+    return math.floor(lat * GEO_BUCKETS_PER_DEGREE) * 10000 + math.floor(
+        lon * GEO_BUCKETS_PER_DEGREE
+    )
+
+
+def near_buckets(lat: float, lon: float, radius: float = 0.5) -> list[int]:
+    """``geo_bucket`` keys of every cell the ±``radius``° box touches."""
+    lat_cells = range(
+        math.floor((lat - radius) * GEO_BUCKETS_PER_DEGREE),
+        math.floor((lat + radius) * GEO_BUCKETS_PER_DEGREE) + 1,
+    )
+    lon_cells = range(
+        math.floor((lon - radius) * GEO_BUCKETS_PER_DEGREE),
+        math.floor((lon + radius) * GEO_BUCKETS_PER_DEGREE) + 1,
+    )
+    return [i * 10000 + j for i in lat_cells for j in lon_cells]
+
+
+def near(model, lat: float, lon: float, radius: float = 0.5):
+    """Filter ``model`` rows to the ±``radius``° box around (lat, lon).
+
+    The ``geo_bucket IN (...)`` term lets the index narrow the scan; the
+    ``between`` terms keep the box exact.
+    """
+    return and_(
+        model.geo_bucket.in_(near_buckets(lat, lon, radius)),
+        model.lat.between(lat - radius, lat + radius),
+        model.lon.between(lon - radius, lon + radius),
+    )
+
 
 class PointMetric(Base):
     __tablename__ = "point_metrics"
+    __table_args__ = (
+        # Point/regional lookups: variable + lead_hour equality, newest first
+        Index(
+            "ix_pm_var_lead_created",
+            "variable",
+            "lead_hour",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
+        ),
+        # near() lookups within a variable
+        Index("ix_pm_var_geo_bucket", "variable", "geo_bucket"),
+        # Spread history: created_at range scan within a variable
+        Index("ix_pm_var_created", "variable", "created_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
@@ -21,10 +88,13 @@ class PointMetric(Base):
     run_b_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("model_runs.id"), index=True
     )
-    variable: Mapped[str] = mapped_column(String(32), index=True)
+    variable: Mapped[str] = mapped_column(String(32))
     lat: Mapped[float] = mapped_column(Float)
     lon: Mapped[float] = mapped_column(Float)
-    lead_hour: Mapped[int] = mapped_column(Integer, index=True)
+    geo_bucket: Mapped[int] = mapped_column(
+        Integer, Computed(_GEO_BUCKET_SQL, persisted=True)
+    )
+    lead_hour: Mapped[int] = mapped_column(Integer)
     rmse: Mapped[float] = mapped_column(Float)
     bias: Mapped[float] = mapped_column(Float)
     spread: Mapped[float] = mapped_column(Float)
@@ -46,6 +116,8 @@ class ModelPointValue(Base):
             "lead_hour",
             name="uq_mpv_run_var_loc_fhr",
         ),
+        # near() lookups within a variable
+        Index("ix_mpv_var_geo_bucket", "variable", "geo_bucket"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -57,6 +129,9 @@ class ModelPointValue(Base):
     variable: Mapped[str] = mapped_column(String(32), index=True)
     lat: Mapped[float] = mapped_column(Float)
     lon: Mapped[float] = mapped_column(Float)
+    geo_bucket: Mapped[int] = mapped_column(
+        Integer, Computed(_GEO_BUCKET_SQL, persisted=True)
+    )
     lead_hour: Mapped[int] = mapped_column(Integer, index=True)
     value: Mapped[float] = mapped_column(Float)
     created_at: Mapped[datetime] = mapped_column(
@@ -1,9 +1,10 @@
 import enum
+import struct
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, String
-from sqlalchemy.dialects.postgresql import ARRAY, INTEGER, UUID
+from sqlalchemy import DateTime, Enum, LargeBinary, String, TypeDecorator
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -16,6 +17,28 @@ class RunStatus(str, enum.Enum):
     error = "error"
 
 
+class PackedInt16List(TypeDecorator):
+    """A ``list[int]`` stored as packed big-endian int16 bytes.
+
+    Two bytes per element instead of a Postgres ``integer[]`` (4 bytes each
+    plus array header), and no array codec on the driver side.  Lead hours
+    never exceed 384, well inside int16.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return struct.pack(f">{len(value)}h", *value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return list(struct.unpack(f">{len(value) // 2}h", value))
+
+
 class ModelRun(Base):
     __tablename__ = "model_runs"
 
@@ -24,7 +47,7 @@ class ModelRun(Base):
     )
     model_name: Mapped[str] = mapped_column(String(16), index=True)
     init_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
-    forecast_hours: Mapped[list[int]] = mapped_column(ARRAY(INTEGER))
+    forecast_hours: Mapped[list[int]] = mapped_column(PackedInt16List)
     status: Mapped[RunStatus] = mapped_column(
         Enum(RunStatus), default=RunStatus.pending
     )
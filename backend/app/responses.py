@@ -0,0 +1,105 @@
+"""Fast JSON responses for list endpoints, plus a small response cache."""
+
+import time
+from collections.abc import AsyncIterator, Hashable, Iterable
+
+import orjson
+from fastapi import Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncResult
+
+# Rows encoded per chunk by stream_rows_response.
+_STREAM_ROWS = 500
+
+
+def json_response(content: object) -> Response:
+    """Serialize plain dicts/lists with orjson for routes without a
+    ``response_model`` (those get Pydantic's fast JSON path already)."""
+    return Response(
+        content=orjson.dumps(
+            content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        ),
+        media_type="application/json",
+    )
+
+
+def orm_list_response(rows: Iterable[object], schema: type[BaseModel]) -> Response:
+    """Serialize ORM rows straight to JSON with orjson.
+
+    Reads only ``schema``'s field names off each row, so the payload has the
+    same shape as ``list[schema]`` but skips per-row Pydantic validation.
+    Returning a ``Response`` also bypasses the route's ``response_model``,
+    which can stay on the decorator for the OpenAPI docs.
+    """
+    fields = tuple(schema.model_fields)
+    content = orjson.dumps(
+        [{f: getattr(row, f) for f in fields} for row in rows],
+        option=orjson.OPT_UTC_Z,
+    )
+    return Response(content=content, media_type="application/json")
+
+
+def stream_rows_response(result: AsyncResult) -> StreamingResponse:
+    """Stream a streamed (``db.stream(...)``) column result as a JSON array.
+
+    Each row becomes an object keyed by its column labels.  Rows are fetched
+    and encoded ``_STREAM_ROWS`` at a time, so neither the row list nor the
+    full body is held in memory.  The session stays open until the body is
+    sent because ``get_db`` is a ``yield`` dependency, whose exit code
+    FastAPI >= 0.118 runs only after the response finishes (hence the
+    version floor in pyproject.toml).
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        yield b"["
+        first = True
+        async for partition in result.partitions(_STREAM_ROWS):
+            chunk = orjson.dumps(
+                [dict(row._mapping) for row in partition], option=orjson.OPT_UTC_Z
+            )
+            yield chunk[1:-1] if first else b"," + chunk[1:-1]
+            first = False
+        yield b"]"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+# Every ResponseCache, so ingestion and admin deletes can drop them all.
+_response_caches: list["ResponseCache"] = []
+
+
+class ResponseCache:
+    """Per-process TTL cache of JSON response bodies keyed by query params.
+
+    Holds at most ``max_entries`` bodies; the oldest entry is evicted first.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 128) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, tuple[float, bytes]] = {}
+        _response_caches.append(self)
+
+    def get(self, key: Hashable) -> Response | None:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return Response(content=entry[1], media_type="application/json")
+
+    def put(self, key: Hashable, response: Response) -> Response:
+        if self.ttl > 0:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic(), response.body)
+        return response
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def clear_response_caches() -> None:
+    """Drop every cached response body (call after the data changes)."""
+    for cache in _response_caches:
+        cache.clear()
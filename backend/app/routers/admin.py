@@ -1,17 +1,25 @@
 """Admin endpoints for manual triggering of ingestion and processing."""
 
+import asyncio
 import logging
+import os
 import shutil
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import async_session
+from app.database import get_db
 from app.models import GridSnapshot, ModelPointValue, ModelRun, PointMetric
-from app.services.scheduler import _latest_cycle
+from app.responses import clear_response_caches
+from app.services.ingest_queue import ingestion_queue
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +27,13 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 
 VALID_MODELS = {"GFS", "NAM", "ECMWF", "HRRR", "AIGFS", "RRFS"}
 
+# (monotonic timestamp, count) of the last Zarr directory walk.
+_zarr_count_cache: tuple[float, int] | None = None
+_ZARR_COUNT_TTL_SECONDS = 5.0
+
+# Threads used to unlink GRIB cache files in parallel.
+_PURGE_WORKERS = 16
+
 
 class TriggerRequest(BaseModel):
     model: str
@@ -33,13 +48,42 @@ class TriggerResponse(BaseModel):
     message: str
 
 
-async def _run_ingestion(model: str, init_time: datetime, force: bool = False):
-    from app.services.scheduler import ingest_and_process, recompute_cycle_divergence
+def _count_zarr_stores(root: Path) -> int:
+    """Count ``*.zarr`` stores beneath *root* without descending into them.
 
-    logger.info("Manual trigger: %s %s (force=%s)", model, init_time, force)
-    await ingest_and_process(model, init_time, force=force)
-    # Recompute divergence with whatever models are available for this cycle
-    await recompute_cycle_divergence(init_time)
+    Uses an explicit ``os.scandir`` stack instead of ``Path.rglob`` so no
+    Path objects are built per entry, and skips the (many) chunk files
+    inside each store.
+    """
+    count = 0
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.endswith(".zarr"):
+                        count += 1
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except FileNotFoundError:
+            continue
+    return count
+
+
+def _cached_zarr_count() -> int:
+    """Return the on-disk Zarr store count, re-walking at most every few seconds."""
+    global _zarr_count_cache
+    now = time.monotonic()
+    if _zarr_count_cache and now - _zarr_count_cache[0] < _ZARR_COUNT_TTL_SECONDS:
+        return _zarr_count_cache[1]
+    count = _count_zarr_stores(settings.data_store_path / "divergence")
+    _zarr_count_cache = (now, count)
+    return count
+
+
+def _invalidate_zarr_count():
+    global _zarr_count_cache
+    _zarr_count_cache = None
 
 
 # ---------------------------------------------------------------------------
@@ -47,33 +91,90 @@ async def _run_ingestion(model: str, init_time: datetime, force: bool = False):
 # ---------------------------------------------------------------------------
 
 
+async def _exact_counts(db, with_metrics: bool = True) -> tuple[int, ...]:
+    """Exact counts of runs and snapshots, plus point metrics if asked.
+
+    All of them come from one statement: SELECT (SELECT count(*) …), (…).
+    """
+    counts = [
+        select(func.count()).select_from(ModelRun).scalar_subquery(),
+        select(func.count()).select_from(GridSnapshot).scalar_subquery(),
+    ]
+    if with_metrics:
+        counts.append(select(func.count()).select_from(PointMetric).scalar_subquery())
+    return tuple((await db.execute(select(*counts))).one())
+
+
+async def _estimated_metric_count(db) -> int | None:
+    """Row-count estimate for ``point_metrics`` from the planner statistics.
+
+    Reads ``pg_class.reltuples`` without touching the table itself.  Only
+    the large metrics table is estimated: runs and snapshots are small
+    enough to count exactly, and their counts must reflect the clear and
+    purge endpoints straight away rather than after the next ANALYZE.
+    Returns ``None`` on other dialects, or when the table has never been
+    analysed (``reltuples = -1``), so the caller can fall back to COUNT(*).
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = await db.scalar(
+        text(
+            "SELECT reltuples::bigint FROM pg_class "
+            "WHERE relkind = 'r' AND relname = :name"
+        ),
+        {"name": PointMetric.__tablename__},
+    )
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
+
+
 @router.get("/status", summary="Current state of runs, metrics, and snapshots")
-async def get_status():
-    async with async_session() as db:
-        run_count = (await db.execute(select(func.count(ModelRun.id)))).scalar()
-        metric_count = (await db.execute(select(func.count(PointMetric.id)))).scalar()
-        snapshot_count = (
-            await db.execute(select(func.count(GridSnapshot.id)))
-        ).scalar()
-
-        runs = (
-            (
-                await db.execute(
-                    select(ModelRun).order_by(ModelRun.created_at.desc()).limit(10)
-                )
+async def get_status(
+    exact: bool = Query(
+        False, description="Count point_metrics exactly instead of estimating"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Counts of runs, metrics, snapshots and Zarr stores plus the 10 latest runs.
+
+    Runs and snapshots are always counted exactly.  On PostgreSQL the
+    point_metrics count is a planner estimate by default (cheap, no table
+    scan); pass ``exact=true`` to count it too.
+    """
+    # The Zarr walk is independent of the DB queries; run it in a thread
+    # alongside them so the endpoint takes max(db, fs) rather than the sum.
+    zarr_task = asyncio.create_task(asyncio.to_thread(_cached_zarr_count))
+
+    metric_count = None if exact else await _estimated_metric_count(db)
+    estimated = metric_count is not None
+    if estimated:
+        run_count, snapshot_count = await _exact_counts(db, with_metrics=False)
+    else:
+        run_count, snapshot_count, metric_count = await _exact_counts(db)
+
+    # Plain column rows: no ORM identity-map bookkeeping for a read-only list.
+    runs = (
+        await db.execute(
+            select(
+                ModelRun.model_name,
+                ModelRun.init_time,
+                ModelRun.forecast_hours,
+                ModelRun.status,
             )
-            .scalars()
-            .all()
+            .order_by(ModelRun.created_at.desc())
+            .limit(10)
         )
+    ).all()
 
-    zarr_dir = settings.data_store_path / "divergence"
-    zarr_files = list(zarr_dir.rglob("*.zarr")) if zarr_dir.exists() else []
+    zarr_count = await zarr_task
 
     return {
         "runs": run_count,
         "point_metrics": metric_count,
         "grid_snapshots": snapshot_count,
-        "zarr_files_on_disk": len(zarr_files),
+        "zarr_files_on_disk": zarr_count,
+        "counts_estimated": estimated,
         "recent_runs": [
             {
                 "model": r.model_name,
@@ -92,12 +193,16 @@ async def get_status():
 
 
 @router.post("/trigger", response_model=TriggerResponse)
-async def trigger_ingestion(req: TriggerRequest, background_tasks: BackgroundTasks):
+async def trigger_ingestion(req: TriggerRequest):
     """Manually trigger ingestion + divergence computation for a model.
 
-    Runs in the background. Poll GET /api/runs or GET /api/admin/status for progress.
-    If init_time is omitted, uses the most recent 6-hour cycle.
+    The job goes on the bounded ingestion queue and runs on a background
+    worker; a full queue returns 429.  Poll GET /api/runs or
+    GET /api/admin/status for progress.  If init_time is omitted, uses the
+    most recent 6-hour cycle.
     """
+    from app.services.scheduler import _latest_cycle
+
     model = req.model.upper()
     if model not in VALID_MODELS:
         raise HTTPException(400, f"model must be one of {sorted(VALID_MODELS)}")
@@ -111,7 +216,8 @@ async def trigger_ingestion(req: TriggerRequest, background_tasks: BackgroundTas
         init_time = _latest_cycle(availability_delay_hours=9)
     else:
         init_time = _latest_cycle()
-    background_tasks.add_task(_run_ingestion, model, init_time, req.force)
+    if not ingestion_queue.submit(model, init_time, req.force):
+        raise HTTPException(429, "Ingestion queue is full; try again later")
 
     return TriggerResponse(
         model=model,
@@ -129,70 +235,137 @@ async def trigger_ingestion(req: TriggerRequest, background_tasks: BackgroundTas
 # ---------------------------------------------------------------------------
 
 
+def _delete_all(model):
+    """``DELETE FROM <table>`` without SQLAlchemy's session-synchronisation
+    pass; the request session holds no objects of these types to update."""
+    return delete(model).execution_options(synchronize_session=False)
+
+
 @router.delete("/runs", summary="Delete all model run records")
-async def clear_runs():
-    async with async_session() as db:
-        await db.execute(delete(ModelPointValue))
-        result = await db.execute(delete(ModelRun))
-        await db.commit()
+async def clear_runs(db: AsyncSession = Depends(get_db)):
+    await db.execute(_delete_all(ModelPointValue))
+    result = await db.execute(_delete_all(ModelRun))
+    await db.commit()
+    clear_response_caches()
     return {"deleted_runs": result.rowcount}
 
 
 @router.delete("/metrics", summary="Delete all point metric records")
-async def clear_metrics():
-    async with async_session() as db:
-        result = await db.execute(delete(PointMetric))
-        await db.commit()
+async def clear_metrics(db: AsyncSession = Depends(get_db)):
+    result = await db.execute(_delete_all(PointMetric))
+    await db.commit()
+    clear_response_caches()
     return {"deleted_metrics": result.rowcount}
 
 
-@router.delete(
-    "/snapshots",
-    summary="Delete grid snapshot records and Zarr files on disk",
-)
-async def clear_snapshots():
-    async with async_session() as db:
-        result = await db.execute(delete(GridSnapshot))
-        await db.commit()
+def _clear_zarr_dir() -> None:
+    """Remove and recreate the divergence Zarr directory.
 
+    Also drops the regrid cache, whose fields feed those grids.
+    """
     zarr_dir = settings.data_store_path / "divergence"
     if zarr_dir.exists():
         shutil.rmtree(zarr_dir)
         zarr_dir.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(settings.data_store_path / "regrid", ignore_errors=True)
+    _invalidate_zarr_count()
+
+
+def _iter_grib_cache(root: Path) -> Iterator[str]:
+    """Yield paths of herbie ``subset_*.grib2`` files anywhere under *root*."""
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.startswith("subset_") and entry.name.endswith(
+                        ".grib2"
+                    ):
+                        yield entry.path
+        except FileNotFoundError:
+            continue
+
+
+def _unlink(path: str) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _purge_grib_cache() -> int:
+    """Delete cached herbie ``subset_*.grib2`` files; returns how many.
+
+    Unlinks are spread over a small thread pool — each one is a blocking
+    syscall that releases the GIL, so disk latency overlaps.
+    """
+    with ThreadPoolExecutor(max_workers=_PURGE_WORKERS) as pool:
+        return sum(pool.map(_unlink, _iter_grib_cache(settings.data_store_path)))
+
+
+@router.delete(
+    "/snapshots",
+    summary="Delete grid snapshot records and Zarr files on disk",
+)
+async def clear_snapshots(db: AsyncSession = Depends(get_db)):
+    result = await db.execute(_delete_all(GridSnapshot))
+    await db.commit()
+    clear_response_caches()
+
+    await asyncio.to_thread(_clear_zarr_dir)
 
     return {"deleted_snapshots": result.rowcount, "zarr_dir_cleared": True}
 
 
 @router.delete("/cache", summary="Delete cached herbie GRIB subset files")
 async def clear_cache():
-    deleted = 0
-    for f in settings.data_store_path.rglob("subset_*.grib2"):
-        f.unlink()
-        deleted += 1
+    deleted = await asyncio.to_thread(_purge_grib_cache)
     return {"deleted_cache_files": deleted}
 
 
+async def _reset_tables(db: AsyncSession) -> tuple[int, int, int]:
+    """Empty all ingestion/divergence tables in one transaction.
+
+    Returns the (runs, metrics, snapshots) row counts that were removed.
+    PostgreSQL uses a single ``TRUNCATE`` (O(1), no per-row WAL) after
+    recording the counts; other dialects fall back to per-table DELETEs.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        runs, snapshots, metrics = await _exact_counts(db)
+        tables = ", ".join(
+            m.__tablename__
+            for m in (ModelPointValue, PointMetric, GridSnapshot, ModelRun)
+        )
+        await db.execute(text(f"TRUNCATE {tables}"))
+    else:
+        await db.execute(_delete_all(ModelPointValue))
+        metrics = (await db.execute(_delete_all(PointMetric))).rowcount
+        snapshots = (await db.execute(_delete_all(GridSnapshot))).rowcount
+        runs = (await db.execute(_delete_all(ModelRun))).rowcount
+    await db.commit()
+    clear_response_caches()
+    return runs, metrics, snapshots
+
+
 @router.delete(
     "/reset",
     summary="Full reset: clear all DB records, Zarr files, and GRIB cache",
 )
-async def reset_all():
-    async with async_session() as db:
-        await db.execute(delete(ModelPointValue))
-        metrics = (await db.execute(delete(PointMetric))).rowcount
-        snapshots = (await db.execute(delete(GridSnapshot))).rowcount
-        runs = (await db.execute(delete(ModelRun))).rowcount
-        await db.commit()
-
-    zarr_dir = settings.data_store_path / "divergence"
-    if zarr_dir.exists():
-        shutil.rmtree(zarr_dir)
-        zarr_dir.mkdir(parents=True, exist_ok=True)
-
-    cache_deleted = 0
-    for f in settings.data_store_path.rglob("subset_*.grib2"):
-        f.unlink()
-        cache_deleted += 1
+async def reset_all(db: AsyncSession = Depends(get_db)):
+    def _wipe_fs() -> int:
+        # The GRIB cache walk covers the whole data store, so run it after
+        # the Zarr tree is gone rather than racing the rmtree.
+        _clear_zarr_dir()
+        return _purge_grib_cache()
+
+    # The database reset and the filesystem wipe are independent, so overlap
+    # them instead of running them back to back.
+    (runs, metrics, snapshots), cache_deleted = await asyncio.gather(
+        _reset_tables(db), asyncio.to_thread(_wipe_fs)
+    )
 
     return {
         "deleted_runs": runs,
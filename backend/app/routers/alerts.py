@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.models.alert import AlertEvent, AlertRule
+from app.responses import orm_list_response
 from app.schemas.alert import (
     AlertEventOut,
     AlertRuleCreate,
@@ -27,7 +28,7 @@ router = APIRouter(prefix="/alerts", tags=["alerts"])
 @router.get("/rules", response_model=list[AlertRuleOut])
 async def list_rules(db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(AlertRule).order_by(AlertRule.created_at.desc()))
-    return result.scalars().all()
+    return orm_list_response(result.scalars().all(), AlertRuleOut)
 
 
 @router.post("/rules", response_model=AlertRuleOut, status_code=201)
@@ -86,7 +87,7 @@ async def list_events(
     if active_only:
         stmt = stmt.where(AlertEvent.resolved == False)  # noqa: E712
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return orm_list_response(result.scalars().all(), AlertEventOut)
 
 
 @router.post("/events/{event_id}/resolve", response_model=AlertEventOut)
@@ -1,11 +1,23 @@
+import asyncio
+import base64
+import functools
+import os
+from collections.abc import Iterator
 from datetime import datetime, timedelta, timezone
+from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
 from app.models import GridSnapshot, ModelPointValue, ModelRun, PointMetric
+from app.models.divergence import near, near_buckets
+from app.responses import ResponseCache, json_response, orm_list_response
 from app.schemas.divergence import (
     DivergenceSummary,
     GridDivergenceData,
@@ -13,12 +25,103 @@ from app.schemas.divergence import (
     ModelPointValueOut,
     PointMetricOut,
     SpreadHistoryOut,
-    SpreadHistoryPoint,
 )
-from app.services.processing.grid import load_divergence_zarr
 
 router = APIRouter(prefix="/divergence", tags=["divergence"])
 
+# Summary and snapshot lists only change when ingestion runs.
+_summary_cache = ResponseCache(ttl=settings.response_cache_ttl_seconds)
+_snapshots_cache = ResponseCache(ttl=settings.response_cache_ttl_seconds)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_grid(zarr_path: str, mtime_ns: int, inode: int):
+    from app.services.processing.grid import load_divergence_zarr as _load
+
+    return _load(zarr_path).load()
+
+
+def load_divergence_zarr(zarr_path: str):
+    """Load a stored divergence grid into memory.
+
+    Imports the processing module (xarray/zarr) on first use rather than
+    when the router loads, so workers that never serve /grid skip it.
+    Loaded grids are kept in an LRU keyed by path and the store's
+    mtime/inode: recomputing a cycle rewrites the same path, which changes
+    the key.
+    """
+    st = os.stat(zarr_path)
+    return _load_grid(zarr_path, st.st_mtime_ns, st.st_ino)
+
+
+# Grid rows serialized per chunk when streaming /grid as JSON.
+_GRID_STREAM_ROWS = 64
+
+# Code reserved for NaN cells in uint16-quantized grids.
+_UINT16_NODATA = 65535
+
+
+def _quantize_uint16(values: np.ndarray) -> dict:
+    """Pack a 2D float grid into base64 little-endian uint16 codes.
+
+    Valid cells map linearly onto 0–65534 (``value ≈ offset + code * scale``);
+    NaN cells get ``nodata``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.isfinite(values)
+    if valid.any():
+        vmin = float(values[valid].min())
+        vmax = float(values[valid].max())
+    else:
+        vmin = vmax = 0.0
+    scale = (vmax - vmin) / (_UINT16_NODATA - 1)
+
+    codes = np.full(values.shape, _UINT16_NODATA, dtype="<u2")
+    if scale > 0:
+        codes[valid] = np.rint((values[valid] - vmin) / scale)
+    else:
+        codes[valid] = 0
+    return {
+        "dtype": "uint16",
+        "shape": list(values.shape),
+        "scale": scale,
+        "offset": vmin,
+        "nodata": _UINT16_NODATA,
+        "data": base64.b64encode(codes.tobytes()).decode("ascii"),
+    }
+
+
+def _pack_float32(values: np.ndarray) -> dict:
+    """Pack a 2D float grid losslessly as base64 little-endian float32 bytes.
+
+    NaN cells stay NaN in the buffer.
+    """
+    values = np.ascontiguousarray(values, dtype="<f4")
+    return {
+        "dtype": "float32",
+        "shape": list(values.shape),
+        "data": base64.b64encode(values.tobytes()).decode("ascii"),
+    }
+
+
+def _stream_grid_json(header: dict, values: np.ndarray) -> Iterator[bytes]:
+    """Yield ``header`` plus a float32 ``values`` array as one JSON object.
+
+    Rows are encoded ``_GRID_STREAM_ROWS`` at a time, so only one block's
+    worth of JSON is held in memory instead of the whole body.
+    """
+    head = orjson.dumps(header, option=orjson.OPT_SERIALIZE_NUMPY)
+    yield head[:-1] + (b',"values":[' if len(head) > 2 else b'"values":[')
+    for start in range(0, values.shape[0], _GRID_STREAM_ROWS):
+        block = np.ascontiguousarray(
+            values[start : start + _GRID_STREAM_ROWS], dtype=np.float32
+        )
+        if start:
+            yield b","
+        # Drop the block's enclosing brackets so rows splice into one array.
+        yield orjson.dumps(block, option=orjson.OPT_SERIALIZE_NUMPY)[1:-1]
+    yield b"]}"
+
 
 @router.get("/point", response_model=list[PointMetricOut])
 async def get_point_divergence(
@@ -37,8 +140,7 @@ async def get_point_divergence(
     )
     # Filter by approximate location (within ~0.5 degrees)
     stmt = stmt.where(
-        PointMetric.lat.between(lat - 0.5, lat + 0.5),
-        PointMetric.lon.between(lon - 0.5, lon + 0.5),
+        near(PointMetric, lat, lon),
     )
     if lead_hour is not None:
         stmt = stmt.where(PointMetric.lead_hour == lead_hour)
@@ -54,43 +156,51 @@ async def get_spread_history(
     lon: float | None = Query(None),
     db: AsyncSession = Depends(get_db),
 ):
-    """Return time-bucketed mean spread for sparkline display."""
-    from collections import defaultdict
+    """Return time-bucketed mean spread for sparkline display.
+
+    Rows are grouped per hour and averaged in the database, so only one row
+    per bucket comes back.  Postgres buckets with ``date_trunc`` on the UTC
+    wall-clock time (so the session time zone can't shift the buckets);
+    other dialects (SQLite in tests) with ``strftime``.
+    """
+    from sqlalchemy import func
 
     cutoff = datetime.now(tz=timezone.utc) - timedelta(hours=hours_back)
 
+    is_postgres = db.get_bind().dialect.name == "postgresql"
+    if is_postgres:
+        # timezone('UTC', ts) is ``ts AT TIME ZONE 'UTC'``: a naive UTC time
+        bucket = func.date_trunc("hour", func.timezone("UTC", PointMetric.created_at))
+    else:
+        bucket = func.strftime("%Y-%m-%dT%H:00:00", PointMetric.created_at)
+    bucket = bucket.label("h")
+
     stmt = (
-        select(PointMetric.created_at, PointMetric.spread)
+        select(bucket, func.avg(PointMetric.spread).label("m"))
         .where(
             PointMetric.variable == variable,
             PointMetric.created_at >= cutoff,
         )
-        .order_by(PointMetric.created_at.asc())
+        .group_by(bucket)
+        .order_by(bucket)
     )
     if lat is not None and lon is not None:
         stmt = stmt.where(
-            PointMetric.lat.between(lat - 0.5, lat + 0.5),
-            PointMetric.lon.between(lon - 0.5, lon + 0.5),
+            near(PointMetric, lat, lon),
         )
 
     result = await db.execute(stmt)
-    rows = result.all()
-
-    # Bucket by hour in Python (dialect-neutral)
-    buckets: dict[str, list[float]] = defaultdict(list)
-    for row in rows:
-        hour_key = row.created_at.strftime("%Y-%m-%dT%H:00:00")
-        buckets[hour_key].append(float(row.spread))
-
     points = [
-        SpreadHistoryPoint(
-            timestamp=ts,
-            mean_spread=round(sum(vals) / len(vals), 4),
-        )
-        for ts, vals in sorted(buckets.items())
+        {
+            "timestamp": (
+                row.h.strftime("%Y-%m-%dT%H:00:00") if is_postgres else row.h
+            ),
+            "mean_spread": round(float(row.m), 4),
+        }
+        for row in result.all()
     ]
 
-    return SpreadHistoryOut(variable=variable, points=points)
+    return json_response({"variable": variable, "points": points})
 
 
 @router.get("/grid", response_model=GridDivergenceData)
@@ -98,6 +208,12 @@ async def get_grid_divergence(
     variable: str = Query(...),
     lead_hour: int = Query(0),
     init_time: datetime | None = Query(None),
+    encoding: Literal["json", "uint16", "float32"] = Query(
+        "json",
+        description="'uint16' sends values quantized to base64 uint16 codes "
+        "with a scale/offset instead of a nested float array; 'float32' "
+        "sends the raw base64 float32 buffer (NaN for missing cells).",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     stmt = (
@@ -117,15 +233,29 @@ async def get_grid_divergence(
     if not snapshot:
         raise HTTPException(404, "No grid divergence data found")
 
-    da = load_divergence_zarr(snapshot.zarr_path)
-    return GridDivergenceData(
-        variable=snapshot.variable,
-        lead_hour=snapshot.lead_hour,
-        init_time=snapshot.init_time.isoformat(),
-        latitudes=da.coords["latitude"].values.tolist(),
-        longitudes=da.coords["longitude"].values.tolist(),
-        values=da.values.tolist(),
-        bbox=snapshot.bbox,
+    # Disk reads on a cache miss run off the event loop
+    da = await asyncio.to_thread(load_divergence_zarr, snapshot.zarr_path)
+    # Serialize the arrays straight from numpy with orjson instead of building
+    # nested Python lists and validating them through GridDivergenceData; the
+    # grid is the largest payload we serve.  NaN cells are emitted as null.
+    header = {
+        "variable": snapshot.variable,
+        "lead_hour": snapshot.lead_hour,
+        "init_time": snapshot.init_time.isoformat(),
+        "latitudes": np.ascontiguousarray(da.coords["latitude"].values),
+        "longitudes": np.ascontiguousarray(da.coords["longitude"].values),
+        "bbox": snapshot.bbox,
+    }
+    if encoding != "json":
+        pack = _quantize_uint16 if encoding == "uint16" else _pack_float32
+        content = orjson.dumps(
+            {**header, "values": pack(da.values)},
+            option=orjson.OPT_SERIALIZE_NUMPY,
+        )
+        return Response(content=content, media_type="application/json")
+
+    return StreamingResponse(
+        _stream_grid_json(header, da.values), media_type="application/json"
     )
 
 
@@ -135,11 +265,17 @@ async def list_grid_snapshots(
     limit: int = Query(20, le=100),
     db: AsyncSession = Depends(get_db),
 ):
+    cache_key = (variable, limit)
+    if (cached := _snapshots_cache.get(cache_key)) is not None:
+        return cached
+
     stmt = select(GridSnapshot).order_by(GridSnapshot.init_time.desc()).limit(limit)
     if variable:
         stmt = stmt.where(GridSnapshot.variable == variable)
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return _snapshots_cache.put(
+        cache_key, orm_list_response(result.scalars().all(), GridSnapshotOut)
+    )
 
 
 @router.get("/summary", response_model=list[DivergenceSummary])
@@ -150,41 +286,86 @@ async def get_divergence_summary(
 ):
     """Return latest divergence summary per variable for the dashboard.
 
-    Filters to lead hours 0–48 and optionally by location (lat/lon).
+    Filters to lead hours 0–48 and optionally by location (lat/lon).  All
+    variables are aggregated in one grouped query; PostgreSQL computes the
+    median with ``percentile_cont``, other dialects (SQLite in tests) fetch
+    the spreads in that same single query and aggregate in Python.  Bodies
+    are cached per (lat, lon) for ``response_cache_ttl_seconds``.
     """
+    from collections import defaultdict
     from statistics import median
 
+    from sqlalchemy import func
+
+    cache_key = (lat, lon)
+    if (cached := _summary_cache.get(cache_key)) is not None:
+        return cached
+
     variables = ["precip", "wind_speed", "mslp", "hgt_500"]
-    summaries = []
+    filters = [PointMetric.variable.in_(variables), PointMetric.lead_hour <= 48]
+    if lat is not None and lon is not None:
+        filters.append(near(PointMetric, lat, lon))
 
-    for var in variables:
-        stmt = select(PointMetric.spread).where(
-            PointMetric.variable == var,
-            PointMetric.lead_hour <= 48,
-        )
-        if lat is not None and lon is not None:
-            stmt = stmt.where(
-                PointMetric.lat.between(lat - 0.5, lat + 0.5),
-                PointMetric.lon.between(lon - 0.5, lon + 0.5),
+    stats: dict[str, tuple[float, float, float, float, int]] = {}
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = (
+            select(
+                PointMetric.variable,
+                func.avg(PointMetric.spread).label("mean_spread"),
+                func.percentile_cont(0.5)
+                .within_group(PointMetric.spread)
+                .label("median_spread"),
+                func.max(PointMetric.spread).label("max_spread"),
+                func.min(PointMetric.spread).label("min_spread"),
+                func.count().label("num_points"),
             )
+            .where(*filters)
+            .group_by(PointMetric.variable)
+        )
         result = await db.execute(stmt)
-        spreads = [float(row.spread) for row in result.all()]
-
-        if spreads:
-            summaries.append(
-                DivergenceSummary(
-                    variable=var,
-                    mean_spread=round(sum(spreads) / len(spreads), 4),
-                    median_spread=round(median(spreads), 4),
-                    max_spread=round(max(spreads), 4),
-                    min_spread=round(min(spreads), 4),
-                    num_points=len(spreads),
-                    models_compared=["GFS", "NAM", "ECMWF", "HRRR"],
-                    init_time="latest",
-                )
+        for row in result.all():
+            stats[row.variable] = (
+                float(row.mean_spread),
+                float(row.median_spread),
+                float(row.max_spread),
+                float(row.min_spread),
+                row.num_points,
+            )
+    else:
+        result = await db.execute(
+            select(PointMetric.variable, PointMetric.spread).where(*filters)
+        )
+        by_var: dict[str, list[float]] = defaultdict(list)
+        for row in result.all():
+            by_var[row.variable].append(row.spread)
+        for var, spreads in by_var.items():
+            stats[var] = (
+                sum(spreads) / len(spreads),
+                median(spreads),
+                max(spreads),
+                min(spreads),
+                len(spreads),
             )
 
-    return summaries
+    summaries = []
+    for var in variables:
+        if var not in stats:
+            continue
+        mean_spread, median_spread, max_spread, min_spread, num_points = stats[var]
+        summaries.append(
+            {
+                "variable": var,
+                "mean_spread": round(mean_spread, 4),
+                "median_spread": round(median_spread, 4),
+                "max_spread": round(max_spread, 4),
+                "min_spread": round(min_spread, 4),
+                "num_points": num_points,
+                "models_compared": ["GFS", "NAM", "ECMWF", "HRRR"],
+                "init_time": "latest",
+            }
+        )
+
+    return _summary_cache.put(cache_key, json_response(summaries))
 
 
 @router.get("/regional")
@@ -194,35 +375,103 @@ async def get_regional_divergence(
     db: AsyncSession = Depends(get_db),
 ):
     """Return latest spread/rmse/bias at each monitor point
-    for regional map coloring."""
-    from app.config import settings
+    for regional map coloring.
+
+    All monitor points are resolved in one query.  Each point is expanded to
+    the ``geo_bucket`` cells its ±0.5° box touches and inner-joined to
+    ``point_metrics`` by bucket equality (plus the exact box);
+    ``row_number()`` keeps the newest metric per point.  Ranking only matched
+    rows keeps the result independent of the backend's NULL ordering.  The
+    winners are then outer-joined to one row per point, so points with no
+    metrics still appear.
+    """
+    from sqlalchemy import Float, Integer, String, and_, func, literal, union_all
+
+    if not settings.monitor_points:
+        return json_response([])
+
+    monitors = union_all(
+        *(
+            select(
+                literal(idx, Integer).label("idx"),
+                literal(lat, Float).label("lat"),
+                literal(lon, Float).label("lon"),
+                literal(label, String).label("label"),
+            )
+            for idx, (lat, lon, label) in enumerate(settings.monitor_points)
+        )
+    ).subquery("monitors")
+    monitor_buckets = union_all(
+        *(
+            select(
+                literal(idx, Integer).label("idx"),
+                literal(lat, Float).label("lat"),
+                literal(lon, Float).label("lon"),
+                literal(bucket, Integer).label("geo_bucket"),
+            )
+            for idx, (lat, lon, _) in enumerate(settings.monitor_points)
+            for bucket in near_buckets(lat, lon)
+        )
+    ).subquery("monitor_buckets")
 
-    results = []
-    for lat, lon, label in settings.monitor_points:
-        stmt = (
-            select(PointMetric)
-            .where(
+    ranked = (
+        select(
+            monitor_buckets.c.idx,
+            PointMetric.spread,
+            PointMetric.rmse,
+            PointMetric.bias,
+            func.row_number()
+            .over(
+                partition_by=monitor_buckets.c.idx,
+                order_by=PointMetric.created_at.desc(),
+            )
+            .label("rn"),
+        )
+        .select_from(monitor_buckets)
+        .join(
+            PointMetric,
+            and_(
                 PointMetric.variable == variable,
-                PointMetric.lat.between(lat - 0.5, lat + 0.5),
-                PointMetric.lon.between(lon - 0.5, lon + 0.5),
+                PointMetric.geo_bucket == monitor_buckets.c.geo_bucket,
                 PointMetric.lead_hour == lead_hour,
-            )
-            .order_by(PointMetric.created_at.desc())
-            .limit(1)
+                PointMetric.lat.between(
+                    monitor_buckets.c.lat - 0.5, monitor_buckets.c.lat + 0.5
+                ),
+                PointMetric.lon.between(
+                    monitor_buckets.c.lon - 0.5, monitor_buckets.c.lon + 0.5
+                ),
+            ),
         )
-        result = await db.execute(stmt)
-        metric = result.scalar_one_or_none()
-        results.append(
+        .subquery("ranked")
+    )
+    latest = select(ranked).where(ranked.c.rn == 1).subquery("latest")
+
+    result = await db.execute(
+        select(
+            monitors.c.lat,
+            monitors.c.lon,
+            monitors.c.label,
+            latest.c.spread,
+            latest.c.rmse,
+            latest.c.bias,
+        )
+        .select_from(monitors)
+        .outerjoin(latest, latest.c.idx == monitors.c.idx)
+        .order_by(monitors.c.idx)
+    )
+    return json_response(
+        [
             {
-                "lat": lat,
-                "lon": lon,
-                "label": label,
-                "spread": metric.spread if metric else None,
-                "rmse": metric.rmse if metric else None,
-                "bias": metric.bias if metric else None,
+                "lat": row.lat,
+                "lon": row.lon,
+                "label": row.label,
+                "spread": row.spread,
+                "rmse": row.rmse,
+                "bias": row.bias,
             }
-        )
-    return results
+            for row in result.all()
+        ]
+    )
 
 
 @router.get("/model-values", response_model=list[ModelPointValueOut])
@@ -236,27 +485,13 @@ async def get_model_values(
     """Return the latest raw predicted value from each model at a monitor point.
 
     Joins model_point_values → model_runs to include model_name and init_time.
-    Filters to the most recent init_time available for each model.
+    Filters to the most recent init_time available for each model: a
+    ``rank()`` window over each model's runs, newest first, keeps every row
+    of the latest run in one pass over the matching values.
     """
     from sqlalchemy import func
 
-    # Subquery: latest init_time per model at this location
-    latest_subq = (
-        select(
-            ModelRun.model_name,
-            func.max(ModelRun.init_time).label("latest_init"),
-        )
-        .join(ModelPointValue, ModelPointValue.run_id == ModelRun.id)
-        .where(
-            ModelPointValue.lat.between(lat - 0.5, lat + 0.5),
-            ModelPointValue.lon.between(lon - 0.5, lon + 0.5),
-            ModelPointValue.lead_hour == lead_hour,
-        )
-        .group_by(ModelRun.model_name)
-        .subquery()
-    )
-
-    stmt = (
+    ranked = (
         select(
             ModelPointValue.run_id,
             ModelRun.model_name,
@@ -266,38 +501,28 @@ async def get_model_values(
             ModelPointValue.lead_hour,
             ModelPointValue.value,
             ModelRun.init_time,
+            func.rank()
+            .over(
+                partition_by=ModelRun.model_name,
+                order_by=ModelRun.init_time.desc(),
+            )
+            .label("run_rank"),
         )
         .join(ModelRun, ModelPointValue.run_id == ModelRun.id)
-        .join(
-            latest_subq,
-            (ModelRun.model_name == latest_subq.c.model_name)
-            & (ModelRun.init_time == latest_subq.c.latest_init),
-        )
         .where(
-            ModelPointValue.lat.between(lat - 0.5, lat + 0.5),
-            ModelPointValue.lon.between(lon - 0.5, lon + 0.5),
+            near(ModelPointValue, lat, lon),
             ModelPointValue.lead_hour == lead_hour,
         )
+        .subquery()
     )
+
+    # The variable filter applies after ranking, as "latest" is per model
+    stmt = select(ranked).where(ranked.c.run_rank == 1)
     if variable:
-        stmt = stmt.where(ModelPointValue.variable == variable)
+        stmt = stmt.where(ranked.c.variable == variable)
 
     result = await db.execute(stmt)
-    rows = result.all()
-
-    return [
-        ModelPointValueOut(
-            run_id=row.run_id,
-            model_name=row.model_name,
-            variable=row.variable,
-            lat=row.lat,
-            lon=row.lon,
-            lead_hour=row.lead_hour,
-            value=row.value,
-            init_time=row.init_time,
-        )
-        for row in rows
-    ]
+    return orm_list_response(result.all(), ModelPointValueOut)
 
 
 @router.get("/decomposition")
@@ -309,112 +534,85 @@ async def get_decomposition(
     db: AsyncSession = Depends(get_db),
 ):
     """Return per-model-pair RMSE/bias grouped by lead hour
-    for ensemble decomposition."""
-    from collections import defaultdict
+    for ensemble decomposition.
 
-    # Fetch point metrics with their associated model run names
-    stmt = (
+    Of the newest ``limit`` metrics at the point, the database keeps the
+    newest row per (unordered model pair, lead hour) via ``row_number()``;
+    Python only shapes the rows.
+    """
+    from sqlalchemy import case, func
+    from sqlalchemy.orm import aliased
+
+    # Newest point metrics with both model run names
+    run_a = aliased(ModelRun)
+    run_b = aliased(ModelRun)
+    newest = (
         select(
             PointMetric.lead_hour,
             PointMetric.rmse,
             PointMetric.bias,
             PointMetric.spread,
-            ModelRun.model_name.label("model_a_name"),
+            PointMetric.created_at,
+            run_a.model_name.label("model_a_name"),
+            run_b.model_name.label("model_b_name"),
         )
-        .join(ModelRun, PointMetric.run_a_id == ModelRun.id)
+        .join(run_a, PointMetric.run_a_id == run_a.id)
+        .join(run_b, PointMetric.run_b_id == run_b.id)
         .where(
             PointMetric.variable == variable,
-            PointMetric.lat.between(lat - 0.5, lat + 0.5),
-            PointMetric.lon.between(lon - 0.5, lon + 0.5),
+            near(PointMetric, lat, lon),
         )
         .order_by(PointMetric.created_at.desc())
         .limit(limit)
+        .subquery()
     )
-    await db.execute(stmt)
 
-    # Also get model_b names
-    stmt_b = (
-        select(
-            PointMetric.id,
-            ModelRun.model_name.label("model_b_name"),
+    # Unordered pair key (least/greatest, spelled as CASE for SQLite)
+    a_first = newest.c.model_a_name <= newest.c.model_b_name
+    pair_a = case((a_first, newest.c.model_a_name), else_=newest.c.model_b_name)
+    pair_b = case((a_first, newest.c.model_b_name), else_=newest.c.model_a_name)
+    ranked = select(
+        newest.c.lead_hour,
+        newest.c.rmse,
+        newest.c.bias,
+        newest.c.spread,
+        newest.c.created_at,
+        pair_a.label("model_a"),
+        pair_b.label("model_b"),
+        func.row_number()
+        .over(
+            partition_by=(pair_a, pair_b, newest.c.lead_hour),
+            order_by=newest.c.created_at.desc(),
         )
-        .join(ModelRun, PointMetric.run_b_id == ModelRun.id)
-        .where(
-            PointMetric.variable == variable,
-            PointMetric.lat.between(lat - 0.5, lat + 0.5),
-            PointMetric.lon.between(lon - 0.5, lon + 0.5),
-        )
-        .order_by(PointMetric.created_at.desc())
-        .limit(limit)
+        .label("rn"),
+    ).subquery()
+    result = await db.execute(
+        select(ranked)
+        .where(ranked.c.rn == 1)
+        .order_by(ranked.c.lead_hour, ranked.c.created_at.desc())
     )
-    result_b = await db.execute(stmt_b)
-    b_names = {row.id: row.model_b_name for row in result_b.all()}
 
-    # Also get the IDs from a separate query
-    stmt_ids = (
-        select(
-            PointMetric.id,
-            PointMetric.lead_hour,
-            PointMetric.rmse,
-            PointMetric.bias,
-            PointMetric.spread,
-        )
-        .where(
-            PointMetric.variable == variable,
-            PointMetric.lat.between(lat - 0.5, lat + 0.5),
-            PointMetric.lon.between(lon - 0.5, lon + 0.5),
+    by_hour: dict[int, dict] = {}
+    for row in result.all():
+        hour = by_hour.setdefault(row.lead_hour, {"pairs": [], "total_spread": 0.0})
+        # As before, the hour's spread is taken from its last (oldest) pair row
+        hour["total_spread"] = row.spread
+        hour["pairs"].append(
+            {
+                "model_a": row.model_a,
+                "model_b": row.model_b,
+                "rmse": round(row.rmse, 4),
+                "bias": round(row.bias, 4),
+            }
         )
-        .order_by(PointMetric.created_at.desc())
-        .limit(limit)
-    )
-    result_ids = await db.execute(stmt_ids)
-    id_rows = result_ids.all()
 
-    # Build model_a name lookup
-    stmt_a = (
-        select(PointMetric.id, ModelRun.model_name.label("model_a_name"))
-        .join(ModelRun, PointMetric.run_a_id == ModelRun.id)
-        .where(
-            PointMetric.variable == variable,
-            PointMetric.lat.between(lat - 0.5, lat + 0.5),
-            PointMetric.lon.between(lon - 0.5, lon + 0.5),
-        )
-        .order_by(PointMetric.created_at.desc())
-        .limit(limit)
+    return json_response(
+        [
+            {
+                "lead_hour": fhr,
+                "total_spread": round(data["total_spread"], 4),
+                "pairs": data["pairs"],
+            }
+            for fhr, data in by_hour.items()
+        ]
     )
-    result_a = await db.execute(stmt_a)
-    a_names = {row.id: row.model_a_name for row in result_a.all()}
-
-    # Group by lead_hour and model pair
-    by_hour: dict[int, dict] = defaultdict(lambda: {"pairs": {}, "total_spread": 0.0})
-    seen_hours: dict[int, set] = defaultdict(set)
-
-    for row in id_rows:
-        fhr = row.lead_hour
-        model_a = a_names.get(row.id, "?")
-        model_b = b_names.get(row.id, "?")
-        pair_key = (
-            f"{model_a}-{model_b}" if model_a < model_b else f"{model_b}-{model_a}"
-        )
-
-        if pair_key in seen_hours[fhr]:
-            continue
-        seen_hours[fhr].add(pair_key)
-
-        by_hour[fhr]["total_spread"] = row.spread
-        a_name, b_name = pair_key.split("-", 1)
-        by_hour[fhr]["pairs"][pair_key] = {
-            "model_a": a_name,
-            "model_b": b_name,
-            "rmse": round(float(row.rmse), 4),
-            "bias": round(float(row.bias), 4),
-        }
-
-    return [
-        {
-            "lead_hour": fhr,
-            "total_spread": round(float(data["total_spread"]), 4),
-            "pairs": list(data["pairs"].values()),
-        }
-        for fhr, data in sorted(by_hour.items())
-    ]
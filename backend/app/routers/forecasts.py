@@ -1,32 +1,46 @@
+import functools
 import uuid
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.database import get_db
 from app.models import ModelRun, PointMetric
+from app.responses import json_response, stream_rows_response
 from app.schemas.divergence import PointMetricOut
 from app.schemas.forecast import ModelRunOut
-from app.services.ingestion.base import VARIABLES
 
 router = APIRouter(tags=["forecasts"])
 
 
+@functools.cache
+def _variables_body() -> bytes:
+    # Deferred: the ingestion package pulls in xarray.
+    from app.services.ingestion.base import VARIABLES
+
+    return json_response(VARIABLES).body
+
+
+@functools.lru_cache(maxsize=1)
+def _monitor_points_body(points: tuple[tuple[float, float, str], ...]) -> bytes:
+    return json_response(
+        [{"lat": lat, "lon": lon, "label": label} for lat, lon, label in points]
+    ).body
+
+
 @router.get("/variables")
 async def list_variables():
-    return VARIABLES
+    return Response(content=_variables_body(), media_type="application/json")
 
 
 @router.get("/monitor-points", summary="Configured monitoring locations")
 async def list_monitor_points():
     """Return the pre-configured geographic monitoring points."""
-    return [
-        {"lat": lat, "lon": lon, "label": label}
-        for lat, lon, label in settings.monitor_points
-    ]
+    body = _monitor_points_body(tuple(map(tuple, settings.monitor_points)))
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/runs", response_model=list[ModelRunOut])
@@ -51,10 +65,10 @@ async def get_run_metrics(run_id: uuid.UUID, db: AsyncSession = Depends(get_db))
     run = await db.get(ModelRun, run_id)
     if not run:
         raise HTTPException(404, "Run not found")
+    # Unbounded, so stream column rows instead of building ORM objects
     stmt = (
-        select(PointMetric)
+        select(*(getattr(PointMetric, f) for f in PointMetricOut.model_fields))
         .where(or_(PointMetric.run_a_id == run_id, PointMetric.run_b_id == run_id))
         .order_by(PointMetric.variable, PointMetric.lead_hour)
     )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    return stream_rows_response(await db.stream(stmt))
@@ -1,16 +1,153 @@
-from collections import defaultdict
+from datetime import datetime, timezone
 
+import numpy as np
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.database import get_db
 from app.models import ModelPointValue, ModelRun
+from app.models.divergence import near
 from app.schemas.verification import VerificationResponse, VerificationScore
 
 router = APIRouter(prefix="/verification", tags=["verification"])
 
 
+def _epoch_seconds(dt: datetime) -> int:
+    # SQLite hands back naive datetimes for timezone=True columns
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def _score_rows(rows) -> list[tuple[str, int, float, float, int]]:
+    """Match forecasts to analyses and reduce errors per (model, lead_hour).
+
+    Analyses (lead_hour=0) are keyed by (model, point, init_time); a forecast
+    matches the analysis at the same point whose init_time is its valid_time.
+    Matching and the MAE/bias reductions are done on NumPy arrays rather than
+    per-row dicts.  Returns (model, lead_hour, mae, bias, n) sorted by model,
+    lead.
+    """
+    n = len(rows)
+    values = np.fromiter((r.value for r in rows), dtype=np.float64, count=n)
+    lead = np.fromiter((r.lead_hour for r in rows), dtype=np.int64, count=n)
+    init_s = np.fromiter(
+        (_epoch_seconds(r.init_time) for r in rows), dtype=np.int64, count=n
+    )
+    model_names, model_idx = np.unique(
+        [r.model_name for r in rows], return_inverse=True
+    )
+    # One "series" per (model, point)
+    points = np.array([(r.lat, r.lon) for r in rows], dtype=np.float64)
+    _, point_idx = np.unique(points, axis=0, return_inverse=True)
+    series = model_idx * (int(point_idx.max()) + 1) + point_idx.ravel()
+    n_series = int(series.max()) + 1
+
+    # (valid_time, series) packed into one int64 key
+    is_analysis = lead == 0
+    a_keys = init_s[is_analysis] * n_series + series[is_analysis]
+    a_values = values[is_analysis]
+    # Keep the last analysis for a duplicated key (np.unique takes the first)
+    a_keys, first = np.unique(a_keys[::-1], return_index=True)
+    a_values = a_values[::-1][first]
+
+    f_lead = lead[~is_analysis]
+    f_model = model_idx[~is_analysis]
+    f_keys = (init_s[~is_analysis] + f_lead * 3600) * n_series + series[~is_analysis]
+    if not len(a_keys) or not len(f_keys):
+        return []
+    pos = np.minimum(np.searchsorted(a_keys, f_keys), len(a_keys) - 1)
+    matched = a_keys[pos] == f_keys
+    errors = values[~is_analysis][matched] - a_values[pos[matched]]
+    if not len(errors):
+        return []
+
+    # Group by (model, lead_hour); sorted keys give model-then-lead order
+    span = int(f_lead.max()) + 1
+    group_keys = f_model[matched] * span + f_lead[matched]
+    groups, group_idx = np.unique(group_keys, return_inverse=True)
+    counts = np.bincount(group_idx)
+    bias = np.bincount(group_idx, weights=errors) / counts
+    mae = np.bincount(group_idx, weights=np.abs(errors)) / counts
+    return [
+        (
+            str(model_names[key // span]),
+            int(key % span),
+            float(mae[i]),
+            float(bias[i]),
+            int(counts[i]),
+        )
+        for i, key in enumerate(groups)
+    ]
+
+
+async def _pg_score_rows(
+    db: AsyncSession,
+    variable: str,
+    lat: float,
+    lon: float,
+    model_name: str | None,
+) -> list[tuple[str, int, float, float, int]]:
+    """MAE/bias per (model, lead_hour) computed entirely in PostgreSQL.
+
+    Forecast values self-join to the analysis value (lead_hour=0) of the same
+    model and point from the run initialised at the forecast's valid time;
+    only the grouped aggregates come back.
+    """
+    fcst = aliased(ModelPointValue)
+    anl = aliased(ModelPointValue)
+    fcst_run = aliased(ModelRun)
+    anl_run = aliased(ModelRun)
+    error = fcst.value - anl.value
+
+    stmt = (
+        select(
+            fcst_run.model_name,
+            fcst.lead_hour,
+            func.avg(func.abs(error)).label("mae"),
+            func.avg(error).label("bias"),
+            func.count().label("n"),
+        )
+        .select_from(fcst)
+        .join(fcst_run, fcst.run_id == fcst_run.id)
+        .join(
+            anl_run,
+            and_(
+                anl_run.model_name == fcst_run.model_name,
+                anl_run.init_time
+                == fcst_run.init_time + func.make_interval(0, 0, 0, 0, fcst.lead_hour),
+            ),
+        )
+        .join(
+            anl,
+            and_(
+                anl.run_id == anl_run.id,
+                anl.variable == fcst.variable,
+                anl.lat == fcst.lat,
+                anl.lon == fcst.lon,
+                anl.lead_hour == 0,
+            ),
+        )
+        .where(
+            fcst.variable == variable,
+            fcst.lead_hour > 0,
+            near(fcst, lat, lon),
+        )
+        .group_by(fcst_run.model_name, fcst.lead_hour)
+        .order_by(fcst_run.model_name, fcst.lead_hour)
+    )
+    if model_name:
+        stmt = stmt.where(fcst_run.model_name == model_name.upper())
+
+    result = await db.execute(stmt)
+    return [
+        (row.model_name, row.lead_hour, float(row.mae), float(row.bias), row.n)
+        for row in result.all()
+    ]
+
+
 @router.get("/scores", response_model=VerificationResponse)
 async def get_verification_scores(
     lat: float = Query(...),
@@ -26,74 +163,41 @@ async def get_verification_scores(
     (i.e. a later run whose init_time == the forecast's valid_time).
     Compute error, group by (model_name, lead_hour), return MAE + bias + n_samples.
     """
-    # Fetch all model point values at this location for the requested variable
-    stmt = (
-        select(
-            ModelPointValue.value,
-            ModelPointValue.lead_hour,
-            ModelRun.model_name,
-            ModelRun.init_time,
-        )
-        .join(ModelRun, ModelPointValue.run_id == ModelRun.id)
-        .where(
-            ModelPointValue.variable == variable,
-            ModelPointValue.lat.between(lat - 0.5, lat + 0.5),
-            ModelPointValue.lon.between(lon - 0.5, lon + 0.5),
+    if db.get_bind().dialect.name == "postgresql":
+        score_rows = await _pg_score_rows(db, variable, lat, lon, model_name)
+    else:
+        # Fetch all model point values at this location and match in Python
+        stmt = (
+            select(
+                ModelPointValue.value,
+                ModelPointValue.lead_hour,
+                ModelPointValue.lat,
+                ModelPointValue.lon,
+                ModelRun.model_name,
+                ModelRun.init_time,
+            )
+            .join(ModelRun, ModelPointValue.run_id == ModelRun.id)
+            .where(
+                ModelPointValue.variable == variable,
+                near(ModelPointValue, lat, lon),
+            )
         )
-    )
-    if model_name:
-        stmt = stmt.where(ModelRun.model_name == model_name.upper())
+        if model_name:
+            stmt = stmt.where(ModelRun.model_name == model_name.upper())
+        result = await db.execute(stmt)
+        rows = result.all()
+        score_rows = _score_rows(rows) if rows else []
 
-    result = await db.execute(stmt)
-    rows = result.all()
-
-    if not rows:
-        return VerificationResponse(variable=variable, lat=lat, lon=lon, scores=[])
-
-    # Separate analyses (lead_hour=0) from forecasts (lead_hour>0)
-    # Key analyses by (model_name, init_time) since init_time IS the valid_time
-    # for analyses.
-    from datetime import timedelta
-
-    analyses: dict[tuple[str, str], float] = {}
-    # (model_name, lead_hour, init_time, value)
-    forecasts: list[tuple[str, int, str, float]] = []
-
-    for row in rows:
-        if row.lead_hour == 0:
-            # Analysis: valid_time = init_time
-            key = (row.model_name, row.init_time.isoformat())
-            analyses[key] = row.value
-        else:
-            forecasts.append((row.model_name, row.lead_hour, row.init_time, row.value))
-
-    # For each forecast, find matching analysis
-    # valid_time of forecast = init_time + timedelta(hours=lead_hour)
-    # We need an analysis from the same model where init_time == valid_time
-    errors: dict[tuple[str, int], list[float]] = defaultdict(list)
-
-    for model, lead_hour, init_time, fcst_value in forecasts:
-        valid_time = init_time + timedelta(hours=lead_hour)
-        analysis_key = (model, valid_time.isoformat())
-        if analysis_key in analyses:
-            error = fcst_value - analyses[analysis_key]
-            errors[(model, lead_hour)].append(error)
-
-    # Compute MAE and bias per (model, lead_hour)
-    scores = []
-    for (model, lead_hour), errs in sorted(errors.items()):
-        n = len(errs)
-        mae = sum(abs(e) for e in errs) / n
-        bias = sum(errs) / n
-        scores.append(
-            VerificationScore(
-                model_name=model,
-                lead_hour=lead_hour,
-                mae=round(mae, 4),
-                bias=round(bias, 4),
-                n_samples=n,
-            )
+    scores = [
+        VerificationScore(
+            model_name=model,
+            lead_hour=lead_hour,
+            mae=round(mae, 4),
+            bias=round(bias, 4),
+            n_samples=n,
         )
+        for model, lead_hour, mae, bias, n in score_rows
+    ]
 
     return VerificationResponse(
         variable=variable,
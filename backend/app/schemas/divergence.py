@@ -31,6 +31,28 @@ class GridSnapshotOut(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class QuantizedGrid(BaseModel):
+    """2D grid packed as base64 little-endian uint16 codes.
+
+    Decode with ``value = offset + code * scale``; ``nodata`` marks NaN cells.
+    """
+
+    dtype: str
+    shape: list[int]
+    scale: float
+    offset: float
+    nodata: int
+    data: str
+
+
+class PackedGrid(BaseModel):
+    """2D grid packed as base64 little-endian float32 bytes (NaN = missing)."""
+
+    dtype: str
+    shape: list[int]
+    data: str
+
+
 class GridDivergenceData(BaseModel):
     """Flattened grid divergence for JSON transport."""
 
@@ -39,7 +61,8 @@ class GridDivergenceData(BaseModel):
     init_time: str
     latitudes: list[float]
     longitudes: list[float]
-    values: list[list[float]]  # 2D array [lat][lon]
+    # 2D array [lat][lon] with NaN -> null, or packed when encoding=uint16/float32
+    values: list[list[float | None]] | QuantizedGrid | PackedGrid
     bbox: dict
 
 
@@ -2,11 +2,13 @@
 
 import logging
 
+import httpx
+import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.alert import AlertEvent, AlertRule
-from app.models.divergence import PointMetric
+from app.models.divergence import PointMetric, near
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,31 @@ def _threshold_exceeded(value: float, threshold: float, comparison: str) -> bool
     return False
 
 
+def _all_exceeded(values: np.ndarray, threshold: float, comparison: str) -> bool:
+    if comparison == "gt":
+        return bool((values > threshold).all())
+    if comparison == "lt":
+        return bool((values < threshold).all())
+    return False
+
+
+async def _recent_metric_values(
+    db: AsyncSession, variable: str, lat: float, lon: float, limit: int
+) -> dict[str, np.ndarray]:
+    """Newest ``limit`` spread/rmse/bias values near (lat, lon), newest first."""
+    result = await db.execute(
+        select(PointMetric.spread, PointMetric.rmse, PointMetric.bias)
+        .where(
+            PointMetric.variable == variable,
+            near(PointMetric, lat, lon),
+        )
+        .order_by(PointMetric.created_at.desc())
+        .limit(limit)
+    )
+    rows = np.array(result.all(), dtype=np.float64).reshape(-1, 3)
+    return {"spread": rows[:, 0], "rmse": rows[:, 1], "bias": rows[:, 2]}
+
+
 async def check_alerts(
     db: AsyncSession,
     variable: str,
@@ -45,6 +72,36 @@ async def check_alerts(
     Creates AlertEvent rows for any triggered rules and optionally sends
     webhook notifications.
     """
+    return await check_alerts_batch(
+        db,
+        variable,
+        lead_hour,
+        [
+            {
+                "lat": lat,
+                "lon": lon,
+                "spread": spread,
+                "rmse": rmse,
+                "bias": bias,
+                "location_label": location_label,
+            }
+        ],
+    )
+
+
+async def check_alerts_batch(
+    db: AsyncSession,
+    variable: str,
+    lead_hour: int,
+    points: list[dict],
+) -> list[AlertEvent]:
+    """:func:`check_alerts` for many points of one variable and lead hour.
+
+    Each point is a dict with ``lat``, ``lon``, ``spread``, ``rmse``,
+    ``bias`` and an optional ``location_label``.  The enabled rules are
+    loaded once for all points, triggered events are flushed together and
+    sent in a single webhook.
+    """
     # Find matching rules
     stmt = select(AlertRule).where(
         AlertRule.enabled == True,  # noqa: E712
@@ -52,69 +109,68 @@ async def check_alerts(
     )
     result = await db.execute(stmt)
     rules = result.scalars().all()
+    if not rules:
+        return []
 
     triggered: list[AlertEvent] = []
+    # Recent metrics for consecutive_hours rules: every rule shares the same
+    # variable, so one query per location, sized for the longest window,
+    # serves them all.
+    max_window = max(
+        (r.consecutive_hours for r in rules if r.consecutive_hours > 1), default=0
+    )
 
-    for rule in rules:
-        # If rule is location-specific, check proximity
-        if rule.lat is not None and rule.lon is not None:
-            if abs(rule.lat - lat) > 0.5 or abs(rule.lon - lon) > 0.5:
-                continue
+    for point in points:
+        lat, lon = point["lat"], point["lon"]
+        # Fetched lazily, on the first rule at this point that needs it
+        recent: dict[str, np.ndarray] | None = None
+
+        for rule in rules:
+            # If rule is location-specific, check proximity
+            if rule.lat is not None and rule.lon is not None:
+                if abs(rule.lat - lat) > 0.5 or abs(rule.lon - lon) > 0.5:
+                    continue
 
-        value = _get_metric_value(rule.metric, spread, rmse, bias)
-
-        if not _threshold_exceeded(value, rule.threshold, rule.comparison):
-            continue
-
-        # For consecutive_hours > 1, check recent metrics
-        if rule.consecutive_hours > 1:
-            recent_stmt = (
-                select(PointMetric)
-                .where(
-                    PointMetric.variable == variable,
-                    PointMetric.lat.between(lat - 0.5, lat + 0.5),
-                    PointMetric.lon.between(lon - 0.5, lon + 0.5),
-                )
-                .order_by(PointMetric.created_at.desc())
-                .limit(rule.consecutive_hours)
+            value = _get_metric_value(
+                rule.metric, point["spread"], point["rmse"], point["bias"]
             )
-            recent = await db.execute(recent_stmt)
-            recent_metrics = recent.scalars().all()
 
-            if len(recent_metrics) < rule.consecutive_hours:
+            if not _threshold_exceeded(value, rule.threshold, rule.comparison):
                 continue
 
-            all_exceeded = all(
-                _threshold_exceeded(
-                    _get_metric_value(rule.metric, m.spread, m.rmse, m.bias),
-                    rule.threshold,
-                    rule.comparison,
-                )
-                for m in recent_metrics
+            # For consecutive_hours > 1, check recent metrics
+            if rule.consecutive_hours > 1:
+                if recent is None:
+                    recent = await _recent_metric_values(
+                        db, variable, lat, lon, max_window
+                    )
+                window = recent.get(rule.metric, recent["spread"])[
+                    : rule.consecutive_hours
+                ]
+                if len(window) < rule.consecutive_hours:
+                    continue
+                if not _all_exceeded(window, rule.threshold, rule.comparison):
+                    continue
+
+            event = AlertEvent(
+                rule_id=rule.id,
+                value=value,
+                variable=variable,
+                lat=lat,
+                lon=lon,
+                location_label=point.get("location_label"),
+                lead_hour=lead_hour,
             )
-            if not all_exceeded:
-                continue
-
-        event = AlertEvent(
-            rule_id=rule.id,
-            value=value,
-            variable=variable,
-            lat=lat,
-            lon=lon,
-            location_label=location_label,
-            lead_hour=lead_hour,
-        )
-        db.add(event)
-        triggered.append(event)
+            db.add(event)
+            triggered.append(event)
 
     if triggered:
         await db.flush()
         logger.info(
-            "Triggered %d alert(s) for %s at (%.2f, %.2f) fhr=%d",
+            "Triggered %d alert(s) for %s at %d location(s) fhr=%d",
             len(triggered),
             variable,
-            lat,
-            lon,
+            len({(e.lat, e.lon) for e in triggered}),
             lead_hour,
         )
 
@@ -124,6 +180,30 @@ async def check_alerts(
     return triggered
 
 
+_webhook_client: httpx.AsyncClient | None = None
+
+
+def _get_webhook_client() -> httpx.AsyncClient:
+    """Return the shared webhook client, creating it on first use.
+
+    Reusing one client keeps the connection to the webhook host alive
+    between alert batches instead of reconnecting (and re-handshaking TLS)
+    for every send.
+    """
+    global _webhook_client
+    if _webhook_client is None or _webhook_client.is_closed:
+        _webhook_client = httpx.AsyncClient(timeout=10)
+    return _webhook_client
+
+
+async def close_webhook_client() -> None:
+    """Close the shared webhook client (called on app shutdown)."""
+    global _webhook_client
+    if _webhook_client is not None:
+        await _webhook_client.aclose()
+        _webhook_client = None
+
+
 async def _send_webhook(events: list[AlertEvent]) -> None:
     """Send webhook notification for triggered alerts."""
     from app.config import settings
@@ -132,8 +212,6 @@ async def _send_webhook(events: list[AlertEvent]) -> None:
         return
 
     try:
-        import httpx
-
         payload = {
             "text": f"SynopticSpread: {len(events)} alert(s) triggered",
             "alerts": [
@@ -148,7 +226,6 @@ async def _send_webhook(events: list[AlertEvent]) -> None:
                 for e in events
             ],
         }
-        async with httpx.AsyncClient(timeout=10) as client:
-            await client.post(settings.alert_webhook_url, json=payload)
+        await _get_webhook_client().post(settings.alert_webhook_url, json=payload)
     except Exception:
         logger.warning("Failed to send alert webhook", exc_info=True)
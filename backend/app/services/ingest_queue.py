@@ -0,0 +1,80 @@
+"""Bounded queue + persistent worker pool for manually triggered ingestion.
+
+``POST /api/admin/trigger`` submits jobs here instead of running them as
+FastAPI background tasks: a full queue rejects new jobs (backpressure), the
+number of workers caps how many triggered ingestions run at once, and the
+workers are cancelled cleanly on shutdown rather than holding it open.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def _run_ingestion(model: str, init_time: datetime, force: bool = False):
+    from app.services.scheduler import ingest_and_process, recompute_cycle_divergence
+
+    logger.info("Manual trigger: %s %s (force=%s)", model, init_time, force)
+    await ingest_and_process(model, init_time, force=force)
+    # Recompute divergence with whatever models are available for this cycle
+    await recompute_cycle_divergence(init_time)
+
+
+class IngestionQueue:
+    """asyncio.Queue of ``(model, init_time, force)`` jobs drained by workers.
+
+    The queue and workers are created by :meth:`start` (called from the app
+    lifespan, or lazily on the first :meth:`submit`) so they bind to the
+    running event loop.
+    """
+
+    def __init__(self, workers: int, maxsize: int) -> None:
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: asyncio.Queue | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"ingest-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    def submit(self, model: str, init_time: datetime, force: bool = False) -> bool:
+        """Queue a job; returns ``False`` if the queue is full."""
+        self.start()
+        try:
+            self._queue.put_nowait((model, init_time, force))
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            model, init_time, force = await queue.get()
+            try:
+                await _run_ingestion(model, init_time, force)
+            except Exception:
+                logger.exception("Queued ingestion failed for %s %s", model, init_time)
+            finally:
+                queue.task_done()
+
+
+ingestion_queue = IngestionQueue(
+    workers=settings.ingest_workers, maxsize=settings.ingest_queue_size
+)
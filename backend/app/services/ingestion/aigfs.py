@@ -65,7 +65,7 @@ class AIGFSFetcher(ModelFetcher):
                         )
                     elif var in AIGFS_SFC_SEARCH:
                         ds = h_sfc.xarray(AIGFS_SFC_SEARCH[var])
-                        first_var = list(ds.data_vars)[0]
+                        first_var = next(iter(ds.data_vars))
                         arrays[var] = ds[first_var]
 
                 # Fetch pressure-level fields separately
@@ -79,7 +79,7 @@ class AIGFSFetcher(ModelFetcher):
                     for var in variables:
                         if var in AIGFS_PRES_SEARCH:
                             ds = h_pres.xarray(AIGFS_PRES_SEARCH[var])
-                            first_var = list(ds.data_vars)[0]
+                            first_var = next(iter(ds.data_vars))
                             arrays[var] = ds[first_var]
 
                 results[fhr] = xr.Dataset(arrays)
@@ -51,7 +51,7 @@ class GFSFetcher(ModelFetcher):
                         )
                     elif var in GFS_SEARCH:
                         ds = h.xarray(GFS_SEARCH[var])
-                        first_var = list(ds.data_vars)[0]
+                        first_var = next(iter(ds.data_vars))
                         arrays[var] = ds[first_var]
 
                 results[fhr] = xr.Dataset(arrays)
@@ -54,11 +54,11 @@ class HRRRFetcher(ModelFetcher):
                         )
                     elif var == "mslp":
                         ds = h.xarray(HRRR_SEARCH["mslp"])
-                        first_var = list(ds.data_vars)[0]
+                        first_var = next(iter(ds.data_vars))
                         arrays[var] = ds[first_var]
                     elif var in HRRR_SEARCH:
                         ds = h.xarray(HRRR_SEARCH[var])
-                        first_var = list(ds.data_vars)[0]
+                        first_var = next(iter(ds.data_vars))
                         arrays[var] = ds[first_var]
 
                 results[fhr] = xr.Dataset(arrays)
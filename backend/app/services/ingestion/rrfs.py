@@ -10,6 +10,7 @@ we can still use Herbie's ``.idx`` parsing, subsetting, and xarray integration.
 
 import gc
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 import xarray as xr
@@ -86,12 +87,16 @@ except (ImportError, AttributeError):
 # RRFS search patterns and fetcher
 # ---------------------------------------------------------------------------
 
-# RRFS uses MSLET (not PRMSL) for mean sea-level pressure.
+# RRFS currently uses MSLET (not PRMSL) for mean sea-level pressure; the
+# fetcher probes each file's index and falls back to PRMSL if that is what
+# it carries (see _mslp_search).
+MSLP_CANDIDATES = (":MSLET:mean sea level", ":PRMSL:mean sea level")
+
 RRFS_SEARCH = {
     "precip": ":APCP:surface:0-",
     "wind_u": ":UGRD:10 m above ground",
     "wind_v": ":VGRD:10 m above ground",
-    "mslp": ":MSLET:mean sea level",
+    "mslp": MSLP_CANDIDATES[0],
     "hgt_500": ":HGT:500 mb",
 }
 
@@ -99,6 +104,28 @@ RRFS_SEARCH = {
 RRFS_LEAD_HOURS = list(range(0, 61, 6))
 
 
+def _mslp_search(h) -> str:
+    """Pick the MSLP search string that matches this file's GRIB index.
+
+    The index is the same one Herbie reads to subset the file, so probing it
+    costs no extra download.  Defaults to MSLET if the index can't be read.
+    """
+    try:
+        fields = h.inventory()["search_this"]
+    except Exception:
+        return MSLP_CANDIDATES[0]
+    for candidate in MSLP_CANDIDATES:
+        if fields.str.contains(candidate, regex=False).any():
+            return candidate
+    return MSLP_CANDIDATES[0]
+
+
+# Lead hours fetched concurrently; each is an independent S3 GRIB2 download.
+RRFS_FETCH_WORKERS = 8
+# Variable subsets fetched concurrently within one lead hour.
+RRFS_VARIABLE_WORKERS = 4
+
+
 class RRFSFetcher(ModelFetcher):
     name = "RRFS"
 
@@ -112,34 +139,59 @@ class RRFSFetcher(ModelFetcher):
         variables = variables or ["precip", "wind_speed", "mslp", "hgt_500"]
         results: dict[int, xr.Dataset] = {}
 
-        for fhr in lead_hours:
-            try:
-                h = Herbie(
-                    init_time.replace(tzinfo=None),
-                    model="rrfs",
-                    product="prslev",
-                    fxx=fhr,
+        # The lead hours are network-bound and independent, so download them
+        # on a thread pool; each worker builds its own Herbie object.
+        with ThreadPoolExecutor(
+            max_workers=min(RRFS_FETCH_WORKERS, len(lead_hours))
+        ) as pool:
+            futures = {
+                pool.submit(self._fetch_one, init_time, fhr, variables): fhr
+                for fhr in lead_hours
+            }
+            for future in as_completed(futures):
+                fhr = futures[future]
+                try:
+                    results[fhr] = future.result()
+                    logger.info("RRFS fhr=%d fetched successfully", fhr)
+                except Exception:
+                    logger.exception("RRFS fhr=%d fetch failed", fhr)
+
+        # Collect once after the pool drains rather than per lead hour
+        gc.collect()
+        return dict(sorted(results.items()))
+
+    def _fetch_one(
+        self, init_time: datetime, fhr: int, variables: list[str]
+    ) -> xr.Dataset:
+        h = Herbie(
+            init_time.replace(tzinfo=None),
+            model="rrfs",
+            product="prslev",
+            fxx=fhr,
+        )
+        searches: dict[str, str] = {}
+        for var in variables:
+            if var == "wind_speed":
+                searches["wind_u"] = RRFS_SEARCH["wind_u"]
+                searches["wind_v"] = RRFS_SEARCH["wind_v"]
+            elif var == "mslp":
+                searches[var] = _mslp_search(h)
+            elif var in RRFS_SEARCH:
+                searches[var] = RRFS_SEARCH[var]
+
+        # Each search is an independent byte-range download from the same file
+        with ThreadPoolExecutor(max_workers=RRFS_VARIABLE_WORKERS) as pool:
+            fetched = dict(zip(searches, pool.map(h.xarray, searches.values())))
+
+        arrays: dict[str, xr.DataArray] = {}
+        for var in variables:
+            if var == "wind_speed":
+                arrays["wind_speed"] = self.compute_wind_speed(
+                    xr.merge([fetched["wind_u"], fetched["wind_v"]]), "u10", "v10"
                 )
-                arrays: dict[str, xr.DataArray] = {}
-
-                for var in variables:
-                    if var == "wind_speed":
-                        ds_u = h.xarray(RRFS_SEARCH["wind_u"])
-                        ds_v = h.xarray(RRFS_SEARCH["wind_v"])
-                        arrays["wind_speed"] = self.compute_wind_speed(
-                            xr.merge([ds_u, ds_v]), "u10", "v10"
-                        )
-                    elif var in RRFS_SEARCH:
-                        ds = h.xarray(RRFS_SEARCH[var])
-                        first_var = list(ds.data_vars)[0]
-                        arrays[var] = ds[first_var]
-
-                results[fhr] = xr.Dataset(arrays)
-                logger.info("RRFS fhr=%d fetched successfully", fhr)
-            except Exception:
-                logger.exception("RRFS fhr=%d fetch failed", fhr)
-            finally:
-                del h
-                gc.collect()
-
-        return results
+            elif var in fetched:
+                ds = fetched[var]
+                first_var = next(iter(ds.data_vars))
+                arrays[var] = ds[first_var]
+
+        return xr.Dataset(arrays)
@@ -1,14 +1,101 @@
 """Grid-level divergence computation and Zarr storage."""
 
-import gc
+import functools
+import hashlib
 import logging
+import os
+import shutil
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
 import xarray as xr
 
+from app.services.processing.metrics import KDTREE_BUILD_OPTIONS
+
 logger = logging.getLogger(__name__)
 
+# Zarr chunk edge (cells) for stored divergence grids.
+ZARR_CHUNK = 256
+
+
+# Nearest-cell lookups for 2-D projected grids, keyed by a digest of the
+# source coordinates, NaN mask and target axes.  A model's grid is the same at
+# every lead hour, so its k-d tree is built and queried once per cycle.
+_NEAREST_CACHE_SIZE = 16
+_nearest_cache: dict[bytes, np.ndarray] = {}
+# Variables are regridded on concurrent threads; guards eviction + insert
+_nearest_cache_lock = threading.Lock()
+
+# Target cells farther than this (degrees, in lat/lon space) from every valid
+# source cell lie outside a projected model's footprint and are left NaN.
+MAX_NEIGHBOUR_DISTANCE = 0.5
+
+
+def _nearest_source_cells(
+    lats_flat: np.ndarray,
+    lons_flat: np.ndarray,
+    valid: np.ndarray,
+    common_lat: np.ndarray,
+    common_lon: np.ndarray,
+) -> np.ndarray:
+    """Flat source index of the nearest valid cell for each target cell.
+
+    Target cells with no valid source cell within ``MAX_NEIGHBOUR_DISTANCE``
+    get ``len(lats_flat)``, one past the last source index.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(lats_flat.shape + common_lat.shape + common_lon.shape))
+    for arr in (lats_flat, lons_flat, np.packbits(valid), common_lat, common_lon):
+        digest.update(np.ascontiguousarray(arr))
+    key = digest.digest()
+
+    nearest = _nearest_cache.get(key)
+    if nearest is None:
+        from scipy.spatial import cKDTree
+
+        valid_idx = np.flatnonzero(valid)
+        tree = cKDTree(
+            np.column_stack([lats_flat[valid_idx], lons_flat[valid_idx]]),
+            **KDTREE_BUILD_OPTIONS,
+        )
+        grid_lon, grid_lat = np.meshgrid(common_lon, common_lat)
+        _, pos = tree.query(
+            np.column_stack([grid_lat.ravel(), grid_lon.ravel()]),
+            distance_upper_bound=MAX_NEIGHBOUR_DISTANCE,
+            workers=-1,
+        )
+        # Misses come back as pos == len(valid_idx)
+        nearest = np.append(valid_idx, len(lats_flat))[pos]
+        with _nearest_cache_lock:
+            if len(_nearest_cache) >= _NEAREST_CACHE_SIZE:
+                del _nearest_cache[next(iter(_nearest_cache))]
+            _nearest_cache[key] = nearest
+    return nearest
+
+
+def _uniform_nearest(src: np.ndarray, target: np.ndarray) -> np.ndarray | None:
+    """Nearest ``src`` index for each ``target`` value on an evenly spaced axis.
+
+    Matches ``interp(method="nearest")``: a target exactly halfway between
+    two cells takes the one with the smaller coordinate, and targets outside
+    ``src``'s range get -1.  Returns ``None`` if ``src`` isn't evenly spaced.
+    """
+    if len(src) < 2:
+        return None
+    step = src[1] - src[0]
+    if step == 0 or not np.allclose(np.diff(src), step):
+        return None
+    pos = (target - src[0]) / step
+    idx = np.ceil(pos - 0.5) if step > 0 else np.floor(pos + 0.5)
+    idx = np.clip(idx, 0, len(src) - 1).astype(np.intp)
+    lo, hi = min(src[0], src[-1]), max(src[0], src[-1])
+    idx[(target < lo) | (target > hi)] = -1
+    return idx
+
 
 def _to_regular_grid(
     da: xr.DataArray,
@@ -25,22 +112,33 @@ def _to_regular_grid(
         raise ValueError("DataArray has no latitude coordinate")
 
     if lat_coord.ndim == 1:
-        return da.interp(latitude=common_lat, longitude=common_lon, method="nearest")
-
-    # 2-D projected grid: flatten and use scipy nearest-neighbour
-    from scipy.interpolate import griddata
-
-    lats_flat = da.coords["latitude"].values.ravel()
-    lons_flat = da.coords["longitude"].values.ravel()
-    vals_flat = da.values.ravel().astype(float)
-
-    valid = ~np.isnan(vals_flat)
-    grid_lon, grid_lat = np.meshgrid(common_lon, common_lat)
-    interpolated = griddata(
-        (lats_flat[valid], lons_flat[valid]),
-        vals_flat[valid],
-        (grid_lat, grid_lon),
-        method="nearest",
+        rows = _uniform_nearest(lat_coord.values, common_lat)
+        cols = _uniform_nearest(da.coords["longitude"].values, common_lon)
+        if rows is None or cols is None:
+            return da.interp(
+                latitude=common_lat, longitude=common_lon, method="nearest"
+            )
+        # Evenly spaced axes: nearest cells are plain index arithmetic
+        out = da.isel(latitude=np.maximum(rows, 0), longitude=np.maximum(cols, 0))
+        out = out.assign_coords(latitude=common_lat, longitude=common_lon)
+        if (rows < 0).any() or (cols < 0).any():
+            inside = (rows >= 0)[:, None] & (cols >= 0)[None, :]
+            out = out.where(
+                xr.DataArray(inside, dims=("latitude", "longitude")), drop=False
+            )
+        return out
+
+    # 2-D projected grid: nearest valid source cell for every target cell
+    vals_flat = da.values.ravel().astype(np.float32)
+    nearest = _nearest_source_cells(
+        da.coords["latitude"].values.ravel(),
+        da.coords["longitude"].values.ravel(),
+        ~np.isnan(vals_flat),
+        common_lat,
+        common_lon,
+    )
+    interpolated = np.append(vals_flat, np.float32(np.nan))[nearest].reshape(
+        len(common_lat), len(common_lon)
     )
     return xr.DataArray(
         interpolated,
@@ -49,68 +147,248 @@ def _to_regular_grid(
     )
 
 
+def _bbox(coord: np.ndarray) -> tuple[float, float]:
+    """(min, max) of a coordinate array.
+
+    1-D coordinates are monotonic, so only the endpoints are read; 2-D
+    projected coordinates need a full scan.
+    """
+    if coord.ndim == 1:
+        first, last = float(coord[0]), float(coord[-1])
+        return min(first, last), max(first, last)
+    return float(np.min(coord)), float(np.max(coord))
+
+
+@functools.lru_cache(maxsize=32)
+def _common_grid(
+    bboxes: tuple[tuple[float, float, float, float], ...], resolution: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """Regular lat/lon axes covering the intersection of model bounding boxes.
+
+    ``bboxes`` holds one ``(lat_min, lat_max, lon_min, lon_max)`` per model.
+    Models keep the same grid from one lead hour and variable to the next, so
+    the axes are cached; they are returned read-only because they are shared.
+    """
+    common_lat = np.arange(
+        max(b[0] for b in bboxes), min(b[1] for b in bboxes), resolution
+    )
+    common_lon = np.arange(
+        max(b[2] for b in bboxes), min(b[3] for b in bboxes), resolution
+    )
+    common_lat.flags.writeable = False
+    common_lon.flags.writeable = False
+    return common_lat, common_lon
+
+
 def regrid_to_common(
     datasets: dict[str, xr.Dataset],
     variable: str,
     resolution: float = 0.25,
+    cache_dir: Path | None = None,
 ) -> dict[str, xr.DataArray]:
     """Regrid all model fields to a common lat/lon grid.
 
     Uses nearest-neighbor interpolation. Handles regular 1-D grids (GFS)
     and 2-D projected grids (NAM CONUSNEST). Uses the intersection of all
     model bounding boxes at the given resolution.
+
+    With ``cache_dir`` (one directory per cycle and lead hour), each
+    model's regridded field is saved there as float32 ``.npy`` and later
+    calls on the same common grid memory-map it instead of regridding.
     """
-    lat_mins, lat_maxs, lon_mins, lon_maxs = [], [], [], []
-    for ds in datasets.values():
-        if variable not in ds:
-            continue
-        da = ds[variable]
-        lats = da.coords["latitude"].values
-        lons = da.coords["longitude"].values
-        lat_mins.append(float(np.min(lats)))
-        lat_maxs.append(float(np.max(lats)))
-        lon_mins.append(float(np.min(lons)))
-        lon_maxs.append(float(np.max(lons)))
-
-    if not lat_mins:
+    bboxes = tuple(
+        sorted(
+            _bbox(ds[variable].coords["latitude"].values)
+            + _bbox(ds[variable].coords["longitude"].values)
+            for ds in datasets.values()
+            if variable in ds
+        )
+    )
+    if not bboxes:
         return {}
 
-    common_lat = np.arange(max(lat_mins), min(lat_maxs), resolution)
-    common_lon = np.arange(max(lon_mins), min(lon_maxs), resolution)
+    common_lat, common_lon = _common_grid(bboxes, resolution)
 
-    regridded = {}
+    cached: dict[str, xr.DataArray] = {}
+    if cache_dir is not None:
+        grid_key = _grid_key(common_lat, common_lon)
+        for name, ds in datasets.items():
+            path = cache_dir / f"{name}_{variable}_{grid_key}.npy"
+            if variable in ds and path.exists():
+                cached[name] = xr.DataArray(
+                    np.load(path, mmap_mode="r"),
+                    coords={"latitude": common_lat, "longitude": common_lon},
+                    dims=["latitude", "longitude"],
+                )
+
+    # Regular-grid models on identical axes (e.g. the 0.25° global models)
+    # are stacked and interpolated in one pass
+    shared_axes: dict[tuple[bytes, bytes], list[str]] = defaultdict(list)
     for name, ds in datasets.items():
-        if variable not in ds:
+        if (
+            name not in cached
+            and variable in ds
+            and ds[variable].coords["latitude"].ndim == 1
+        ):
+            da = ds[variable]
+            axes = (
+                da.coords["latitude"].values.tobytes(),
+                da.coords["longitude"].values.tobytes(),
+            )
+            shared_axes[axes].append(name)
+
+    batched: dict[str, xr.DataArray] = {}
+    for names in shared_axes.values():
+        if len(names) < 2:
             continue
         try:
-            regridded[name] = _to_regular_grid(ds[variable], common_lat, common_lon)
+            stacked = _to_regular_grid(
+                xr.concat(
+                    [datasets[name][variable] for name in names],
+                    dim="model",
+                    coords="minimal",
+                    compat="override",
+                    join="override",
+                ),
+                common_lat,
+                common_lon,
+            )
+            for i, name in enumerate(names):
+                batched[name] = stacked.isel(model=i, drop=True)
         except Exception:
-            logger.warning("regrid failed for %s", name, exc_info=True)
+            logger.warning("batched regrid failed for %s", names, exc_info=True)
+
+    regridded = {}
+    for name, ds in datasets.items():
+        if variable not in ds:
+            continue
+        if name in cached:
+            regridded[name] = cached[name]
+            continue
+        if name in batched:
+            regridded[name] = batched[name]
+        else:
+            try:
+                regridded[name] = _to_regular_grid(ds[variable], common_lat, common_lon)
+            except Exception:
+                logger.warning("regrid failed for %s", name, exc_info=True)
+                continue
+        if cache_dir is not None:
+            _save_regridded(
+                cache_dir / f"{name}_{variable}_{grid_key}.npy",
+                regridded[name].values,
+            )
     return regridded
 
 
+def _grid_key(common_lat: np.ndarray, common_lon: np.ndarray) -> str:
+    """Short digest naming a common grid in regrid cache file names."""
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(np.ascontiguousarray(common_lat))
+    digest.update(np.ascontiguousarray(common_lon))
+    return digest.hexdigest()
+
+
+def _save_regridded(path: Path, values: np.ndarray) -> None:
+    """Write a regridded field to the cache atomically; failures only log."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            np.save(f, np.asarray(values, dtype=np.float32))
+        os.replace(tmp, path)
+    except OSError:
+        logger.warning("Could not cache regridded field at %s", path, exc_info=True)
+
+
+def prune_regrid_cache(store_path: Path, older_than: datetime) -> None:
+    """Delete cached regrids of cycles initialised before ``older_than``.
+
+    The cache lives under ``store_path / "regrid" / <YYYYMMDDHH>``.
+    """
+    root = store_path / "regrid"
+    if not root.exists():
+        return
+    cutoff = older_than.strftime("%Y%m%d%H")
+    for cycle_dir in root.iterdir():
+        if cycle_dir.name < cutoff:
+            shutil.rmtree(cycle_dir, ignore_errors=True)
+
+
 def compute_grid_divergence(
     datasets: dict[str, xr.Dataset],
     variable: str,
     resolution: float = 0.25,
+    cache_dir: Path | None = None,
 ) -> xr.DataArray:
     """Compute per-grid-cell standard deviation across models.
 
     Returns a 2D DataArray (latitude, longitude) with divergence values.
+    ``cache_dir`` is passed through to :func:`regrid_to_common`.
     """
-    regridded = regrid_to_common(datasets, variable, resolution)
+    regridded = regrid_to_common(datasets, variable, resolution, cache_dir)
     if len(regridded) < 2:
         raise ValueError("Need at least 2 models to compute divergence")
 
-    stacked = xr.concat(list(regridded.values()), dim="model")
-    del regridded
-    divergence = stacked.std(dim="model", ddof=1)
-    del stacked
-    divergence.name = f"{variable}_divergence"
-    gc.collect()
+    first = next(iter(regridded.values()))
+    std = _welford_std([da.values for da in regridded.values()])
+    divergence = xr.DataArray(
+        std,
+        coords={
+            "latitude": first.coords["latitude"],
+            "longitude": first.coords["longitude"],
+        },
+        dims=("latitude", "longitude"),
+        name=f"{variable}_divergence",
+    )
+    # Drop the regridded fields now; refcounting frees them, and the
+    # scheduler's periodic gc.collect() picks up anything cyclic.
+    del regridded, first
     return divergence
 
 
+def divergence_bbox(div_grid: xr.DataArray) -> dict[str, float]:
+    """Bounding box of a divergence grid, as stored on ``GridSnapshot.bbox``.
+
+    The common grid's axes are 1-D, so only their endpoints are read.
+    """
+    min_lat, max_lat = _bbox(div_grid.coords["latitude"].values)
+    min_lon, max_lon = _bbox(div_grid.coords["longitude"].values)
+    return {
+        "min_lat": min_lat,
+        "max_lat": max_lat,
+        "min_lon": min_lon,
+        "max_lon": max_lon,
+    }
+
+
+def _welford_std(fields: Iterable[np.ndarray]) -> np.ndarray:
+    """Per-cell sample standard deviation (ddof=1) across same-shape fields.
+
+    Welford's online update keeps only running count/mean/M2 arrays instead
+    of stacking every model into an (M, H, W) array.  NaN cells are skipped
+    per cell; cells with fewer than two values are NaN, as with
+    ``DataArray.std(skipna=True, ddof=1)``.  Accumulates in float32: the
+    forecast fields carry no more precision than that.
+    """
+    count = mean = m2 = None
+    for field in fields:
+        x = np.asarray(field, dtype=np.float32)
+        if count is None:
+            count = np.zeros(x.shape, dtype=np.int32)
+            mean = np.zeros(x.shape, dtype=np.float32)
+            m2 = np.zeros(x.shape, dtype=np.float32)
+        ok = ~np.isnan(x)
+        count += ok
+        delta = np.where(ok, x - mean, np.float32(0))
+        mean += delta / np.maximum(count, 1).astype(np.float32)
+        m2 += delta * np.where(ok, x - mean, np.float32(0))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(m2 / (count - 1).astype(np.float32))
+    return np.where(count > 1, std, np.float32(np.nan))
+
+
 def save_divergence_zarr(
     divergence: xr.DataArray,
     store_path: Path,
@@ -123,12 +401,22 @@ def save_divergence_zarr(
     zarr_dir.mkdir(parents=True, exist_ok=True)
     zarr_path = zarr_dir / f"fhr{lead_hour:03d}.zarr"
 
-    divergence.to_dataset().to_zarr(str(zarr_path), mode="w")
+    # Fixed on-disk float32 tiles so readers fetch whole, aligned chunks
+    chunks = tuple(min(ZARR_CHUNK, n) for n in divergence.shape)
+    divergence.to_dataset().to_zarr(
+        str(zarr_path),
+        mode="w",
+        encoding={divergence.name: {"chunks": chunks, "dtype": "float32"}},
+    )
     logger.info("Saved divergence grid to %s", zarr_path)
     return str(zarr_path)
 
 
 def load_divergence_zarr(zarr_path: str) -> xr.DataArray:
-    """Load a divergence DataArray from Zarr."""
-    ds = xr.open_zarr(zarr_path)
-    return ds[list(ds.data_vars)[0]]
+    """Open a divergence DataArray from Zarr.
+
+    ``chunks=None`` keeps the array lazily indexed rather than wrapping it in
+    dask; values are read when first accessed.
+    """
+    ds = xr.open_zarr(zarr_path, chunks=None)
+    return ds[next(iter(ds.data_vars))]
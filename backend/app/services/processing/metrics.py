@@ -1,8 +1,23 @@
 """Point-level divergence metrics between NWP models."""
 
+import hashlib
+import threading
+
 import numpy as np
 import xarray as xr
 
+# cKDTree options for lat/lon grids.  Midpoint splits on a regular mesh build
+# about twice as fast as median splits, and queries are no slower.
+KDTREE_BUILD_OPTIONS = {"balanced_tree": False, "compact_nodes": False}
+
+# k-d trees over 2-D projected grids, keyed by a digest of the lat/lon
+# coordinates.  A model's grid is the same for every variable and lead hour,
+# so each tree is built once and shared by all of them.
+_KDTREE_CACHE_SIZE = 8
+_kdtree_cache: dict[bytes, object] = {}
+# Variables are extracted on concurrent threads; guards eviction + insert
+_kdtree_cache_lock = threading.Lock()
+
 
 def extract_point(ds: xr.Dataset, variable: str, lat: float, lon: float) -> float:
     """Extract scalar value at nearest grid point.
@@ -24,10 +39,68 @@ def extract_point(ds: xr.Dataset, variable: str, lat: float, lon: float) -> floa
         val = da.sel(latitude=lat, longitude=lon, method="nearest")
         return float(val.values)
 
-    # 2-D case: projected grid (e.g. Lambert Conformal) — find nearest cell manually
-    dist = (lat_coord - lat) ** 2 + (lon_coord - lon) ** 2
-    idx = dist.argmin(...)  # returns dict of {dim: index} for all dims
-    return float(da.isel(**idx).values)
+    # 2-D case: projected grid (e.g. Lambert Conformal) — nearest cell in
+    # lat/lon space from a k-d tree built once per dataset
+    _, flat = _kdtree(lat_coord, lon_coord).query([lat, lon])
+    idx = np.unravel_index(flat, lat_coord.shape)
+    return float(da.isel(dict(zip(lat_coord.dims, idx))).values)
+
+
+def extract_points(
+    ds: xr.Dataset, variable: str, lats: np.ndarray, lons: np.ndarray
+) -> np.ndarray:
+    """Vectorised :func:`extract_point`: nearest-cell values at many points.
+
+    Returns a float64 array with one value per (lat, lon) pair, using one
+    ``.sel()`` or one k-d tree query for all of them.
+    """
+    da = ds[variable]
+    lat_coord = da.coords.get("latitude")
+    lon_coord = da.coords.get("longitude")
+
+    if lat_coord is None or lon_coord is None:
+        raise ValueError(
+            f"Dataset for {variable} has no latitude/longitude coordinates"
+        )
+
+    if lat_coord.ndim == 1:
+        val = da.sel(
+            latitude=xr.DataArray(lats, dims="point"),
+            longitude=xr.DataArray(lons, dims="point"),
+            method="nearest",
+        )
+        return np.asarray(val.values, dtype=np.float64)
+
+    _, flat = _kdtree(lat_coord, lon_coord).query(np.column_stack([lats, lons]))
+    idx = np.unravel_index(flat, lat_coord.shape)
+    val = da.isel(
+        {dim: xr.DataArray(i, dims="point") for dim, i in zip(lat_coord.dims, idx)}
+    )
+    return np.asarray(val.values, dtype=np.float64)
+
+
+def _kdtree(lat_coord: xr.DataArray, lon_coord: xr.DataArray):
+    """Return the cached k-d tree over a grid's 2-D lat/lon cells."""
+    lats = np.ascontiguousarray(lat_coord.values)
+    lons = np.ascontiguousarray(lon_coord.values)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.asarray(lats.shape))
+    digest.update(lats)
+    digest.update(lons)
+    key = digest.digest()
+
+    tree = _kdtree_cache.get(key)
+    if tree is None:
+        from scipy.spatial import cKDTree
+
+        tree = cKDTree(
+            np.column_stack([lats.ravel(), lons.ravel()]), **KDTREE_BUILD_OPTIONS
+        )
+        with _kdtree_cache_lock:
+            if len(_kdtree_cache) >= _KDTREE_CACHE_SIZE:
+                del _kdtree_cache[next(iter(_kdtree_cache))]
+            _kdtree_cache[key] = tree
+    return tree
 
 
 def compute_pairwise_metrics(
@@ -40,29 +113,27 @@ def compute_pairwise_metrics(
 
     Returns a list of dicts: {model_a, model_b, rmse, bias, val_a, val_b}.
     """
-    model_names = sorted(datasets.keys())
     values = {
         name: extract_point(ds, variable, lat, lon)
         for name, ds in datasets.items()
         if variable in ds
     }
-    results = []
-    for i, a in enumerate(model_names):
-        for b in model_names[i + 1 :]:
-            if a not in values or b not in values:
-                continue
-            diff = values[a] - values[b]
-            results.append(
-                {
-                    "model_a": a,
-                    "model_b": b,
-                    "rmse": abs(diff),  # single-point RMSE = abs difference
-                    "bias": diff,
-                    "val_a": values[a],
-                    "val_b": values[b],
-                }
-            )
-    return results
+    names = sorted(values)
+    arr = np.fromiter((values[n] for n in names), dtype=np.float64, count=len(names))
+    # Every (a, b) pair with a before b in name order
+    i_idx, j_idx = np.triu_indices(len(names), k=1)
+    diffs = (arr[i_idx] - arr[j_idx]).tolist()
+    return [
+        {
+            "model_a": names[i],
+            "model_b": names[j],
+            "rmse": abs(diff),  # single-point RMSE = abs difference
+            "bias": diff,
+            "val_a": values[names[i]],
+            "val_b": values[names[j]],
+        }
+        for i, j, diff in zip(i_idx.tolist(), j_idx.tolist(), diffs)
+    ]
 
 
 def compute_ensemble_spread(
@@ -71,11 +142,62 @@ def compute_ensemble_spread(
     lat: float,
     lon: float,
 ) -> float:
-    """Compute std deviation across all model values at a point."""
-    values = []
-    for ds in datasets.values():
-        if variable in ds:
-            values.append(extract_point(ds, variable, lat, lon))
+    """Compute std deviation across all model values at a point.
+
+    Models whose value is NaN at the point are left out.
+    """
+    values = np.fromiter(
+        (
+            extract_point(ds, variable, lat, lon)
+            for ds in datasets.values()
+            if variable in ds
+        ),
+        dtype=np.float64,
+    )
+    values = values[np.isfinite(values)]
     if len(values) < 2:
         return 0.0
-    return float(np.std(values, ddof=1))
+    return float(values.std(ddof=1))
+
+
+def compute_point_metrics_batch(
+    datasets: dict[str, xr.Dataset],
+    variable: str,
+    lats: np.ndarray,
+    lons: np.ndarray,
+) -> tuple[list[dict], np.ndarray]:
+    """Pairwise metrics and ensemble spread at every point in one pass.
+
+    Equivalent to calling :func:`compute_pairwise_metrics` and
+    :func:`compute_ensemble_spread` per point, but each model is sampled
+    once for all points and the metrics are array arithmetic.  Returns
+    ``(pairs, spread)``: the pair dicts carry ``rmse``/``bias``/``val_a``/
+    ``val_b`` as arrays over the points, and ``spread`` has one value per
+    point.
+    """
+    names = sorted(name for name, ds in datasets.items() if variable in ds)
+    values = np.empty((len(names), len(lats)), dtype=np.float64)
+    for row, name in zip(values, names):
+        row[:] = extract_points(datasets[name], variable, lats, lons)
+
+    i_idx, j_idx = np.triu_indices(len(names), k=1)
+    diffs = values[i_idx] - values[j_idx]
+    pairs = [
+        {
+            "model_a": names[i],
+            "model_b": names[j],
+            "rmse": np.abs(diff),
+            "bias": diff,
+            "val_a": values[i],
+            "val_b": values[j],
+        }
+        for i, j, diff in zip(i_idx.tolist(), j_idx.tolist(), diffs)
+    ]
+
+    # Sample std over the finite values at each point; 0 below two models
+    finite = np.isfinite(values)
+    count = finite.sum(axis=0)
+    mean = np.where(finite, values, 0.0).sum(axis=0) / np.maximum(count, 1)
+    sq_dev = np.where(finite, values - mean, 0.0) ** 2
+    spread = np.sqrt(sq_dev.sum(axis=0) / np.maximum(count - 1, 1))
+    return pairs, np.where(count >= 2, spread, 0.0)
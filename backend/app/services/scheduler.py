@@ -10,21 +10,46 @@ Memory-optimised architecture (fits in 2 GB):
 """
 
 import asyncio
+import functools
 import gc
 import logging
+import os
+import time
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+import numpy as np
+import xarray as xr
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import Select, delete, func, insert, select
 
 from app.config import settings
+from app.database import async_session
+from app.models import GridSnapshot, ModelPointValue, ModelRun, PointMetric, RunStatus
+from app.responses import clear_response_caches
+from app.services.alerts import check_alerts_batch
+from app.services.processing.grid import (
+    compute_grid_divergence,
+    divergence_bbox,
+    prune_regrid_cache,
+    save_divergence_zarr,
+)
+from app.services.processing.metrics import compute_point_metrics_batch, extract_points
 
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
 
 # Limit to one concurrent ingestion so heavy CPU work doesn't starve the event loop
-_ingestion_semaphore = asyncio.Semaphore(1)
+_ingestion_lock = asyncio.Lock()
+
+# Per-lead-hour datasets are freed by refcounting as soon as they are
+# dropped.  A full gc.collect() blocks the event loop for a whole-heap scan,
+# so the divergence loop only runs one every few lead hours to reclaim any
+# reference cycles left behind by cfgrib/Herbie.
+GC_EVERY_N_LEAD_HOURS = 8
 
 
 def _latest_cycle(
@@ -36,29 +61,60 @@ def _latest_cycle(
     roughly 3.5–5 hours after the nominal cycle time.
     ``availability_delay_hours`` is subtracted from the current time before
     rounding down, so we select a cycle whose data should already exist.
+
+    The answer only changes on the hour, so it is memoised per UTC hour.
     """
-    now = datetime.now(timezone.utc)
-    adjusted = now - timedelta(hours=availability_delay_hours)
+    return _cycle_for_hour(
+        int(time.time()) // 3600, hour_interval, availability_delay_hours
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _cycle_for_hour(
+    epoch_hour: int, hour_interval: int, availability_delay_hours: int
+) -> datetime:
+    adjusted = datetime.fromtimestamp(
+        (epoch_hour - availability_delay_hours) * 3600, timezone.utc
+    )
     cycle_hour = (adjusted.hour // hour_interval) * hour_interval
-    return adjusted.replace(hour=cycle_hour, minute=0, second=0, microsecond=0)
+    return adjusted.replace(hour=cycle_hour)
 
 
 def _compute_divergence_hours(
-    all_model_data: dict[str, dict[int, object]],
+    all_model_data: Mapping[str, Iterable[int]],
 ) -> set[int]:
     """Return lead hours covered by at least two models.
 
     Uses the *union* of every model's lead hours, then filters to those
     where at least two models have data.  This ensures that, e.g.,
     GFS-NAM divergence at fhr 54-72 is kept even though HRRR only
-    goes to 48 h.
+    goes to 48 h.  Each model's hours (a ``{lead_hour: ...}`` dict or a
+    set of hours) are counted in a single pass.
     """
-    all_hours: set[int] = set()
-    for d in all_model_data.values():
-        all_hours |= set(d.keys())
-    return {
-        h for h in all_hours if sum(1 for d in all_model_data.values() if h in d) >= 2
-    }
+    counts = Counter(h for hours in all_model_data.values() for h in hours)
+    return {h for h, n in counts.items() if n >= 2}
+
+
+# Divergence rows are inserted with Core and never loaded into the session,
+# so bulk DELETEs skip matching them against the identity map.
+_NO_SESSION_SYNC = {"synchronize_session": False}
+
+
+async def _delete_point_metrics(
+    db, run_ids: list | Select, lead_hours: list[int] | None = None
+):
+    """Delete PointMetric rows that reference any of *run_ids* on either side.
+
+    *run_ids* is a list of ids or a ``select(ModelRun.id)`` subquery.
+    Issues one DELETE per run-id column instead of ``run_a_id IN (...) OR
+    run_b_id IN (...)``, so each can use its own index rather than a
+    bitmap-OR scan.  Optionally limited to *lead_hours*.
+    """
+    for column in (PointMetric.run_a_id, PointMetric.run_b_id):
+        stmt = delete(PointMetric).where(column.in_(run_ids))
+        if lead_hours is not None:
+            stmt = stmt.where(PointMetric.lead_hour.in_(lead_hours))
+        await db.execute(stmt, execution_options=_NO_SESSION_SYNC)
 
 
 async def _clear_divergence_for_lead_hours(
@@ -69,39 +125,24 @@ async def _clear_divergence_for_lead_hours(
     Only deletes data for the given *lead_hours* so that divergence at other
     forecast hours (computed with a different model subset) is preserved.
     """
-    from sqlalchemy import delete, or_, select
-
-    from app.models import GridSnapshot, ModelPointValue, ModelRun, PointMetric
-
-    run_ids_result = await db.execute(
-        select(ModelRun.id).where(ModelRun.init_time == init_time)
-    )
-    run_ids = list(run_ids_result.scalars().all())
-
+    # Filter by the cycle's runs in SQL rather than fetching their ids first
+    run_ids = select(ModelRun.id).where(ModelRun.init_time == init_time)
     hours_list = list(lead_hours)
 
-    if run_ids:
-        await db.execute(
-            delete(PointMetric).where(
-                or_(
-                    PointMetric.run_a_id.in_(run_ids),
-                    PointMetric.run_b_id.in_(run_ids),
-                ),
-                PointMetric.lead_hour.in_(hours_list),
-            )
-        )
-        await db.execute(
-            delete(ModelPointValue).where(
-                ModelPointValue.run_id.in_(run_ids),
-                ModelPointValue.lead_hour.in_(hours_list),
-            )
-        )
-
+    await _delete_point_metrics(db, run_ids, hours_list)
+    await db.execute(
+        delete(ModelPointValue).where(
+            ModelPointValue.run_id.in_(run_ids),
+            ModelPointValue.lead_hour.in_(hours_list),
+        ),
+        execution_options=_NO_SESSION_SYNC,
+    )
     await db.execute(
         delete(GridSnapshot).where(
             GridSnapshot.init_time == init_time,
             GridSnapshot.lead_hour.in_(hours_list),
-        )
+        ),
+        execution_options=_NO_SESSION_SYNC,
     )
 
 
@@ -111,23 +152,47 @@ async def _clear_divergence_for_lead_hours(
 
 
 def _clean_herbie_cache():
-    """Remove cached GRIB2 subset files to free disk space."""
-    herbie_dir = Path.home() / ".herbie"
-    if not herbie_dir.exists():
-        return
-    deleted = 0
-    for f in herbie_dir.rglob("subset_*"):
-        try:
-            f.unlink()
-            deleted += 1
-        except OSError:
-            pass
+    """Remove cached GRIB2 subset files to free disk space.
+
+    Walks the whole ``~/.herbie`` tree, so async callers run it with
+    ``asyncio.to_thread`` to keep the event loop free.
+    """
+    deleted = _remove_subset_files(Path.home() / ".herbie")
     if deleted:
         logger.info("Cleaned %d cached herbie files", deleted)
 
 
+def _remove_subset_files(directory: str | os.PathLike) -> int:
+    """Delete ``subset_*`` files under *directory*; return how many went.
+
+    ``os.scandir`` reuses the directory entries' cached type info, so no
+    per-file ``Path`` objects or extra ``stat`` calls are needed.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return 0
+    deleted = 0
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                deleted += _remove_subset_files(entry.path)
+            elif entry.name.startswith("subset_"):
+                try:
+                    os.unlink(entry.path)
+                    deleted += 1
+                except OSError:
+                    pass
+    return deleted
+
+
 def _get_fetchers():
-    """Lazy-import fetcher classes to avoid circular imports."""
+    """Lazy-import fetcher classes.
+
+    The fetcher modules pull in Herbie and cfgrib, which are slow to import
+    and only needed once a job actually fetches, so they stay out of this
+    module's import.
+    """
     from app.services.ingestion.aigfs import AIGFSFetcher
     from app.services.ingestion.ecmwf import ECMWFFetcher
     from app.services.ingestion.gfs import GFSFetcher
@@ -145,6 +210,138 @@ def _get_fetchers():
     }
 
 
+def _monitor_point_coords() -> tuple[np.ndarray, np.ndarray]:
+    """Latitudes and longitudes of ``settings.monitor_points`` as arrays.
+
+    Built once per distinct point list rather than on every job, while
+    still following runtime changes to the setting.
+    """
+    return _monitor_point_arrays(tuple(map(tuple, settings.monitor_points)))
+
+
+@functools.lru_cache(maxsize=4)
+def _monitor_point_arrays(
+    points: tuple[tuple[float, float, str], ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    coords = np.array([(lat, lon) for lat, lon, _label in points], dtype=np.float64)
+    # Shared between callers, so keep it read-only
+    coords.setflags(write=False)
+    return coords[:, 0], coords[:, 1]
+
+
+def _close_datasets(datasets: dict[str, object]) -> None:
+    """Close each dataset's backing files so its memory is released on del."""
+    for ds in datasets.values():
+        ds.close()
+
+
+async def _fetch_lead_hour(
+    fetchers: dict, model_names: list[str], init_time: datetime, fhr: int
+) -> dict[str, object]:
+    """Fetch one lead hour from several models concurrently.
+
+    *fetchers* maps model name to a fetcher instance, created once per
+    cycle by the caller.  The downloads are independent and network-bound,
+    so each model's fetch runs in its own worker thread.  All of them are
+    held in memory together for the divergence step anyway, so overlapping
+    them does not raise the peak.  Models that fail or lack the hour are
+    left out.
+
+    Each dataset is ``.load()``-ed in its fetch thread, so any lazily
+    backed GRIB arrays are decoded once here rather than again by every
+    variable's point extraction and regrid.
+    """
+
+    def fetch_loaded(fetcher):
+        ds = fetcher.fetch(init_time, lead_hours=[fhr]).get(fhr)
+        return ds.load() if ds is not None else None
+
+    async def fetch_one(model_name: str):
+        try:
+            return await asyncio.to_thread(fetch_loaded, fetchers[model_name])
+        except Exception:
+            logger.warning("Divergence fetch failed: %s fhr=%d", model_name, fhr)
+            return None
+
+    results = await asyncio.gather(*(fetch_one(m) for m in model_names))
+    return {m: ds for m, ds in zip(model_names, results) if ds is not None}
+
+
+def _process_variable(
+    fhr_datasets: dict[str, object],
+    var: str,
+    fhr: int,
+    point_lats: np.ndarray,
+    point_lons: np.ndarray,
+    cache_dir: Path | None,
+) -> tuple[list[dict], np.ndarray | None, xr.DataArray | None]:
+    """Point metrics and grid divergence for one variable at one lead hour.
+
+    Runs in a worker thread and never touches the DB session.  Returns
+    ``(pairs, spreads)`` from :func:`compute_point_metrics_batch` plus the
+    divergence grid; failed parts come back empty (``[]``/``None``) and are
+    logged.
+    """
+    pairs: list[dict] = []
+    spreads = None
+    try:
+        pairs, spreads = compute_point_metrics_batch(
+            fhr_datasets, var, point_lats, point_lons
+        )
+    except Exception:
+        logger.warning("Point metric failed: fhr=%d var=%s", fhr, var)
+
+    div_grid = None
+    try:
+        div_grid = compute_grid_divergence(fhr_datasets, var, cache_dir=cache_dir)
+    except Exception:
+        logger.warning("Grid divergence failed: fhr=%d var=%s", fhr, var)
+    return pairs, spreads, div_grid
+
+
+def _save_grids(
+    grids: dict[str, xr.DataArray], init_time: datetime, fhr: int
+) -> list[dict]:
+    """Write one lead hour's divergence grids to Zarr (blocking).
+
+    Returns a GridSnapshot row for each store written; failed writes are
+    logged and left out.
+    """
+    init_str = init_time.strftime("%Y%m%d%H")
+    snapshots = []
+    for var, div_grid in grids.items():
+        try:
+            zarr_path = save_divergence_zarr(
+                div_grid, settings.data_store_path, init_str, var, fhr
+            )
+        except Exception:
+            logger.warning("Grid divergence failed: fhr=%d var=%s", fhr, var)
+            continue
+        snapshots.append(
+            {
+                "init_time": init_time,
+                "variable": var,
+                "lead_hour": fhr,
+                "zarr_path": zarr_path,
+                "bbox": divergence_bbox(div_grid),
+            }
+        )
+    return snapshots
+
+
+async def _insert_written_snapshots(db, writes: asyncio.Task | None) -> None:
+    """Wait for a background Zarr write and insert its GridSnapshot rows.
+
+    Rows are only inserted once their store is on disk, so a committed
+    snapshot never points at a missing or half-written Zarr store.
+    """
+    if writes is None:
+        return
+    snapshots = await writes
+    if snapshots:
+        await db.execute(insert(GridSnapshot), snapshots)
+
+
 # ---------------------------------------------------------------------------
 # Ingestion (single model – no cross-model work)
 # ---------------------------------------------------------------------------
@@ -165,17 +362,6 @@ async def ingest_and_process(
     dict or None
         ``{lead_hour: xr.Dataset}`` on success, ``None`` if skipped or failed.
     """
-    from sqlalchemy import select
-
-    from app.database import async_session
-    from app.models import (
-        ModelPointValue,
-        ModelRun,
-        PointMetric,
-        RunStatus,
-    )
-    from app.services.processing.metrics import extract_point
-
     fetchers = _get_fetchers()
     if init_time is None:
         if model_name == "AIGFS":
@@ -187,17 +373,17 @@ async def ingest_and_process(
             init_time = _latest_cycle()
     logger.info("Starting ingestion for %s cycle %s", model_name, init_time)
 
-    async with _ingestion_semaphore:
+    async with _ingestion_lock:
         async with async_session() as db:
-            # Check if already processed
+            # Check if already processed (columns only; no ORM object needed)
             existing_run = (
                 await db.execute(
-                    select(ModelRun).where(
+                    select(ModelRun.id, ModelRun.status).where(
                         ModelRun.model_name == model_name,
                         ModelRun.init_time == init_time,
                     )
                 )
-            ).scalar_one_or_none()
+            ).one_or_none()
 
             if existing_run:
                 if existing_run.status == RunStatus.complete and not force:
@@ -213,23 +399,14 @@ async def ingest_and_process(
                     init_time,
                     existing_run.status.value,
                 )
-                from sqlalchemy import delete as sa_delete
-                from sqlalchemy import or_
-
+                await _delete_point_metrics(db, [existing_run.id])
                 await db.execute(
-                    sa_delete(PointMetric).where(
-                        or_(
-                            PointMetric.run_a_id == existing_run.id,
-                            PointMetric.run_b_id == existing_run.id,
-                        )
-                    )
-                )
-                await db.execute(
-                    sa_delete(ModelPointValue).where(
+                    delete(ModelPointValue).where(
                         ModelPointValue.run_id == existing_run.id,
-                    )
+                    ),
+                    execution_options=_NO_SESSION_SYNC,
                 )
-                await db.delete(existing_run)
+                await db.execute(delete(ModelRun).where(ModelRun.id == existing_run.id))
                 await db.commit()
 
             # Create pending run record
@@ -253,35 +430,45 @@ async def ingest_and_process(
                 run.forecast_hours = sorted(data.keys())
 
                 # Store raw per-model point values at each monitor location.
+                # Rows go in as one executemany INSERT per lead hour rather
+                # than through the unit of work, one statement per row.
                 variables = ["precip", "wind_speed", "mslp", "hgt_500"]
+                point_lats, point_lons = _monitor_point_coords()
+                rows: list[dict] = []
                 for fhr in sorted(data.keys()):
                     ds = data[fhr]
                     for var in variables:
                         if var not in ds:
                             continue
-                        for lat, lon, _label in settings.monitor_points:
-                            try:
-                                value = extract_point(ds, var, lat, lon)
-                                db.add(
-                                    ModelPointValue(
-                                        run_id=run.id,
-                                        variable=var,
-                                        lat=lat,
-                                        lon=lon,
-                                        lead_hour=fhr,
-                                        value=value,
-                                    )
-                                )
-                            except Exception:
-                                pass
-                    # Flush per lead hour to limit session identity-map growth
-                    await db.flush()
+                        # One nearest-cell selection for every monitor point
+                        try:
+                            values = extract_points(
+                                ds, var, point_lats, point_lons
+                            ).tolist()
+                        except Exception:
+                            continue
+                        rows.extend(
+                            {
+                                "run_id": run.id,
+                                "variable": var,
+                                "lat": lat,
+                                "lon": lon,
+                                "lead_hour": fhr,
+                                "value": value,
+                            }
+                            for (lat, lon, _label), value in zip(
+                                settings.monitor_points, values
+                            )
+                        )
+                    if rows:
+                        await db.execute(insert(ModelPointValue), rows)
+                        rows.clear()
 
                 run.status = RunStatus.complete
                 await db.commit()
                 logger.info("%s %s ingestion complete", model_name, init_time)
 
-                _clean_herbie_cache()
+                await asyncio.to_thread(_clean_herbie_cache)
                 gc.collect()
 
                 return data
@@ -305,27 +492,6 @@ async def recompute_cycle_divergence(init_time: datetime | None = None):
     regardless of how many models or hours exist.  Replaces existing
     PointMetric and GridSnapshot rows for the processed hours.
     """
-    from sqlalchemy import delete as sa_delete
-    from sqlalchemy import func, or_, select
-
-    from app.database import async_session
-    from app.models import (
-        GridSnapshot,
-        ModelRun,
-        PointMetric,
-        RunStatus,
-    )
-    from app.services.processing.grid import (
-        compute_grid_divergence,
-        save_divergence_zarr,
-    )
-    from app.services.processing.metrics import (
-        compute_ensemble_spread,
-        compute_pairwise_metrics,
-    )
-
-    fetchers = _get_fetchers()
-
     # ------------------------------------------------------------------
     # 1. Discover which init_time to process
     # ------------------------------------------------------------------
@@ -346,17 +512,13 @@ async def recompute_cycle_divergence(init_time: datetime | None = None):
             return
 
         completed_runs = (
-            (
-                await db.execute(
-                    select(ModelRun).where(
-                        ModelRun.init_time == init_time,
-                        ModelRun.status == RunStatus.complete,
-                    )
+            await db.execute(
+                select(ModelRun.id, ModelRun.model_name, ModelRun.forecast_hours).where(
+                    ModelRun.init_time == init_time,
+                    ModelRun.status == RunStatus.complete,
                 )
             )
-            .scalars()
-            .all()
-        )
+        ).all()
 
     if len(completed_runs) < 2:
         return
@@ -365,16 +527,12 @@ async def recompute_cycle_divergence(init_time: datetime | None = None):
         r.model_name: set(r.forecast_hours) for r in completed_runs
     }
     run_id_lookup: dict[str, int] = {r.model_name: r.id for r in completed_runs}
+    # One fetcher per model, reused for every lead hour of the cycle
+    fetcher_classes = _get_fetchers()
+    fetchers = {name: fetcher_classes[name]() for name in model_hours}
 
     # Which lead hours have 2+ models?
-    all_hours: set[int] = set()
-    for hours in model_hours.values():
-        all_hours |= hours
-    divergence_hours = {
-        h
-        for h in all_hours
-        if sum(1 for hours in model_hours.values() if h in hours) >= 2
-    }
+    divergence_hours = _compute_divergence_hours(model_hours)
     if not divergence_hours:
         return
 
@@ -393,20 +551,13 @@ async def recompute_cycle_divergence(init_time: datetime | None = None):
         hours_list = list(divergence_hours)
 
         if run_ids:
-            await db.execute(
-                sa_delete(PointMetric).where(
-                    or_(
-                        PointMetric.run_a_id.in_(run_ids),
-                        PointMetric.run_b_id.in_(run_ids),
-                    ),
-                    PointMetric.lead_hour.in_(hours_list),
-                )
-            )
+            await _delete_point_metrics(db, run_ids, hours_list)
         await db.execute(
-            sa_delete(GridSnapshot).where(
+            delete(GridSnapshot).where(
                 GridSnapshot.init_time == init_time,
                 GridSnapshot.lead_hour.in_(hours_list),
-            )
+            ),
+            execution_options=_NO_SESSION_SYNC,
         )
         await db.commit()
 
@@ -414,139 +565,150 @@ async def recompute_cycle_divergence(init_time: datetime | None = None):
     # 3. Process one lead hour at a time
     # ------------------------------------------------------------------
     variables = ["precip", "wind_speed", "mslp", "hgt_500"]
+    point_lats, point_lons = _monitor_point_coords()
+    init_str = init_time.strftime("%Y%m%d%H")
+    regrid_root = None
+    if settings.regrid_cache_enabled:
+        # Cycles a day older than this one won't be recomputed again
+        await asyncio.to_thread(
+            prune_regrid_cache, settings.data_store_path, init_time - timedelta(days=1)
+        )
+        regrid_root = settings.data_store_path / "regrid" / init_str
 
-    async with _ingestion_semaphore:
+    async with _ingestion_lock:
         async with async_session() as db:
-            for fhr in sorted(divergence_hours):
-                # Fetch each model's data for just this lead hour
-                fhr_datasets: dict[str, object] = {}
-                for model_name, hours in model_hours.items():
-                    if fhr not in hours:
-                        continue
-                    try:
-                        fetcher = fetchers[model_name]()
-                        fhr_data = await asyncio.to_thread(
-                            fetcher.fetch, init_time, lead_hours=[fhr]
-                        )
-                        if fhr in fhr_data:
-                            fhr_datasets[model_name] = fhr_data[fhr]
-                        del fhr_data
-                    except Exception:
-                        logger.warning(
-                            "Divergence fetch failed: %s fhr=%d", model_name, fhr
-                        )
-                    gc.collect()
+            # The previous lead hour's Zarr writes, left running while the
+            # next hour is fetched; their rows go in with that hour's commit.
+            pending_writes: asyncio.Task | None = None
+            try:
+                for n, fhr in enumerate(sorted(divergence_hours), start=1):
+                    # Fetch each model's data for just this lead hour
+                    fhr_datasets = await _fetch_lead_hour(
+                        fetchers,
+                        [m for m, hours in model_hours.items() if fhr in hours],
+                        init_time,
+                        fhr,
+                    )
+                    await _insert_written_snapshots(db, pending_writes)
+                    pending_writes = None
 
-                if len(fhr_datasets) < 2:
-                    del fhr_datasets
-                    gc.collect()
-                    continue
+                    if len(fhr_datasets) < 2:
+                        _close_datasets(fhr_datasets)
+                        del fhr_datasets
+                        continue
 
-                for var in variables:
-                    # --- Point metrics ---
-                    for lat, lon, label in settings.monitor_points:
-                        try:
-                            pairs = await asyncio.to_thread(
-                                compute_pairwise_metrics,
-                                fhr_datasets,
-                                var,
-                                lat,
-                                lon,
-                            )
-                            spread = await asyncio.to_thread(
-                                compute_ensemble_spread,
+                    # Rows for the whole lead hour go in as one executemany
+                    # INSERT per table instead of one ORM object per row.
+                    pm_batch: list[dict] = []
+                    grids: dict[str, xr.DataArray] = {}
+                    alert_points: dict[str, list[dict]] = {}
+                    # Variables share no data, so each one's metrics and regrid
+                    # run in their own worker thread.
+                    # Divergence needs 2+ models; skip variables fewer models carry
+                    shared_vars = [
+                        var
+                        for var in variables
+                        if sum(var in ds for ds in fhr_datasets.values()) >= 2
+                    ]
+                    cache_dir = regrid_root / f"fhr{fhr:03d}" if regrid_root else None
+                    results = await asyncio.gather(
+                        *(
+                            asyncio.to_thread(
+                                _process_variable,
                                 fhr_datasets,
                                 var,
-                                lat,
-                                lon,
+                                fhr,
+                                point_lats,
+                                point_lons,
+                                cache_dir,
                             )
+                            for var in shared_vars
+                        )
+                    )
+                    for var, (pairs, spreads, div_grid) in zip(shared_vars, results):
+                        if div_grid is not None:
+                            grids[var] = div_grid
+                        if not pairs:
+                            continue
+                        stored_pairs = [
+                            (ra_id, rb_id, pair["rmse"].tolist(), pair["bias"].tolist())
+                            for pair in pairs
+                            if (ra_id := run_id_lookup.get(pair["model_a"]))
+                            and (rb_id := run_id_lookup.get(pair["model_b"]))
+                        ]
+                        for p, (lat, lon, label) in enumerate(settings.monitor_points):
+                            spread = float(spreads[p])
                             latest_rmse = 0.0
                             latest_bias = 0.0
-                            for pair in pairs:
-                                ra_id = run_id_lookup.get(pair["model_a"])
-                                rb_id = run_id_lookup.get(pair["model_b"])
-                                if ra_id and rb_id:
-                                    db.add(
-                                        PointMetric(
-                                            run_a_id=ra_id,
-                                            run_b_id=rb_id,
-                                            variable=var,
-                                            lat=lat,
-                                            lon=lon,
-                                            lead_hour=fhr,
-                                            rmse=pair["rmse"],
-                                            bias=pair["bias"],
-                                            spread=spread,
-                                        )
-                                    )
-                                    latest_rmse = max(latest_rmse, pair["rmse"])
-                                    latest_bias = pair["bias"]
-
-                            if settings.alert_check_enabled and pairs:
-                                from app.services.alerts import check_alerts
-
-                                await check_alerts(
-                                    db,
-                                    var,
-                                    lat,
-                                    lon,
-                                    fhr,
-                                    spread,
-                                    latest_rmse,
-                                    latest_bias,
-                                    location_label=label,
+                            for ra_id, rb_id, rmse, bias in stored_pairs:
+                                pm_batch.append(
+                                    {
+                                        "run_a_id": ra_id,
+                                        "run_b_id": rb_id,
+                                        "variable": var,
+                                        "lat": lat,
+                                        "lon": lon,
+                                        "lead_hour": fhr,
+                                        "rmse": rmse[p],
+                                        "bias": bias[p],
+                                        "spread": spread,
+                                    }
+                                )
+                                latest_rmse = max(latest_rmse, rmse[p])
+                                latest_bias = bias[p]
+
+                            if settings.alert_check_enabled:
+                                alert_points.setdefault(var, []).append(
+                                    {
+                                        "lat": lat,
+                                        "lon": lon,
+                                        "spread": spread,
+                                        "rmse": latest_rmse,
+                                        "bias": latest_bias,
+                                        "location_label": label,
+                                    }
                                 )
+
+                    # Zarr writes overlap the next lead hour's fetch
+                    if grids:
+                        pending_writes = asyncio.create_task(
+                            asyncio.to_thread(_save_grids, grids, init_time, fhr)
+                        )
+                    if pm_batch:
+                        await db.execute(insert(PointMetric), pm_batch)
+
+                    # Alerts run after the insert so consecutive-hour rules see
+                    # this lead hour's metrics in their recent history.
+                    # One rule lookup per variable covers all its points.
+                    for var, points in alert_points.items():
+                        try:
+                            await check_alerts_batch(db, var, fhr, points)
                         except Exception:
                             logger.warning(
-                                "Point metric failed: fhr=%d var=%s",
-                                fhr,
-                                var,
+                                "Alert check failed: fhr=%d var=%s", fhr, var
                             )
 
-                    # --- Grid divergence ---
-                    try:
-                        div_grid = await asyncio.to_thread(
-                            compute_grid_divergence, fhr_datasets, var
-                        )
-                        init_str = init_time.strftime("%Y%m%d%H")
-                        zarr_path = await asyncio.to_thread(
-                            save_divergence_zarr,
-                            div_grid,
-                            settings.data_store_path,
-                            init_str,
-                            var,
-                            fhr,
-                        )
-                        lats = div_grid.coords["latitude"].values
-                        lons = div_grid.coords["longitude"].values
-                        db.add(
-                            GridSnapshot(
-                                init_time=init_time,
-                                variable=var,
-                                lead_hour=fhr,
-                                zarr_path=zarr_path,
-                                bbox={
-                                    "min_lat": float(lats.min()),
-                                    "max_lat": float(lats.max()),
-                                    "min_lon": float(lons.min()),
-                                    "max_lon": float(lons.max()),
-                                },
-                            )
-                        )
-                        del div_grid
-                    except Exception:
-                        logger.warning(
-                            "Grid divergence failed: fhr=%d var=%s",
-                            fhr,
-                            var,
-                        )
+                    # Commit + free per-lead-hour
+                    await db.commit()
+                    _close_datasets(fhr_datasets)
+                    del fhr_datasets
+                    if n % GC_EVERY_N_LEAD_HOURS == 0:
+                        gc.collect()
 
-                # Commit + free per-lead-hour
+                await _insert_written_snapshots(db, pending_writes)
+                pending_writes = None
                 await db.commit()
-                del fhr_datasets
-                gc.collect()
-
-    _clean_herbie_cache()
+            finally:
+                if pending_writes is not None:
+                    # A failed lead hour left the previous hour's Zarr write
+                    # running; let its thread finish and retrieve its result
+                    # so it neither outlives the session nor goes unobserved.
+                    await asyncio.gather(pending_writes, return_exceptions=True)
+
+    gc.collect()
+    # New metrics/snapshots are committed; drop cached summary/snapshot lists.
+    clear_response_caches()
+    await asyncio.to_thread(_clean_herbie_cache)
     logger.info("Divergence computation complete for %s", init_time)
 
 
@@ -0,0 +1,125 @@
+"""StaticFiles subclass used to serve the compiled frontend.
+
+Vite fingerprints everything it emits under ``assets/`` (``index-3f9a1c.js``),
+so those files can be cached by browsers forever.  ``index.html`` and the
+other top-level files keep their names across deploys and must be
+revalidated; content-hash ETags let that revalidation end in a 304 even
+though every image build gives the files a fresh mtime.
+
+The Docker build also writes ``.br`` and ``.gz`` siblings next to the text
+assets; when the client accepts one of those encodings the precompressed
+file is sent as-is, so nothing is compressed per request.
+"""
+
+import hashlib
+import mimetypes
+import os
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Precompressed sibling suffixes, in order of preference.
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    """Return the content codings an ``Accept-Encoding`` header allows."""
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding)
+    return accepted
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with content-hash ETags and long-lived caching of assets.
+
+    The SHA-256 of every file under ``directory`` (and the list of
+    precompressed siblings) is computed once at construction, so the
+    frontend bundle must not change while the app runs.
+    """
+
+    def __init__(self, *, directory: str | os.PathLike[str], **kwargs) -> None:
+        super().__init__(directory=directory, **kwargs)
+        self._root = os.path.realpath(directory)
+        self._etags: dict[str, str] = {}
+        for dirpath, _, filenames in os.walk(self._root):
+            for name in filenames:
+                full_path = os.path.join(dirpath, name)
+                self._etags[full_path] = f'"{_sha256(full_path)}"'
+        self._variants: dict[str, list[tuple[str, str]]] = {}
+        for full_path in self._etags:
+            variants = [
+                (coding, full_path + suffix)
+                for coding, suffix in PRECOMPRESSED_SUFFIXES
+                if full_path + suffix in self._etags
+            ]
+            if variants:
+                self._variants[full_path] = variants
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        full_path = os.path.realpath(full_path)
+        request_headers = Headers(scope=scope)
+        response = None
+        variants = self._variants.get(full_path)
+        if variants:
+            accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+            for coding, variant_path in variants:
+                if coding in accepted:
+                    response = FileResponse(
+                        variant_path,
+                        status_code=status_code,
+                        media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+                        stat_result=os.stat(variant_path),
+                    )
+                    response.headers["content-encoding"] = coding
+                    full_path = variant_path
+                    break
+        if response is None:
+            response = FileResponse(
+                full_path, status_code=status_code, stat_result=stat_result
+            )
+        if variants:
+            response.headers["vary"] = "Accept-Encoding"
+        etag = self._etags.get(full_path)
+        if etag is not None:
+            response.headers["etag"] = etag
+
+        rel_path = os.path.relpath(full_path, self._root).replace(os.sep, "/")
+        response.headers["cache-control"] = (
+            IMMUTABLE_CACHE_CONTROL
+            if rel_path.startswith("assets/")
+            else REVALIDATE_CACHE_CONTROL
+        )
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
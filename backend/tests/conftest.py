@@ -1,46 +1,18 @@
 """Shared pytest fixtures for integration tests.
 
-Patches ``sqlalchemy.dialects.postgresql.ARRAY`` at module-load time so that
-``ModelRun.forecast_hours`` is stored as a JSON text column instead of a
-native PostgreSQL array.  This lets the full ORM + router stack run against
-an in-memory SQLite database with no external services required.
-
-The patch is guarded by a sentinel attribute so it is applied only once per
-Python process even when pytest re-imports the file.
+The ORM models use only column types SQLite understands (``forecast_hours``
+is packed int16 bytes, not a native PostgreSQL array), so the full ORM +
+router stack runs against an in-memory SQLite database with no external
+services required.  The few PostgreSQL-only tests use ``pg_engine`` and are
+skipped unless ``TEST_DATABASE_URL`` is set.
 """
 
-import json
 import os
 
 import pytest
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import Text, TypeDecorator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-# ---------------------------------------------------------------------------
-# Patch ARRAY → JSON-backed TypeDecorator (must run before any app import)
-# ---------------------------------------------------------------------------
-
-
-class _ArrayAsJSON(TypeDecorator):
-    """Stores integer lists as a JSON text string – SQLite-compatible."""
-
-    impl = Text
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        return json.dumps(value) if value is not None else None
-
-    def process_result_value(self, value, dialect):
-        return json.loads(value) if value is not None else None
-
-
-import sqlalchemy.dialects.postgresql as _psql  # noqa: E402
-
-if not getattr(_psql, "_test_array_patched", False):
-    _psql.ARRAY = lambda *args, **kwargs: _ArrayAsJSON()
-    _psql._test_array_patched = True
-
 # Disable the scheduler so importing app.main never tries to connect.
 os.environ.setdefault("SCHEDULER_ENABLED", "false")
 
@@ -50,6 +22,14 @@ os.environ.setdefault("SCHEDULER_ENABLED", "false")
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(autouse=True)
+def _clear_response_caches():
+    """Start every test with empty per-process response caches."""
+    from app.responses import clear_response_caches
+
+    clear_response_caches()
+
+
 @pytest.fixture
 async def db() -> AsyncSession:
     """Yield an AsyncSession backed by a fresh in-memory SQLite database.
@@ -75,6 +55,29 @@ async def db() -> AsyncSession:
     await engine.dispose()
 
 
+@pytest.fixture
+async def pg_engine():
+    """Yield an async engine on the PostgreSQL database at ``TEST_DATABASE_URL``.
+
+    The database must be a throwaway one (CI runs a ``postgres`` service):
+    its ``public`` schema is dropped and recreated empty before each test.
+    Skips the test when the variable is not set.
+    """
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        pytest.skip("TEST_DATABASE_URL (PostgreSQL) not set")
+
+    from sqlalchemy import text
+    from sqlalchemy.pool import NullPool
+
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("DROP SCHEMA public CASCADE"))
+        await conn.execute(text("CREATE SCHEMA public"))
+    yield engine
+    await engine.dispose()
+
+
 @pytest.fixture
 async def http_client(db: AsyncSession):
     """AsyncClient pointed at the FastAPI app with ``get_db`` wired to the
@@ -0,0 +1,296 @@
+"""Tests for the admin router helpers and endpoints."""
+
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from app.models import GridSnapshot, ModelRun, PointMetric, RunStatus
+
+# Disable the scheduler before the app is imported so no cron jobs start.
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
+
+# ---------------------------------------------------------------------------
+# _count_zarr_stores
+# ---------------------------------------------------------------------------
+
+
+def test_count_zarr_stores_counts_nested_stores(tmp_path):
+    """Stores are counted at any depth, but their chunk files are not."""
+    from app.routers.admin import _count_zarr_stores
+
+    for init in ("2024010100", "2024010106"):
+        for fhr in (0, 6):
+            store = tmp_path / init / "precip" / f"fhr{fhr:03d}.zarr"
+            (store / "precip_divergence").mkdir(parents=True)
+            (store / "precip_divergence" / "0.0").write_bytes(b"")
+
+    assert _count_zarr_stores(tmp_path) == 4
+
+
+def test_count_zarr_stores_missing_directory(tmp_path):
+    """A divergence directory that doesn't exist yet counts as zero stores."""
+    from app.routers.admin import _count_zarr_stores
+
+    assert _count_zarr_stores(tmp_path / "divergence") == 0
+
+
+# ---------------------------------------------------------------------------
+# _purge_grib_cache
+# ---------------------------------------------------------------------------
+
+
+def test_purge_grib_cache_only_removes_subset_files(tmp_path):
+    """Nested ``subset_*.grib2`` files are deleted; everything else stays."""
+    from app.routers.admin import _purge_grib_cache
+
+    nested = tmp_path / "gfs" / "20240115"
+    nested.mkdir(parents=True)
+    for d in (tmp_path, nested):
+        (d / "subset_a1b2.grib2").write_bytes(b"")
+    keep = nested / "gfs.t00z.pgrb2.0p25.f000.grib2"
+    keep.write_bytes(b"")
+
+    with patch("app.routers.admin.settings.data_store_path", tmp_path):
+        assert _purge_grib_cache() == 2
+
+    assert keep.exists()
+    assert not list(tmp_path.rglob("subset_*"))
+
+
+# ---------------------------------------------------------------------------
+# DELETE /api/admin/reset
+# ---------------------------------------------------------------------------
+
+
+async def test_reset_clears_tables_and_files(http_client, db, tmp_path):
+    """reset removes every run/metric/snapshot row, the Zarr tree and the
+    GRIB cache, and reports how many rows it removed."""
+    init = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    gfs = ModelRun(
+        model_name="GFS", init_time=init, forecast_hours=[0], status=RunStatus.complete
+    )
+    nam = ModelRun(
+        model_name="NAM", init_time=init, forecast_hours=[0], status=RunStatus.complete
+    )
+    db.add_all([gfs, nam])
+    await db.flush()
+    db.add(
+        PointMetric(
+            run_a_id=gfs.id,
+            run_b_id=nam.id,
+            variable="precip",
+            lat=40.7,
+            lon=-74.0,
+            lead_hour=0,
+            rmse=1.0,
+            bias=1.0,
+            spread=0.7,
+        )
+    )
+    db.add(
+        GridSnapshot(
+            init_time=init,
+            variable="precip",
+            lead_hour=0,
+            zarr_path="/fake.zarr",
+            bbox={},
+        )
+    )
+    await db.commit()
+
+    (tmp_path / "divergence" / "2024011500" / "precip" / "fhr000.zarr").mkdir(
+        parents=True
+    )
+    (tmp_path / "subset_abc.grib2").write_bytes(b"")
+
+    with patch("app.routers.admin.settings.data_store_path", tmp_path):
+        resp = await http_client.delete("/api/admin/reset")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["deleted_runs"] == 2
+    assert body["deleted_metrics"] == 1
+    assert body["deleted_snapshots"] == 1
+    assert body["deleted_cache_files"] == 1
+    assert (await db.execute(select(func.count()).select_from(ModelRun))).scalar() == 0
+    assert list((tmp_path / "divergence").iterdir()) == []
+    assert not (tmp_path / "subset_abc.grib2").exists()
+
+
+async def test_reset_postgres_branch_reports_counts_under_right_keys(
+    http_client, db, tmp_path
+):
+    """The TRUNCATE path maps the pre-truncate counts to the right keys."""
+    from unittest.mock import MagicMock
+
+    init = datetime(2024, 1, 15, tzinfo=timezone.utc)
+    runs = [
+        ModelRun(
+            model_name=name,
+            init_time=init,
+            forecast_hours=[0],
+            status=RunStatus.complete,
+        )
+        for name in ("GFS", "NAM", "HRRR")
+    ]
+    db.add_all(runs)
+    await db.flush()
+    db.add_all(
+        PointMetric(
+            run_a_id=runs[0].id,
+            run_b_id=other.id,
+            variable="precip",
+            lat=40.7,
+            lon=-74.0,
+            lead_hour=0,
+            rmse=1.0,
+            bias=1.0,
+            spread=0.7,
+        )
+        for other in runs[1:]
+    )
+    db.add(
+        GridSnapshot(
+            init_time=init,
+            variable="precip",
+            lead_hour=0,
+            zarr_path="/fake.zarr",
+            bbox={},
+        )
+    )
+    await db.commit()
+
+    execute = db.execute
+    truncates = []
+
+    async def execute_skipping_truncate(stmt, *args, **kwargs):
+        # SQLite has no TRUNCATE; record it instead of running it
+        if str(stmt).startswith("TRUNCATE"):
+            truncates.append(str(stmt))
+            return None
+        return await execute(stmt, *args, **kwargs)
+
+    bind = MagicMock()
+    bind.dialect.name = "postgresql"
+    with (
+        patch("app.routers.admin.settings.data_store_path", tmp_path),
+        patch.object(db, "get_bind", return_value=bind),
+        patch.object(db, "execute", side_effect=execute_skipping_truncate),
+    ):
+        resp = await http_client.delete("/api/admin/reset")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert len(truncates) == 1
+    assert body["deleted_runs"] == 3
+    assert body["deleted_metrics"] == 2
+    assert body["deleted_snapshots"] == 1
+
+
+# ---------------------------------------------------------------------------
+# GET /api/admin/status
+# ---------------------------------------------------------------------------
+
+
+async def test_status_reports_exact_counts_on_sqlite(http_client, db):
+    """Planner estimates are PostgreSQL-only, so SQLite gets exact counts."""
+    db.add(
+        ModelRun(
+            model_name="GFS",
+            init_time=datetime(2024, 1, 15, tzinfo=timezone.utc),
+            forecast_hours=[0, 6],
+            status=RunStatus.complete,
+        )
+    )
+    await db.commit()
+
+    with patch("app.routers.admin._cached_zarr_count", return_value=0):
+        resp = await http_client.get("/api/admin/status")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["runs"] == 1
+    assert body["point_metrics"] == 0
+    assert body["counts_estimated"] is False
+    assert body["recent_runs"][0]["model"] == "GFS"
+
+
+async def test_status_estimates_only_point_metrics(http_client, db):
+    """With a metrics estimate, runs and snapshots are still counted exactly,
+    so a just-cleared run shows up at once."""
+    run = ModelRun(
+        model_name="GFS",
+        init_time=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        forecast_hours=[0, 6],
+        status=RunStatus.complete,
+    )
+    db.add(run)
+    await db.commit()
+    await db.delete(run)
+    await db.commit()
+
+    with (
+        patch("app.routers.admin._cached_zarr_count", return_value=0),
+        patch(
+            "app.routers.admin._estimated_metric_count", return_value=12345
+        ) as estimate,
+    ):
+        resp = await http_client.get("/api/admin/status")
+        exact = await http_client.get("/api/admin/status?exact=true")
+
+    body = resp.json()
+    assert (body["runs"], body["grid_snapshots"]) == (0, 0)
+    assert body["point_metrics"] == 12345
+    assert body["counts_estimated"] is True
+    assert estimate.await_count == 1
+    assert exact.json()["point_metrics"] == 0
+    assert exact.json()["counts_estimated"] is False
+
+
+# ---------------------------------------------------------------------------
+# POST /api/admin/trigger
+# ---------------------------------------------------------------------------
+
+
+async def test_trigger_runs_job_on_queue_worker(http_client):
+    """A trigger is picked up by a queue worker, which ingests the model and
+    recomputes divergence for the cycle."""
+    import asyncio
+
+    from app.services.ingest_queue import IngestionQueue
+
+    queue = IngestionQueue(workers=1, maxsize=4)
+    with (
+        patch("app.routers.admin.ingestion_queue", queue),
+        patch("app.services.scheduler.ingest_and_process") as ingest,
+        patch("app.services.scheduler.recompute_cycle_divergence") as recompute,
+    ):
+        resp = await http_client.post(
+            "/api/admin/trigger",
+            json={"model": "gfs", "init_time": "2024-01-15T06:00:00Z"},
+        )
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+        await queue.stop()
+
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "queued"
+    init = datetime(2024, 1, 15, 6, tzinfo=timezone.utc)
+    ingest.assert_awaited_once_with("GFS", init, force=False)
+    recompute.assert_awaited_once_with(init)
+
+
+async def test_trigger_returns_429_when_queue_full(http_client):
+    from app.services.ingest_queue import IngestionQueue
+
+    # No workers, so nothing drains the single slot.
+    queue = IngestionQueue(workers=0, maxsize=1)
+    with patch("app.routers.admin.ingestion_queue", queue):
+        first = await http_client.post("/api/admin/trigger", json={"model": "NAM"})
+        second = await http_client.post("/api/admin/trigger", json={"model": "NAM"})
+    await queue.stop()
+
+    assert first.status_code == 200
+    assert second.status_code == 429
@@ -0,0 +1,169 @@
+"""Tests for alert rule evaluation (app.services.alerts.check_alerts).
+
+Uses the ``db`` fixture from conftest.py (in-memory SQLite).
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from app.models.alert import AlertEvent, AlertRule
+from app.models.divergence import PointMetric
+from app.models.model_run import ModelRun, RunStatus
+from app.services import alerts
+
+
+def _rule(**kwargs) -> AlertRule:
+    defaults = dict(
+        variable="precip",
+        metric="spread",
+        threshold=2.0,
+        comparison="gt",
+        consecutive_hours=1,
+        enabled=True,
+    )
+    defaults.update(kwargs)
+    return AlertRule(**defaults)
+
+
+async def _add_spreads(db, spreads: list[float]) -> None:
+    """Store metrics at New York; the last spread is the newest."""
+    run_a = ModelRun(
+        model_name="GFS",
+        init_time=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        forecast_hours=[0],
+        status=RunStatus.complete,
+    )
+    run_b = ModelRun(
+        model_name="NAM",
+        init_time=datetime(2024, 1, 15, tzinfo=timezone.utc),
+        forecast_hours=[0],
+        status=RunStatus.complete,
+    )
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    start = datetime.now(tz=timezone.utc) - timedelta(hours=len(spreads))
+    db.add_all(
+        [
+            PointMetric(
+                run_a_id=run_a.id,
+                run_b_id=run_b.id,
+                variable="precip",
+                lat=40.71,
+                lon=-74.01,
+                lead_hour=0,
+                rmse=0.5,
+                bias=0.0,
+                spread=spread,
+                created_at=start + timedelta(hours=i),
+            )
+            for i, spread in enumerate(spreads)
+        ]
+    )
+    await db.commit()
+
+
+async def test_consecutive_rules_share_one_recent_metrics_query(db):
+    """Several consecutive-hours rules are evaluated from a single fetch."""
+    # Newest three spreads exceed 2.0; the fourth-newest does not.
+    await _add_spreads(db, [1.0, 3.0, 3.5, 4.0])
+    two_hours = _rule(consecutive_hours=2)
+    three_hours = _rule(consecutive_hours=3)
+    four_hours = _rule(consecutive_hours=4)
+    db.add_all([two_hours, three_hours, four_hours])
+    await db.commit()
+
+    with patch.object(
+        alerts, "_recent_metric_values", wraps=alerts._recent_metric_values
+    ) as recent:
+        events = await alerts.check_alerts(
+            db, "precip", 40.71, -74.01, 0, spread=4.0, rmse=0.5, bias=0.0
+        )
+
+    assert recent.await_count == 1
+    assert recent.await_args.args[-1] == 4
+    assert {e.rule_id for e in events} == {two_hours.id, three_hours.id}
+
+
+async def test_consecutive_rule_skipped_without_enough_history(db):
+    """A window longer than the stored history never triggers."""
+    await _add_spreads(db, [5.0, 5.0])
+    db.add(_rule(consecutive_hours=3))
+    await db.commit()
+
+    events = await alerts.check_alerts(
+        db, "precip", 40.71, -74.01, 0, spread=5.0, rmse=0.5, bias=0.0
+    )
+    assert events == []
+
+
+async def test_single_hour_rule_does_not_query_history(db):
+    """Rules without a consecutive window never fetch recent metrics."""
+    db.add(_rule(metric="rmse", threshold=1.0, comparison="lt"))
+    await db.commit()
+
+    with patch.object(alerts, "_recent_metric_values") as recent:
+        events = await alerts.check_alerts(
+            db, "precip", 40.71, -74.01, 0, spread=5.0, rmse=0.5, bias=0.0
+        )
+
+    recent.assert_not_called()
+    assert len(events) == 1
+    assert events[0].value == 0.5
+
+
+async def test_webhook_sends_reuse_one_client(httpx_mock, monkeypatch):
+    """Consecutive alert batches post through the same pooled client."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "alert_webhook_url", "https://hooks.test/alert")
+    httpx_mock.add_response(url="https://hooks.test/alert", is_reusable=True)
+    event = AlertEvent(variable="precip", value=3.0, lat=40.71, lon=-74.01)
+
+    try:
+        await alerts._send_webhook([event])
+        client = alerts._webhook_client
+        await alerts._send_webhook([event])
+        assert alerts._webhook_client is client
+    finally:
+        await alerts.close_webhook_client()
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert alerts._webhook_client is None
+
+
+async def test_batch_checks_all_points_with_one_rule_query(db, httpx_mock, monkeypatch):
+    """Every point of a variable is checked from one rule lookup, and all
+    triggered events go out in a single webhook."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "alert_webhook_url", "https://hooks.test/alert")
+    httpx_mock.add_response(url="https://hooks.test/alert")
+    db.add(_rule(threshold=2.0))
+    await db.commit()
+    points = [
+        {"lat": 40.71, "lon": -74.01, "spread": 3.0, "rmse": 0.5, "bias": 0.0},
+        {"lat": 34.05, "lon": -118.24, "spread": 1.0, "rmse": 0.5, "bias": 0.0},
+        {
+            "lat": 41.88,
+            "lon": -87.63,
+            "spread": 4.0,
+            "rmse": 0.5,
+            "bias": 0.0,
+            "location_label": "Chicago",
+        },
+    ]
+
+    try:
+        with patch.object(db, "execute", wraps=db.execute) as execute:
+            events = await alerts.check_alerts_batch(db, "precip", 6, points)
+    finally:
+        await alerts.close_webhook_client()
+
+    assert execute.await_count == 1
+    assert [(e.lat, e.value, e.location_label) for e in events] == [
+        (40.71, 3.0, None),
+        (41.88, 4.0, "Chicago"),
+    ]
+    assert all(e.lead_hour == 6 for e in events)
+    assert len(httpx_mock.get_requests()) == 1
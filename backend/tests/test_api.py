@@ -38,3 +38,41 @@ async def test_variables(client: AsyncClient):
     data = resp.json()
     assert "precip" in data
     assert "wind_speed" in data
+
+
+@pytest.mark.anyio
+async def test_large_json_responses_are_gzipped(client: AsyncClient, monkeypatch):
+    from app.config import settings
+
+    points = [(30.0 + i / 10, -90.0 + i / 10, f"Point {i}") for i in range(100)]
+    monkeypatch.setattr(settings, "monitor_points", points)
+
+    resp = await client.get("/api/monitor-points", headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(resp.json()) == 100
+
+    small = await client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_app_import_defers_heavy_dependencies():
+    """Importing the app must not load xarray/zarr or the scheduler; they are
+    imported by the handlers and jobs that need them."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, app.main; "
+        "print(','.join(m for m in ('xarray', 'zarr', 'apscheduler') "
+        "if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "SCHEDULER_ENABLED": "false"},
+    )
+    assert out.stdout.strip() == ""
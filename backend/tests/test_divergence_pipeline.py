@@ -5,13 +5,19 @@ Covers:
   2+ models (union, not intersection).
 * ``_clear_divergence_for_lead_hours`` – DB cleanup that only deletes the
   specified lead hours while preserving data at other hours.
+* ``_delete_point_metrics`` – removes rows matching either run column.
+* ``recompute_cycle_divergence`` – per-lead-hour bulk inserts and alerts.
 """
 
+import asyncio
 import sys
 from datetime import datetime, timezone
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from sqlalchemy import select
+import numpy as np
+import pytest
+import xarray as xr
+from sqlalchemy import func, select
 
 # Stub apscheduler / herbie so importing the scheduler module works.
 for _pkg in (
@@ -25,6 +31,7 @@ for _pkg in (
 if "herbie" not in sys.modules:
     sys.modules["herbie"] = MagicMock()
 
+from app.models.alert import AlertEvent, AlertRule  # noqa: E402
 from app.models.divergence import (  # noqa: E402
     GridSnapshot,
     ModelPointValue,
@@ -134,6 +141,14 @@ def test_divergence_hours_exact_set():
     assert result == {0, 6, 12}
 
 
+def test_divergence_hours_accepts_hour_sets():
+    """recompute_cycle_divergence passes each model's hours as a set."""
+    from app.services.scheduler import _compute_divergence_hours
+
+    model_hours = {"A": {0, 6, 12}, "B": {0, 6}, "C": {12, 18}}
+    assert _compute_divergence_hours(model_hours) == {0, 6, 12}
+
+
 # ---------------------------------------------------------------------------
 # _clear_divergence_for_lead_hours – DB integration tests
 # ---------------------------------------------------------------------------
@@ -310,3 +325,251 @@ async def test_clear_ignores_other_init_times(db):
 
     gs_result = await db.execute(select(GridSnapshot))
     assert len(gs_result.scalars().all()) == 1, "Other init_time data must survive"
+
+
+async def test_delete_point_metrics_matches_either_run_column(db):
+    """Rows referencing a run as model A or model B are both removed."""
+    from app.services.scheduler import _delete_point_metrics
+
+    runs = [
+        ModelRun(
+            model_name=name,
+            init_time=INIT_TIME,
+            forecast_hours=[0],
+            status=RunStatus.complete,
+        )
+        for name in ("ECMWF", "GFS", "NAM")
+    ]
+    db.add_all(runs)
+    await db.commit()
+    ecmwf, gfs, nam = runs
+    for a, b in ((gfs, nam), (ecmwf, gfs), (ecmwf, nam)):
+        db.add(
+            PointMetric(
+                run_a_id=a.id,
+                run_b_id=b.id,
+                variable="precip",
+                lat=40.0,
+                lon=-74.0,
+                lead_hour=0,
+                rmse=1.0,
+                bias=0.5,
+                spread=2.0,
+            )
+        )
+    await db.commit()
+
+    await _delete_point_metrics(db, [gfs.id])
+    await db.commit()
+
+    remaining = (
+        await db.execute(select(PointMetric.run_a_id, PointMetric.run_b_id))
+    ).all()
+    assert remaining == [(ecmwf.id, nam.id)]
+
+
+# ---------------------------------------------------------------------------
+# recompute_cycle_divergence – bulk inserts per lead hour
+# ---------------------------------------------------------------------------
+
+
+def _field(value: float) -> xr.Dataset:
+    lat = np.arange(38.0, 44.0, 0.5)
+    lon = np.arange(-78.0, -70.0, 0.5)
+    return xr.Dataset(
+        {"precip": (("latitude", "longitude"), np.full((12, 16), value))},
+        coords={"latitude": lat, "longitude": lon},
+    )
+
+
+def _session_cm(db):
+    """Stand-in for ``async_session()`` that yields the test session."""
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=db)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+    return session_cm
+
+
+def _add_complete_runs(db, hours=(0, 6)) -> None:
+    db.add_all(
+        [
+            ModelRun(
+                model_name=name,
+                init_time=INIT_TIME,
+                forecast_hours=list(hours),
+                status=RunStatus.complete,
+            )
+            for name in ("GFS", "NAM")
+        ]
+    )
+
+
+async def test_recompute_bulk_inserts_and_alerts_see_current_hour(
+    db, tmp_path, monkeypatch
+):
+    """Metrics and snapshots are inserted per lead hour without db.add, and
+    consecutive-hour alerts still count the hour just inserted."""
+    from app.config import settings
+    from app.services import scheduler
+
+    _add_complete_runs(db)
+    rule = AlertRule(
+        variable="precip",
+        metric="spread",
+        threshold=1.0,
+        comparison="gt",
+        consecutive_hours=2,
+        enabled=True,
+    )
+    db.add(rule)
+    await db.commit()
+
+    monkeypatch.setattr(settings, "monitor_points", [(40.7128, -74.0060, "NYC")])
+    monkeypatch.setattr(settings, "data_store_path", tmp_path)
+    seen_fetchers = []
+
+    async def fetch_lead_hour(fetchers, model_names, init_time, fhr):
+        seen_fetchers.append(fetchers)
+        return {"GFS": _field(10.0), "NAM": _field(14.0)}
+
+    with (
+        patch("app.services.scheduler.async_session", return_value=_session_cm(db)),
+        patch.object(scheduler, "_fetch_lead_hour", side_effect=fetch_lead_hour),
+        patch.object(scheduler, "_clean_herbie_cache"),
+        patch.object(db, "add", wraps=db.add) as add,
+    ):
+        await scheduler.recompute_cycle_divergence(INIT_TIME)
+
+    assert not [c for c in add.call_args_list if not isinstance(c.args[0], AlertEvent)]
+    # Fetcher instances are built once per cycle, not per lead hour
+    assert len(seen_fetchers) == 2
+    assert seen_fetchers[0] is seen_fetchers[1]
+    assert sorted(seen_fetchers[0]) == ["GFS", "NAM"]
+    metrics = (await db.execute(select(PointMetric.lead_hour, PointMetric.rmse))).all()
+    assert sorted(metrics) == [(0, 4.0), (6, 4.0)]
+    assert await db.scalar(select(func.count()).select_from(GridSnapshot)) == 2
+    # Only fhr 6 has two consecutive exceeding spreads, counting itself
+    events = (await db.execute(select(AlertEvent.lead_hour))).scalars().all()
+    assert events == [6]
+
+
+async def test_recompute_overlaps_zarr_writes_with_next_fetch(
+    db, tmp_path, monkeypatch
+):
+    """fhr 0's Zarr write is still running when fhr 6 is fetched, and its
+    snapshot row is only inserted once the write finishes."""
+    import threading
+
+    from app.config import settings
+    from app.services import scheduler
+    from app.services.processing.grid import save_divergence_zarr
+
+    _add_complete_runs(db)
+    await db.commit()
+    monkeypatch.setattr(settings, "monitor_points", [(40.7128, -74.0060, "NYC")])
+    monkeypatch.setattr(settings, "data_store_path", tmp_path)
+    next_fetch_started = threading.Event()
+    overlapped = []
+
+    def slow_save(div_grid, store_path, init_str, var, fhr):
+        if fhr == 0:
+            overlapped.append(next_fetch_started.wait(timeout=5))
+        return save_divergence_zarr(div_grid, store_path, init_str, var, fhr)
+
+    async def fetch_lead_hour(fetchers, model_names, init_time, fhr):
+        if fhr == 6:
+            next_fetch_started.set()
+        return {"GFS": _field(10.0), "NAM": _field(14.0)}
+
+    with (
+        patch("app.services.scheduler.async_session", return_value=_session_cm(db)),
+        patch.object(scheduler, "_fetch_lead_hour", side_effect=fetch_lead_hour),
+        patch.object(scheduler, "save_divergence_zarr", side_effect=slow_save),
+        patch.object(scheduler, "_clean_herbie_cache"),
+    ):
+        await scheduler.recompute_cycle_divergence(INIT_TIME)
+
+    assert overlapped == [True]
+    snapshots = (await db.execute(select(GridSnapshot.lead_hour))).scalars().all()
+    assert sorted(snapshots) == [0, 6]
+
+
+async def test_recompute_failure_waits_for_pending_zarr_write(
+    db, tmp_path, monkeypatch
+):
+    """If a later lead hour fails, fhr 0's still-running Zarr write is waited
+    for and its own error retrieved, not left as an orphaned task."""
+    import gc
+    import threading
+
+    from app.config import settings
+    from app.services import scheduler
+
+    _add_complete_runs(db)
+    await db.commit()
+    monkeypatch.setattr(settings, "monitor_points", [(40.7128, -74.0060, "NYC")])
+    monkeypatch.setattr(settings, "data_store_path", tmp_path)
+    next_fetch_started = threading.Event()
+    write_finished = threading.Event()
+
+    def failing_save(div_grid, store_path, init_str, var, fhr):
+        next_fetch_started.wait(timeout=5)
+        write_finished.set()
+        raise OSError("disk full")
+
+    async def fetch_lead_hour(fetchers, model_names, init_time, fhr):
+        if fhr == 6:
+            next_fetch_started.set()
+            raise RuntimeError("fetch failed")
+        return {"GFS": _field(10.0), "NAM": _field(14.0)}
+
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    try:
+        with (
+            patch(
+                "app.services.scheduler.async_session",
+                return_value=_session_cm(db),
+            ),
+            patch.object(scheduler, "_fetch_lead_hour", side_effect=fetch_lead_hour),
+            patch.object(scheduler, "save_divergence_zarr", side_effect=failing_save),
+            patch.object(scheduler, "_clean_herbie_cache"),
+            pytest.raises(RuntimeError, match="fetch failed"),
+        ):
+            await scheduler.recompute_cycle_divergence(INIT_TIME)
+
+        assert write_finished.is_set()
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+    assert unhandled == []
+
+
+async def test_recompute_skips_variables_held_by_one_model(db, tmp_path, monkeypatch):
+    """A variable only one model carries is never regridded or stored."""
+    from app.config import settings
+    from app.services import scheduler
+
+    _add_complete_runs(db, hours=(0,))
+    await db.commit()
+    monkeypatch.setattr(settings, "data_store_path", tmp_path)
+    gfs = _field(10.0)
+    gfs["mslp"] = gfs["precip"] + 1000.0
+
+    async def fetch_lead_hour(fetchers, model_names, init_time, fhr):
+        return {"GFS": gfs, "NAM": _field(14.0)}
+
+    with (
+        patch("app.services.scheduler.async_session", return_value=_session_cm(db)),
+        patch.object(scheduler, "_fetch_lead_hour", side_effect=fetch_lead_hour),
+        patch.object(
+            scheduler, "_process_variable", wraps=scheduler._process_variable
+        ) as process,
+        patch.object(scheduler, "_clean_herbie_cache"),
+    ):
+        await scheduler.recompute_cycle_divergence(INIT_TIME)
+
+    assert [c.args[1] for c in process.call_args_list] == ["precip"]
+    variables = (await db.execute(select(GridSnapshot.variable))).scalars().all()
+    assert variables == ["precip"]
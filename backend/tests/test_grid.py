@@ -1,5 +1,7 @@
 """Tests for grid-level divergence computation."""
 
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 import xarray as xr
@@ -42,7 +44,234 @@ def test_compute_grid_divergence():
     assert np.allclose(div.values, 2.0, atol=1e-6)
 
 
+def test_grid_divergence_leaves_collection_to_scheduler():
+    """No full gc.collect() per variable; the scheduler collects periodically."""
+    datasets = {
+        "GFS": _make_grid_dataset("precip", 10.0),
+        "NAM": _make_grid_dataset("precip", 12.0),
+    }
+    with patch("gc.collect") as collect:
+        compute_grid_divergence(datasets, "precip")
+    collect.assert_not_called()
+
+
 def test_divergence_requires_two_models():
     datasets = {"GFS": _make_grid_dataset("precip", 10.0)}
     with pytest.raises(ValueError):
         compute_grid_divergence(datasets, "precip")
+
+
+def test_common_grid_reused_across_calls():
+    """Descending 1-D latitudes (ECMWF) give the same cached common axes."""
+    from app.services.processing.grid import _common_grid
+
+    ascending = _make_grid_dataset("precip", 10.0)
+    descending = ascending.isel(latitude=slice(None, None, -1))
+    _common_grid.cache_clear()
+
+    first = regrid_to_common({"GFS": ascending, "ECMWF": descending}, "precip")
+    second = regrid_to_common({"GFS": ascending, "ECMWF": descending}, "mslp")
+    third = regrid_to_common({"GFS": ascending, "ECMWF": descending}, "precip")
+
+    assert second == {}
+    assert _common_grid.cache_info().hits == 1
+    np.testing.assert_array_equal(
+        first["ECMWF"].latitude.values, np.arange(35.0, 44.75, 0.25)
+    )
+    assert third["GFS"].latitude.values[0] == 35.0
+
+
+def _make_projected_dataset(variable: str, seed: int = 0) -> xr.Dataset:
+    """Random field on a skewed (y, x) grid with 2-D lat/lon coords and NaNs."""
+    rng = np.random.default_rng(seed)
+    y, x = np.meshgrid(np.arange(30.0), np.arange(40.0), indexing="ij")
+    lat = 35.0 + 0.3 * y + 0.05 * x
+    lon = -80.0 + 0.3 * x - 0.05 * y
+    data = rng.normal(size=y.shape)
+    data[rng.random(y.shape) < 0.1] = np.nan
+    da = xr.DataArray(
+        data,
+        coords={"latitude": (("y", "x"), lat), "longitude": (("y", "x"), lon)},
+        dims=["y", "x"],
+    )
+    return xr.Dataset({variable: da})
+
+
+def test_projected_regrid_matches_griddata_nearest():
+    """The k-d tree regrid picks the same nearest valid cells as griddata."""
+    from scipy.interpolate import griddata
+
+    from app.services.processing.grid import _to_regular_grid
+
+    da = _make_projected_dataset("precip")["precip"]
+    # Offset off the source mesh so no target is equidistant from two cells
+    common_lat = np.arange(37.0, 43.0, 0.25) + 0.013
+    common_lon = np.arange(-78.0, -70.0, 0.25) + 0.007
+
+    out = _to_regular_grid(da, common_lat, common_lon)
+
+    vals = da.values.ravel()
+    valid = ~np.isnan(vals)
+    grid_lon, grid_lat = np.meshgrid(common_lon, common_lat)
+    expected = griddata(
+        (da.latitude.values.ravel()[valid], da.longitude.values.ravel()[valid]),
+        vals[valid],
+        (grid_lat, grid_lon),
+        method="nearest",
+    )
+    assert out.dims == ("latitude", "longitude")
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out.values, expected.astype(np.float32))
+
+
+def test_projected_regrid_reuses_nearest_cells_across_lead_hours():
+    """Same grid and NaN mask (next lead hour) skips the k-d tree rebuild."""
+    from scipy.spatial import cKDTree
+
+    from app.services.processing import grid
+
+    da = _make_projected_dataset("precip")["precip"]
+    common_lat = np.arange(37.0, 43.0, 0.25)
+    common_lon = np.arange(-78.0, -70.0, 0.25)
+    grid._nearest_cache.clear()
+
+    with patch("scipy.spatial.cKDTree", wraps=cKDTree) as tree:
+        first = grid._to_regular_grid(da, common_lat, common_lon)
+        # Fresh arrays with equal contents, as refetched for the next hour
+        next_hour = da.copy(deep=True) + 1.0
+        second = grid._to_regular_grid(next_hour, common_lat, common_lon)
+        assert tree.call_count == 1
+        # A different NaN mask needs its own lookup
+        grid._to_regular_grid(
+            _make_projected_dataset("precip", seed=1)["precip"], common_lat, common_lon
+        )
+        assert tree.call_count == 2
+
+    np.testing.assert_allclose(second.values, first.values + 1.0, atol=1e-6)
+
+
+def test_regrid_batches_models_on_shared_axes():
+    """Models on identical 1-D axes regrid together, matching per-model interp."""
+    from app.services.processing import grid
+
+    datasets = {
+        "GFS": _make_grid_dataset("precip", 10.0, offset=0.5),
+        "AIGFS": _make_grid_dataset("precip", 12.0),
+        "NAM": _make_projected_dataset("precip"),
+    }
+    datasets["GFS"]["precip"][:, 3] = np.nan
+
+    with patch.object(
+        grid, "_to_regular_grid", wraps=grid._to_regular_grid
+    ) as to_regular:
+        regridded = regrid_to_common(datasets, "precip", resolution=0.5)
+
+    assert list(regridded) == ["GFS", "AIGFS", "NAM"]
+    # One call for the GFS/AIGFS stack, one for NAM
+    assert to_regular.call_count == 2
+    for name in ("GFS", "AIGFS"):
+        da = datasets[name]["precip"]
+        expected = da.interp(
+            latitude=regridded[name].latitude.values,
+            longitude=regridded[name].longitude.values,
+            method="nearest",
+        )
+        assert "model" not in regridded[name].coords
+        xr.testing.assert_identical(regridded[name], expected)
+
+
+def test_uniform_axes_match_xarray_nearest_interp():
+    """The index-arithmetic path equals interp(method="nearest"), including
+    exact half-cell ties, descending latitudes and out-of-range targets."""
+    from app.services.processing.grid import _to_regular_grid
+
+    ds = _make_grid_dataset("precip", 0.0)
+    ds["precip"].values = np.random.default_rng(5).normal(size=ds["precip"].shape)
+    for da in (ds["precip"], ds["precip"].isel(latitude=slice(None, None, -1))):
+        # 0.125 offsets fall exactly halfway between 0.25° source cells
+        common_lat = np.arange(34.5, 45.5, 0.125)
+        common_lon = np.arange(-80.125, -69.5, 0.375)
+        with patch.object(
+            xr.DataArray, "interp", autospec=True, side_effect=xr.DataArray.interp
+        ) as interp:
+            out = _to_regular_grid(da, common_lat, common_lon)
+        interp.assert_not_called()
+
+        expected = da.interp(
+            latitude=common_lat, longitude=common_lon, method="nearest"
+        )
+        xr.testing.assert_identical(out, expected)
+
+
+def test_grid_divergence_matches_stacked_std_with_nans():
+    """The float32 running (Welford) std matches xarray's skipna std."""
+    rng = np.random.default_rng(3)
+    datasets = {}
+    for name in ("GFS", "NAM", "ECMWF", "HRRR"):
+        ds = _make_grid_dataset("precip", 0.0)
+        values = rng.normal(5.0, 2.0, size=ds["precip"].shape)
+        values[rng.random(values.shape) < 0.3] = np.nan
+        ds["precip"].values = values
+        datasets[name] = ds
+
+    div = compute_grid_divergence(datasets, "precip")
+
+    expected = xr.concat(
+        list(regrid_to_common(datasets, "precip").values()), dim="model"
+    ).std(dim="model", ddof=1)
+    assert div.name == "precip_divergence"
+    assert div.dtype == np.float32
+    np.testing.assert_allclose(div.values, expected.values, rtol=1e-5, atol=1e-5)
+    np.testing.assert_array_equal(div.latitude.values, expected.latitude.values)
+
+
+def test_regrid_cache_memory_maps_later_calls(tmp_path):
+    """A second call on the same common grid loads cached fields, no regrid."""
+    datasets = {
+        "GFS": _make_grid_dataset("precip", 10.0),
+        "NAM": _make_projected_dataset("precip"),
+    }
+    cache_dir = tmp_path / "regrid" / "2024010100" / "fhr006"
+
+    first = compute_grid_divergence(datasets, "precip", cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*_precip_*.npy"))) == 2
+
+    with patch(
+        "app.services.processing.grid._to_regular_grid",
+        side_effect=AssertionError("regridded despite cache"),
+    ):
+        cached = regrid_to_common(datasets, "precip", cache_dir=cache_dir)
+        second = compute_grid_divergence(datasets, "precip", cache_dir=cache_dir)
+
+    assert isinstance(cached["NAM"].variable._data, np.memmap)
+    xr.testing.assert_equal(first, second)
+
+
+def test_prune_regrid_cache_drops_old_cycles(tmp_path):
+    from datetime import datetime
+
+    from app.services.processing.grid import prune_regrid_cache
+
+    for cycle in ("2024010100", "2024010112", "2024010200"):
+        (tmp_path / "regrid" / cycle / "fhr000").mkdir(parents=True)
+
+    prune_regrid_cache(tmp_path, datetime(2024, 1, 1, 12))
+
+    assert sorted(p.name for p in (tmp_path / "regrid").iterdir()) == [
+        "2024010112",
+        "2024010200",
+    ]
+
+
+def test_projected_regrid_leaves_cells_outside_footprint_nan():
+    """Target cells beyond MAX_NEIGHBOUR_DISTANCE of the source grid are NaN."""
+    from app.services.processing.grid import _nearest_cache, _to_regular_grid
+
+    da = _make_projected_dataset("precip")["precip"].fillna(1.0)
+    _nearest_cache.clear()
+
+    # Source longitudes end near -68.75; the last target columns lie past that
+    out = _to_regular_grid(da, np.array([40.0, 41.0]), np.arange(-70.0, -65.0, 1.0))
+
+    assert np.isfinite(out.values[:, :2]).all()
+    assert np.isnan(out.values[:, 3:]).all()
@@ -6,6 +6,7 @@ import xarray as xr
 
 from app.services.processing.grid import (
     compute_grid_divergence,
+    divergence_bbox,
     load_divergence_zarr,
     regrid_to_common,
     save_divergence_zarr,
@@ -57,6 +58,41 @@ def test_zarr_roundtrip_preserves_values(tmp_path):
     )
 
 
+def test_zarr_store_is_tiled_in_fixed_chunks(tmp_path):
+    """Large grids are stored in ZARR_CHUNK tiles; small ones in one chunk."""
+    lat = np.arange(0.0, 75.0, 0.25)  # 300 rows
+    lon = np.arange(0.0, 25.0, 0.25)  # 100 columns
+    big = xr.DataArray(
+        np.zeros((len(lat), len(lon))),
+        coords={"latitude": lat, "longitude": lon},
+        dims=["latitude", "longitude"],
+        name="precip_divergence",
+    )
+    big_path = save_divergence_zarr(big, tmp_path, "2024010100", "precip", 0)
+    small_path = save_divergence_zarr(
+        _divergence_array(), tmp_path, "2024010100", "precip", 6
+    )
+
+    assert load_divergence_zarr(big_path).encoding["chunks"] == (256, 100)
+    assert load_divergence_zarr(small_path).encoding["chunks"] == (12, 12)
+
+
+def test_router_grid_cache_reuses_load_until_store_rewritten(tmp_path):
+    """The /grid loader serves repeat reads from memory but notices rewrites."""
+    from app.routers.divergence import load_divergence_zarr as cached_load
+
+    zarr_path = save_divergence_zarr(
+        _divergence_array(1.0), tmp_path, "2024010100", "precip", 6
+    )
+    first = cached_load(zarr_path)
+    assert cached_load(zarr_path) is first
+
+    save_divergence_zarr(_divergence_array(4.0), tmp_path, "2024010100", "precip", 6)
+    reloaded = cached_load(zarr_path)
+    assert reloaded is not first
+    assert np.allclose(reloaded.values, 4.0)
+
+
 def test_zarr_path_naming_convention(tmp_path):
     """The returned path encodes init_time, variable, and lead_hour."""
     zarr_path = save_divergence_zarr(
@@ -75,6 +111,17 @@ def test_zarr_lead_hour_zero_padded(tmp_path):
     assert zarr_path.endswith("fhr006.zarr")
 
 
+def test_divergence_bbox_handles_descending_axes():
+    """The bbox comes from axis endpoints in either order."""
+    da = _divergence_array().isel(latitude=slice(None, None, -1))
+    assert divergence_bbox(da) == {
+        "min_lat": 35.0,
+        "max_lat": 37.75,
+        "min_lon": -80.0,
+        "max_lon": -77.25,
+    }
+
+
 # ---------------------------------------------------------------------------
 # regrid_to_common – edge cases
 # ---------------------------------------------------------------------------
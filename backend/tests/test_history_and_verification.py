@@ -98,6 +98,322 @@ async def test_divergence_history_returns_bucketed_data(http_client, db):
     assert total_mean == pytest.approx(4.0, abs=0.01)
 
 
+async def test_divergence_history_groups_by_hour(http_client, db):
+    """Each hour bucket is averaged separately and returned in order."""
+    from datetime import timedelta
+
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    hour = datetime.now(tz=timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=3)
+    db.add_all(
+        [
+            _metric(run_a.id, run_b.id, spread=1.0, created_at=hour),
+            _metric(run_a.id, run_b.id, spread=3.0, created_at=hour.replace(minute=40)),
+            _metric(
+                run_a.id, run_b.id, spread=5.0, created_at=hour + timedelta(hours=1)
+            ),
+            # Outside the window
+            _metric(
+                run_a.id, run_b.id, spread=99.0, created_at=hour - timedelta(days=3)
+            ),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get("/api/divergence/history?variable=precip")
+    assert resp.status_code == 200
+    assert resp.json()["points"] == [
+        {"timestamp": hour.strftime("%Y-%m-%dT%H:00:00"), "mean_spread": 2.0},
+        {
+            "timestamp": (hour + timedelta(hours=1)).strftime("%Y-%m-%dT%H:00:00"),
+            "mean_spread": 5.0,
+        },
+    ]
+
+
+async def test_divergence_history_buckets_in_utc_on_postgres(pg_engine):
+    """A +05:30 session time zone doesn't split a UTC hour into two buckets."""
+    import json
+    from datetime import timedelta
+
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.database import migrate_schema
+    from app.routers.divergence import get_spread_history
+
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+
+    hour = datetime.now(tz=timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    ) - timedelta(hours=2)
+    async with AsyncSession(pg_engine, expire_on_commit=False) as db:
+        await db.execute(text("SET TIME ZONE 'Asia/Kolkata'"))
+        run_a = _run(model_name="GFS")
+        run_b = _run(model_name="NAM")
+        db.add_all([run_a, run_b])
+        await db.flush()
+        # 10 and 50 past the UTC hour fall in different +05:30 local hours
+        db.add_all(
+            [
+                _metric(
+                    run_a.id, run_b.id, spread=2.0, created_at=hour.replace(minute=10)
+                ),
+                _metric(
+                    run_a.id, run_b.id, spread=4.0, created_at=hour.replace(minute=50)
+                ),
+            ]
+        )
+        await db.flush()
+
+        resp = await get_spread_history(
+            variable="precip", hours_back=48, lat=None, lon=None, db=db
+        )
+
+    assert json.loads(resp.body)["points"] == [
+        {"timestamp": hour.strftime("%Y-%m-%dT%H:00:00"), "mean_spread": 3.0}
+    ]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/divergence/regional
+# ---------------------------------------------------------------------------
+
+
+async def test_regional_divergence_latest_metric_per_monitor(
+    http_client, db, monkeypatch
+):
+    """Each monitor gets its newest matching metric; unmatched ones get nulls."""
+    from datetime import timedelta
+
+    from app.config import settings
+
+    monkeypatch.setattr(
+        settings,
+        "monitor_points",
+        [(40.7128, -74.0060, "New York"), (34.0522, -118.2437, "Los Angeles")],
+    )
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    now = datetime.now(tz=timezone.utc)
+    db.add_all(
+        [
+            _metric(
+                run_a.id, run_b.id, spread=1.0, created_at=now - timedelta(hours=2)
+            ),
+            _metric(run_a.id, run_b.id, spread=3.0, rmse=0.3, bias=0.1, created_at=now),
+            # Different lead hour / variable are ignored
+            _metric(run_a.id, run_b.id, spread=9.0, lead_hour=6, created_at=now),
+            _metric(run_a.id, run_b.id, spread=9.0, variable="mslp", created_at=now),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get("/api/divergence/regional?variable=precip")
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {
+            "lat": 40.7128,
+            "lon": -74.0060,
+            "label": "New York",
+            "spread": 3.0,
+            "rmse": 0.3,
+            "bias": 0.1,
+        },
+        {
+            "lat": 34.0522,
+            "lon": -118.2437,
+            "label": "Los Angeles",
+            "spread": None,
+            "rmse": None,
+            "bias": None,
+        },
+    ]
+
+
+async def test_regional_divergence_matches_neighbouring_cells(
+    http_client, db, monkeypatch
+):
+    """Metrics inside the ±0.5° box but in another geo_bucket cell still match."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "monitor_points", [(40.7128, -74.0060, "New York")])
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    # 40.7128 is in the [40.5, 41.0) cell; 41.1 is in the next one.
+    db.add(_metric(run_a.id, run_b.id, lat=41.1, lon=-74.3, spread=4.5))
+    await db.commit()
+
+    resp = await http_client.get("/api/divergence/regional?variable=precip")
+    assert resp.status_code == 200
+    [point] = resp.json()
+    assert point["label"] == "New York"
+    assert point["spread"] == 4.5
+
+
+async def test_regional_divergence_newest_metric_from_later_bucket(
+    http_client, db, monkeypatch
+):
+    """The newest metric wins even when it sits in the point's last bucket.
+
+    Every bucket without a match must not outrank it; PostgreSQL sorts NULLs
+    first under DESC, so unmatched bucket rows may never enter the ranking.
+    """
+    from datetime import timedelta
+
+    from app.config import settings
+
+    monkeypatch.setattr(
+        settings,
+        "monitor_points",
+        [(40.7128, -74.0060, "New York"), (34.0522, -118.2437, "Los Angeles")],
+    )
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    now = datetime.now(tz=timezone.utc)
+    db.add_all(
+        [
+            # The [40.5, 41.0) x [-74.5, -74.0) cell, an hour old
+            _metric(
+                run_a.id,
+                run_b.id,
+                lat=40.6,
+                lon=-74.2,
+                spread=1.0,
+                created_at=now - timedelta(hours=1),
+            ),
+            # The last of New York's nine cells: [41.0, 41.5) x [-74.0, -73.5)
+            _metric(
+                run_a.id,
+                run_b.id,
+                lat=41.15,
+                lon=-73.6,
+                spread=2.5,
+                rmse=0.7,
+                bias=-0.2,
+                created_at=now,
+            ),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get("/api/divergence/regional?variable=precip")
+    assert resp.status_code == 200
+    new_york, los_angeles = resp.json()
+    assert (new_york["spread"], new_york["rmse"], new_york["bias"]) == (
+        2.5,
+        0.7,
+        -0.2,
+    )
+    assert los_angeles["label"] == "Los Angeles"
+    assert los_angeles["spread"] is None
+
+
+# ---------------------------------------------------------------------------
+# GET /api/divergence/decomposition
+# ---------------------------------------------------------------------------
+
+
+async def test_decomposition_names_both_models_of_each_pair(http_client, db):
+    """Pairs carry both run model names; the newest metric per pair wins."""
+    from datetime import timedelta
+
+    gfs = _run(model_name="GFS")
+    nam = _run(model_name="NAM")
+    ecmwf = _run(model_name="ECMWF")
+    db.add_all([gfs, nam, ecmwf])
+    await db.commit()
+
+    now = datetime.now(tz=timezone.utc)
+    db.add_all(
+        [
+            _metric(gfs.id, nam.id, spread=2.0, rmse=1.0, bias=0.5, created_at=now),
+            _metric(
+                nam.id,
+                gfs.id,
+                spread=7.0,
+                rmse=9.0,
+                bias=9.0,
+                created_at=now - timedelta(hours=1),
+            ),
+            _metric(ecmwf.id, gfs.id, spread=2.0, rmse=1.5, bias=-0.25, created_at=now),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get(
+        "/api/divergence/decomposition?variable=precip&lat=40.71&lon=-74.01"
+    )
+    assert resp.status_code == 200
+    [hour] = resp.json()
+    assert hour["lead_hour"] == 0
+    assert hour["total_spread"] == 2.0
+    assert sorted(hour["pairs"], key=lambda p: p["model_a"]) == [
+        {"model_a": "ECMWF", "model_b": "GFS", "rmse": 1.5, "bias": -0.25},
+        {"model_a": "GFS", "model_b": "NAM", "rmse": 1.0, "bias": 0.5},
+    ]
+
+
+# ---------------------------------------------------------------------------
+# GET /api/divergence/model-values
+# ---------------------------------------------------------------------------
+
+
+async def test_model_values_returns_every_variable_of_latest_run(http_client, db):
+    """Each model contributes all rows of its newest run at the point."""
+    gfs_old = _run(model_name="GFS", init_time=_utc(2024, 1, 15, 0))
+    gfs_new = _run(model_name="GFS", init_time=_utc(2024, 1, 15, 6))
+    nam = _run(model_name="NAM", init_time=_utc(2024, 1, 15, 0))
+    db.add_all([gfs_old, gfs_new, nam])
+    await db.commit()
+
+    db.add_all(
+        [
+            _mpv(gfs_old.id, lead_hour=6, value=1.0),
+            _mpv(gfs_new.id, lead_hour=6, value=2.0),
+            _mpv(gfs_new.id, lead_hour=6, variable="mslp", value=1012.0),
+            _mpv(nam.id, lead_hour=6, value=3.0),
+            # Other lead hour is ignored
+            _mpv(nam.id, lead_hour=12, value=9.0),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get(
+        "/api/divergence/model-values?lat=40.71&lon=-74.01&lead_hour=6"
+    )
+    assert resp.status_code == 200
+    got = sorted((v["model_name"], v["variable"], v["value"]) for v in resp.json())
+    assert got == [
+        ("GFS", "mslp", 1012.0),
+        ("GFS", "precip", 2.0),
+        ("NAM", "precip", 3.0),
+    ]
+
+    resp = await http_client.get(
+        "/api/divergence/model-values?lat=40.71&lon=-74.01&lead_hour=6&variable=precip"
+    )
+    assert sorted((v["model_name"], v["value"]) for v in resp.json()) == [
+        ("GFS", 2.0),
+        ("NAM", 3.0),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # GET /api/verification/scores
 # ---------------------------------------------------------------------------
@@ -177,3 +493,45 @@ async def test_verification_scores_filters_by_model(http_client, db):
     assert len(body["scores"]) == 1
     assert body["scores"][0]["model_name"] == "NAM"
     assert body["scores"][0]["mae"] == pytest.approx(3.0, abs=0.01)
+
+
+async def test_verification_scores_groups_by_model_and_lead_hour(http_client, db):
+    """Errors are matched on valid time and averaged per (model, lead_hour)."""
+    gfs_00 = _run(model_name="GFS", init_time=_utc(2024, 1, 15, 0))
+    gfs_06 = _run(model_name="GFS", init_time=_utc(2024, 1, 15, 6))
+    gfs_12 = _run(model_name="GFS", init_time=_utc(2024, 1, 15, 12))
+    nam_00 = _run(model_name="NAM", init_time=_utc(2024, 1, 15, 0))
+    nam_06 = _run(model_name="NAM", init_time=_utc(2024, 1, 15, 6))
+    db.add_all([gfs_00, gfs_06, gfs_12, nam_00, nam_06])
+    await db.commit()
+
+    db.add_all(
+        [
+            # Analyses
+            _mpv(gfs_06.id, lead_hour=0, value=8.0),
+            _mpv(gfs_12.id, lead_hour=0, value=4.0),
+            _mpv(nam_06.id, lead_hour=0, value=1.0),
+            # GFS +6h: errors +2 (00Z->06Z) and -3 (06Z->12Z)
+            _mpv(gfs_00.id, lead_hour=6, value=10.0),
+            _mpv(gfs_06.id, lead_hour=6, value=1.0),
+            # GFS +12h: error -1 (00Z->12Z)
+            _mpv(gfs_00.id, lead_hour=12, value=3.0),
+            # NAM +6h: error +0.5; its +12h has no analysis and is skipped
+            _mpv(nam_00.id, lead_hour=6, value=1.5),
+            _mpv(nam_00.id, lead_hour=12, value=7.0),
+        ]
+    )
+    await db.commit()
+
+    resp = await http_client.get(
+        "/api/verification/scores?lat=40.71&lon=-74.01&variable=precip"
+    )
+    assert resp.status_code == 200
+    assert [
+        (s["model_name"], s["lead_hour"], s["mae"], s["bias"], s["n_samples"])
+        for s in resp.json()["scores"]
+    ] == [
+        ("GFS", 6, 2.5, -0.5, 2),
+        ("GFS", 12, 1.0, -1.0, 1),
+        ("NAM", 6, 0.5, 0.5, 1),
+    ]
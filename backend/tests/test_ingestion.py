@@ -149,6 +149,91 @@ def test_nam_fetches_requested_variable():
     assert float(result[0]["hgt_500"].values.mean()) == pytest.approx(5500.0)
 
 
+# ---------------------------------------------------------------------------
+# RRFSFetcher
+# ---------------------------------------------------------------------------
+
+
+def test_rrfs_fetches_lead_hours_concurrently_in_order():
+    """Each lead hour gets its own Herbie; results come back sorted by fhr."""
+    from app.services.ingestion.rrfs import RRFSFetcher
+
+    def herbie_factory(*args, fxx, **kwargs):
+        return _herbie_for({":MSLET:": _ds("mslp", 100000.0 + fxx)})
+
+    with patch(
+        "app.services.ingestion.rrfs.Herbie", side_effect=herbie_factory
+    ) as herbie:
+        result = RRFSFetcher().fetch(
+            INIT_TIME, variables=["mslp"], lead_hours=[0, 6, 12, 18]
+        )
+
+    assert herbie.call_count == 4
+    assert list(result) == [0, 6, 12, 18]
+    assert float(result[12]["mslp"].values.mean()) == pytest.approx(100012.0)
+
+
+def test_rrfs_fetches_variable_subsets_in_parallel():
+    """Wind components and other variables are all fetched from one Herbie."""
+    from app.services.ingestion.rrfs import RRFSFetcher
+
+    herbie_inst = _herbie_for(
+        {
+            ":UGRD:": _ds("u10", 3.0),
+            ":VGRD:": _ds("v10", 4.0),
+            ":HGT:": _ds("gh", 5500.0),
+        }
+    )
+    with patch("app.services.ingestion.rrfs.Herbie", return_value=herbie_inst):
+        result = RRFSFetcher().fetch(
+            INIT_TIME, variables=["wind_speed", "hgt_500"], lead_hours=[0]
+        )
+
+    assert herbie_inst.xarray.call_count == 3
+    assert list(result[0].data_vars) == ["wind_speed", "hgt_500"]
+    assert np.allclose(result[0]["wind_speed"].values, 5.0)
+
+
+def test_rrfs_mslp_search_follows_grib_index():
+    """MSLP is fetched as PRMSL when that is what the file's index lists."""
+    import pandas as pd
+
+    from app.services.ingestion.rrfs import RRFSFetcher
+
+    herbie_inst = _herbie_for({":PRMSL:": _ds("prmsl", 101000.0)})
+    herbie_inst.inventory.return_value = pd.DataFrame(
+        {
+            "search_this": [
+                ":HGT:500 mb:6 hour fcst",
+                ":PRMSL:mean sea level:6 hour fcst",
+            ]
+        }
+    )
+    with patch("app.services.ingestion.rrfs.Herbie", return_value=herbie_inst):
+        result = RRFSFetcher().fetch(INIT_TIME, variables=["mslp"], lead_hours=[6])
+
+    herbie_inst.xarray.assert_called_once_with(":PRMSL:mean sea level")
+    assert float(result[6]["mslp"].values.mean()) == pytest.approx(101000.0)
+
+
+def test_rrfs_failed_lead_hour_is_skipped():
+    """A worker that raises drops only its own lead hour."""
+    from app.services.ingestion.rrfs import RRFSFetcher
+
+    def herbie_factory(*args, fxx, **kwargs):
+        h = MagicMock()
+        if fxx == 6:
+            h.xarray.side_effect = RuntimeError("timeout")
+        else:
+            h.xarray.return_value = _ds("mslp", 101000.0)
+        return h
+
+    with patch("app.services.ingestion.rrfs.Herbie", side_effect=herbie_factory):
+        result = RRFSFetcher().fetch(INIT_TIME, variables=["mslp"], lead_hours=[0, 6])
+
+    assert list(result) == [0]
+
+
 # ---------------------------------------------------------------------------
 # ECMWFFetcher (ecmwf-opendata / IFS)
 # ---------------------------------------------------------------------------
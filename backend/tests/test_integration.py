@@ -19,7 +19,7 @@ import pytest
 import xarray as xr
 from sqlalchemy import select
 
-from app.models.divergence import GridSnapshot, PointMetric
+from app.models.divergence import GridSnapshot, PointMetric, geo_bucket, near
 from app.models.model_run import ModelRun, RunStatus
 
 # ---------------------------------------------------------------------------
@@ -90,7 +90,7 @@ async def test_model_run_insert_and_retrieve(db):
 
 
 async def test_forecast_hours_list_round_trip(db):
-    """forecast_hours (stored as JSON via ARRAY patch) is retrieved as a list."""
+    """forecast_hours (stored as packed int16 bytes) is retrieved as a list."""
     hours = [0, 6, 12, 24, 48, 72]
     run = _run(forecast_hours=hours)
     db.add(run)
@@ -100,6 +100,25 @@ async def test_forecast_hours_list_round_trip(db):
     assert result.scalar_one().forecast_hours == hours
 
 
+async def test_forecast_hours_packed_as_int16(db):
+    """forecast_hours is stored as two bytes per lead hour; [] round-trips."""
+    from sqlalchemy import text
+
+    full = _run(forecast_hours=[0, 6, 384])
+    empty = _run(model_name="NAM", forecast_hours=[])
+    db.add_all([full, empty])
+    await db.commit()
+
+    raw = (
+        await db.execute(
+            text("SELECT forecast_hours FROM model_runs WHERE model_name = 'GFS'")
+        )
+    ).scalar_one()
+    assert raw == b"\x00\x00\x00\x06\x01\x80"
+    await db.refresh(empty)
+    assert empty.forecast_hours == []
+
+
 async def test_model_run_status_defaults_to_pending(db):
     """Status defaults to 'pending' when not supplied at insert time."""
     run = ModelRun(
@@ -132,6 +151,49 @@ async def test_point_metric_fk_references_stored_correctly(db):
     assert fetched.variable == "precip"
 
 
+async def test_point_metric_geo_bucket_matches_python(db):
+    """The generated geo_bucket column agrees with geo_bucket() on cell edges."""
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    coords = [(40.71, -74.01), (-33.5, 151.0), (0.0, -0.25), (-0.01, 179.99)]
+    db.add_all([_metric(run_a.id, run_b.id, lat=lat, lon=lon) for lat, lon in coords])
+    await db.commit()
+
+    rows = (
+        await db.execute(
+            select(PointMetric.lat, PointMetric.lon, PointMetric.geo_bucket)
+        )
+    ).all()
+    assert {(r.lat, r.lon): r.geo_bucket for r in rows} == {
+        c: geo_bucket(*c) for c in coords
+    }
+
+
+async def test_near_matches_bounding_box(db):
+    """near() keeps exactly the rows inside the ±0.5° box, across cells."""
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    db.add_all([run_a, run_b])
+    await db.commit()
+
+    inside = [(0.5, -0.5), (-0.5, 0.5), (0.2, 0.0)]
+    outside = [(0.51, 0.0), (0.0, -0.51), (1.0, 1.0)]
+    db.add_all(
+        [_metric(run_a.id, run_b.id, lat=lat, lon=lon) for lat, lon in inside + outside]
+    )
+    await db.commit()
+
+    rows = (
+        await db.execute(
+            select(PointMetric.lat, PointMetric.lon).where(near(PointMetric, 0.0, 0.0))
+        )
+    ).all()
+    assert sorted((r.lat, r.lon) for r in rows) == sorted(inside)
+
+
 async def test_grid_snapshot_bbox_json_round_trip(db):
     """GridSnapshot.bbox dict is stored as JSON and retrieved as a dict."""
     bbox = {"min_lat": 25.0, "max_lat": 50.0, "min_lon": -125.0, "max_lon": -65.0}
@@ -244,6 +306,48 @@ async def test_get_runs_since_filter(http_client, db):
 # --- /api/divergence/point ---
 
 
+async def test_get_run_metrics_streams_all_rows(http_client, db, monkeypatch):
+    """Run metrics stream as one JSON array across several row partitions."""
+    import app.responses
+
+    monkeypatch.setattr(app.responses, "_STREAM_ROWS", 2)
+    run_a = _run(model_name="GFS")
+    run_b = _run(model_name="NAM")
+    other = _run(model_name="ECMWF")
+    idle = _run(model_name="HRRR")
+    db.add_all([run_a, run_b, other, idle])
+    await db.commit()
+
+    db.add_all(
+        [_metric(run_a.id, run_b.id, lead_hour=fhr) for fhr in (12, 0, 6, 18, 24)]
+        + [_metric(other.id, run_b.id)]
+    )
+    await db.commit()
+
+    resp = await http_client.get(f"/api/runs/{run_a.id}/metrics")
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [m["lead_hour"] for m in data] == [0, 6, 12, 18, 24]
+    assert data[0]["run_a_id"] == str(run_a.id)
+    assert set(data[0]) == {
+        "id",
+        "run_a_id",
+        "run_b_id",
+        "variable",
+        "lat",
+        "lon",
+        "lead_hour",
+        "rmse",
+        "bias",
+        "spread",
+        "created_at",
+    }
+
+    empty = await http_client.get(f"/api/runs/{idle.id}/metrics")
+    assert empty.status_code == 200
+    assert empty.json() == []
+
+
 async def test_get_point_divergence_returns_metric(http_client, db):
     """Point divergence metrics are returned when the query coordinates match."""
     run_a = _run(model_name="GFS")
@@ -460,3 +564,32 @@ async def test_get_grid_divergence_returns_full_response(http_client, db):
     assert len(body["longitudes"]) == len(lon)
     assert len(body["values"]) == len(lat)
     assert body["bbox"] == snap.bbox
+
+
+# --- /api/alerts list endpoints (orjson, no response_model validation) ---
+
+
+async def test_list_alert_rules_matches_schema_serialisation(http_client, db):
+    """The orjson list payload is identical to what AlertRuleOut would emit."""
+    from app.models.alert import AlertRule
+    from app.schemas.alert import AlertRuleOut
+
+    rule = AlertRule(
+        variable="precip",
+        lat=40.7,
+        lon=-74.0,
+        location_label="New York",
+        metric="spread",
+        threshold=2.5,
+        comparison="gt",
+        consecutive_hours=1,
+        enabled=True,
+        created_at=_utc(2024, 1, 15, 6),
+    )
+    db.add(rule)
+    await db.commit()
+
+    resp = await http_client.get("/api/alerts/rules")
+
+    assert resp.status_code == 200
+    assert resp.json() == [AlertRuleOut.model_validate(rule).model_dump(mode="json")]
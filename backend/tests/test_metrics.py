@@ -1,11 +1,14 @@
 """Tests for point-level divergence metrics."""
 
+from unittest.mock import patch
+
 import numpy as np
 import xarray as xr
 
 from app.services.processing.metrics import (
     compute_ensemble_spread,
     compute_pairwise_metrics,
+    compute_point_metrics_batch,
     extract_point,
 )
 
@@ -34,6 +37,44 @@ def test_extract_point_nearest():
     assert val == 5.0
 
 
+def _make_projected_dataset(variable: str) -> xr.Dataset:
+    """Dataset on a skewed (y, x) grid with 2-D latitude/longitude coords."""
+    y, x = np.meshgrid(np.arange(4.0), np.arange(5.0), indexing="ij")
+    lat = 39.0 + 0.5 * y + 0.1 * x
+    lon = -76.0 + 0.5 * x - 0.1 * y
+    da = xr.DataArray(
+        10 * y + x,
+        coords={"latitude": (("y", "x"), lat), "longitude": (("y", "x"), lon)},
+        dims=["y", "x"],
+    )
+    return xr.Dataset({variable: da, "other": da + 100})
+
+
+def test_extract_point_projected_grid_reuses_tree():
+    """One tree per grid, shared across variables and datasets, not in attrs."""
+    from scipy.spatial import cKDTree
+
+    from app.services.processing import metrics
+
+    ds = _make_projected_dataset("precip")
+    metrics._kdtree_cache.clear()
+
+    with patch("scipy.spatial.cKDTree", wraps=cKDTree) as tree:
+        # Nearest cell to (40.1, -75.1) is y=2, x=2 (lat 40.2, lon -75.2)
+        assert extract_point(ds, "precip", 40.1, -75.1) == 22.0
+        assert extract_point(ds, "other", 39.0, -76.0) == 100.0
+        # The next lead hour's dataset on the same grid
+        assert extract_point(ds.copy(deep=True), "precip", 39.0, -76.0) == 0.0
+        assert tree.call_count == 1
+
+        # Same size, different grid: its own tree (nearest is now y=0, x=2)
+        shifted = ds.assign_coords(latitude=ds.latitude + 1.0)
+        assert extract_point(shifted, "precip", 40.1, -75.1) == 2.0
+        assert tree.call_count == 2
+
+    assert ds.attrs == {}
+
+
 def test_pairwise_metrics():
     datasets = {
         "GFS": _make_dataset("precip", 10.0),
@@ -50,6 +91,18 @@ def test_pairwise_metrics():
     assert eg["bias"] == -2.0
 
 
+def test_pairwise_metrics_skip_models_without_variable():
+    datasets = {
+        "GFS": _make_dataset("precip", 10.0),
+        "HRRR": _make_dataset("mslp", 101000.0),
+        "NAM": _make_dataset("precip", 12.0),
+    }
+    results = compute_pairwise_metrics(datasets, "precip", 40.0, -74.0)
+    assert [(r["model_a"], r["model_b"]) for r in results] == [("GFS", "NAM")]
+    assert results[0]["val_a"] == 10.0
+    assert results[0]["val_b"] == 12.0
+
+
 def test_ensemble_spread():
     datasets = {
         "GFS": _make_dataset("mslp", 101300.0),
@@ -65,3 +118,48 @@ def test_spread_single_model():
     datasets = {"GFS": _make_dataset("precip", 5.0)}
     spread = compute_ensemble_spread(datasets, "precip", 40.0, -74.0)
     assert spread == 0.0
+
+
+def test_spread_skips_models_missing_at_point():
+    datasets = {
+        "GFS": _make_dataset("mslp", 101300.0),
+        "NAM": _make_dataset("mslp", np.nan),
+        "ECMWF": _make_dataset("mslp", 101100.0),
+        "HRRR": _make_dataset("precip", 5.0),
+    }
+    spread = compute_ensemble_spread(datasets, "mslp", 40.0, -74.0)
+    # std of [101300, 101100] with ddof=1
+    assert abs(spread - 141.4213562) < 1e-6
+
+
+def test_point_metrics_batch_matches_per_point_functions():
+    """The all-points call agrees with the per-point metric functions."""
+    rng = np.random.default_rng(7)
+    gfs = _make_dataset("precip", 0.0)
+    gfs["precip"].values = rng.normal(size=(3, 3))
+    nam = _make_dataset("precip", 0.0)
+    nam["precip"].values = rng.normal(size=(3, 3))
+    nam["precip"].values[0, 0] = np.nan
+    datasets = {
+        "NAM": nam,
+        "GFS": gfs,
+        "HRRR": _make_projected_dataset("precip"),
+        "ECMWF": _make_dataset("mslp", 101300.0),
+    }
+    lats = np.array([39.0, 40.1, 41.0, 39.6])
+    lons = np.array([-75.0, -73.9, -73.0, -75.6])
+
+    pairs, spread = compute_point_metrics_batch(datasets, "precip", lats, lons)
+
+    assert [(p["model_a"], p["model_b"]) for p in pairs] == [
+        ("GFS", "HRRR"),
+        ("GFS", "NAM"),
+        ("HRRR", "NAM"),
+    ]
+    for k, (lat, lon) in enumerate(zip(lats, lons)):
+        single = compute_pairwise_metrics(datasets, "precip", lat, lon)
+        for batch, one in zip(pairs, single):
+            for key in ("rmse", "bias", "val_a", "val_b"):
+                np.testing.assert_equal(batch[key][k], one[key])
+        expected = compute_ensemble_spread(datasets, "precip", lat, lon)
+        assert abs(spread[k] - expected) < 1e-12
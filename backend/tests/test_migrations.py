@@ -0,0 +1,123 @@
+"""Tests for the startup schema migration (app.database.migrate_schema).
+
+These need a real PostgreSQL database, since the migrations use
+PostgreSQL-only DDL; the ``pg_engine`` fixture (conftest.py) skips them
+unless ``TEST_DATABASE_URL`` is set.
+"""
+
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import ALEMBIC_DIR, PRE_MIGRATION_REVISION, migrate_schema
+from app.models import ModelRun, PointMetric
+from app.models.divergence import geo_bucket, near
+
+
+def _create_unversioned_schema(connection) -> None:
+    """The schema ``create_all`` built before startup ran migrations.
+
+    That schema is identical to :data:`PRE_MIGRATION_REVISION`; it just has
+    no ``alembic_version`` table.
+    """
+    from alembic.config import Config
+
+    from alembic import command
+
+    cfg = Config()
+    cfg.set_main_option("script_location", str(ALEMBIC_DIR))
+    cfg.attributes["connection"] = connection
+    command.upgrade(cfg, PRE_MIGRATION_REVISION)
+    connection.execute(text("DROP TABLE alembic_version"))
+
+
+def _head() -> str:
+    return ScriptDirectory(str(ALEMBIC_DIR)).get_current_head()
+
+
+def _columns(connection, table: str) -> dict[str, str]:
+    return {c["name"]: str(c["type"]) for c in inspect(connection).get_columns(table)}
+
+
+async def test_empty_database_is_created_and_stamped(pg_engine):
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+        version = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+        columns = await conn.run_sync(_columns, "model_runs")
+
+    assert version == _head()
+    assert columns["forecast_hours"] == "BYTEA"
+
+
+async def test_unversioned_schema_is_upgraded_with_data(pg_engine):
+    """A deployment created by create_all gets its integer[] lead hours packed."""
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(_create_unversioned_schema)
+        await conn.execute(
+            text(
+                "INSERT INTO model_runs (id, model_name, init_time, forecast_hours,"
+                " status, created_at) VALUES"
+                " (gen_random_uuid(), 'GFS', now(), '{0,6,384}', 'complete', now()),"
+                " (gen_random_uuid(), 'NAM', now(), '{}', 'pending', now())"
+            )
+        )
+
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+
+    async with AsyncSession(pg_engine) as db:
+        rows = (
+            await db.execute(
+                select(ModelRun.model_name, ModelRun.forecast_hours).order_by(
+                    ModelRun.model_name
+                )
+            )
+        ).all()
+    assert [tuple(r) for r in rows] == [("GFS", [0, 6, 384]), ("NAM", [])]
+
+    # A second startup is a no-op
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+        version = await conn.scalar(text("SELECT version_num FROM alembic_version"))
+    assert version == _head()
+
+
+async def test_unversioned_schema_gets_geo_bucket_columns(pg_engine):
+    """Existing point rows get geo_bucket filled in, so near() works on them."""
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(_create_unversioned_schema)
+        await conn.execute(
+            text(
+                "INSERT INTO model_runs (id, model_name, init_time, forecast_hours,"
+                " status, created_at) VALUES"
+                " ('00000000-0000-0000-0000-000000000001', 'GFS', now(), '{0}',"
+                " 'complete', now()),"
+                " ('00000000-0000-0000-0000-000000000002', 'NAM', now(), '{0}',"
+                " 'complete', now())"
+            )
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO point_metrics (id, run_a_id, run_b_id, variable, lat,"
+                " lon, lead_hour, rmse, bias, spread, created_at) VALUES"
+                " (gen_random_uuid(), '00000000-0000-0000-0000-000000000001',"
+                " '00000000-0000-0000-0000-000000000002', 'precip', 40.71, -74.01,"
+                " 0, 1.0, 0.5, 2.0, now())"
+            )
+        )
+
+    async with pg_engine.begin() as conn:
+        await conn.run_sync(migrate_schema)
+        pm_indexes = await conn.run_sync(
+            lambda c: {i["name"] for i in inspect(c).get_indexes("point_metrics")}
+        )
+        mpv_columns = await conn.run_sync(_columns, "model_point_values")
+
+    assert "ix_pm_var_geo_bucket" in pm_indexes
+    assert "geo_bucket" in mpv_columns
+
+    async with AsyncSession(pg_engine) as db:
+        metric = await db.scalar(
+            select(PointMetric).where(near(PointMetric, 40.7128, -74.0060))
+        )
+    assert metric.geo_bucket == geo_bucket(40.71, -74.01)
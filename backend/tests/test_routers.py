@@ -165,6 +165,121 @@ async def test_grid_divergence_success():
     assert len(body["values"][0]) == len(lon)
 
 
+async def test_grid_divergence_nan_serialized_as_null():
+    """NaN cells in the stored grid come back as JSON null."""
+    div_da = xr.DataArray(
+        np.array([[1.5, np.nan], [np.nan, 0.25]]),
+        coords={"latitude": [35.0, 35.25], "longitude": [-80.0, -79.75]},
+        dims=["latitude", "longitude"],
+        name="precip_divergence",
+    )
+
+    snapshot = MagicMock()
+    snapshot.variable = "precip"
+    snapshot.lead_hour = 6
+    snapshot.init_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    snapshot.zarr_path = "/fake/path/fhr006.zarr"
+    snapshot.bbox = {}
+
+    session = _make_session(_mock_execute(scalar_one=snapshot))
+    async with _client(session) as c:
+        with patch("app.routers.divergence.load_divergence_zarr", return_value=div_da):
+            resp = await c.get("/api/divergence/grid?variable=precip&lead_hour=6")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    body = resp.json()
+    assert body["init_time"] == "2024-01-01T00:00:00+00:00"
+    assert body["values"] == [[1.5, None], [None, 0.25]]
+
+
+async def test_grid_divergence_uint16_encoding():
+    """encoding=uint16 packs values into base64 codes that decode to within
+    one quantization step, with NaN mapped to the nodata code."""
+    import base64
+
+    values = np.array([[0.0, 2.0, np.nan], [5.0, 7.5, 10.0]])
+    div_da = xr.DataArray(
+        values,
+        coords={"latitude": [35.0, 35.25], "longitude": [-80.0, -79.75, -79.5]},
+        dims=["latitude", "longitude"],
+        name="precip_divergence",
+    )
+
+    snapshot = MagicMock()
+    snapshot.variable = "precip"
+    snapshot.lead_hour = 0
+    snapshot.init_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    snapshot.zarr_path = "/fake/path/fhr000.zarr"
+    snapshot.bbox = {}
+
+    session = _make_session(_mock_execute(scalar_one=snapshot))
+    async with _client(session) as c:
+        with patch("app.routers.divergence.load_divergence_zarr", return_value=div_da):
+            resp = await c.get(
+                "/api/divergence/grid?variable=precip&lead_hour=0&encoding=uint16"
+            )
+
+    assert resp.status_code == 200
+    packed = resp.json()["values"]
+    assert packed["dtype"] == "uint16"
+    assert packed["shape"] == [2, 3]
+    codes = np.frombuffer(base64.b64decode(packed["data"]), dtype="<u2").reshape(2, 3)
+    assert codes[0, 2] == packed["nodata"]
+    decoded = packed["offset"] + codes * packed["scale"]
+    valid = ~np.isnan(values)
+    np.testing.assert_allclose(decoded[valid], values[valid], atol=packed["scale"])
+
+
+async def test_grid_divergence_float32_encoding():
+    """encoding=float32 sends the exact float32 buffer, NaN included."""
+    import base64
+
+    values = np.array([[0.1, np.nan], [3.25, 1e-3]])
+    div_da = xr.DataArray(
+        values,
+        coords={"latitude": [35.0, 35.25], "longitude": [-80.0, -79.75]},
+        dims=["latitude", "longitude"],
+        name="precip_divergence",
+    )
+
+    snapshot = MagicMock()
+    snapshot.variable = "precip"
+    snapshot.lead_hour = 0
+    snapshot.init_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    snapshot.zarr_path = "/fake/path/fhr000.zarr"
+    snapshot.bbox = {}
+
+    session = _make_session(_mock_execute(scalar_one=snapshot))
+    async with _client(session) as c:
+        with patch("app.routers.divergence.load_divergence_zarr", return_value=div_da):
+            resp = await c.get(
+                "/api/divergence/grid?variable=precip&lead_hour=0&encoding=float32"
+            )
+
+    assert resp.status_code == 200
+    packed = resp.json()["values"]
+    assert packed["dtype"] == "float32"
+    assert packed["shape"] == [2, 2]
+    decoded = np.frombuffer(base64.b64decode(packed["data"]), dtype="<f4")
+    np.testing.assert_array_equal(decoded.reshape(2, 2), values.astype(np.float32))
+
+
+def test_stream_grid_json_splices_row_blocks():
+    """Streamed chunks join into valid JSON spanning several row blocks."""
+    import json
+
+    from app.routers.divergence import _GRID_STREAM_ROWS, _stream_grid_json
+
+    values = np.arange((_GRID_STREAM_ROWS * 2 + 3) * 4, dtype=np.float64).reshape(-1, 4)
+    body = json.loads(b"".join(_stream_grid_json({"variable": "mslp"}, values)))
+    assert body["variable"] == "mslp"
+    assert body["values"] == values.tolist()
+
+    empty = json.loads(b"".join(_stream_grid_json({}, np.empty((0, 4)))))
+    assert empty == {"values": []}
+
+
 # ---------------------------------------------------------------------------
 # GET /api/divergence/grid/snapshots
 # ---------------------------------------------------------------------------
@@ -214,7 +329,8 @@ async def test_divergence_summary_empty():
         return r
 
     session = AsyncMock()
-    # summary endpoint calls execute() once per variable (4 total)
+    session.get_bind = MagicMock()
+    # summary endpoint aggregates every variable in a single execute()
     session.execute.return_value = _empty_result()
 
     async with _client(session) as c:
@@ -224,29 +340,50 @@ async def test_divergence_summary_empty():
     assert resp.json() == []
 
 
+async def test_divergence_summary_served_from_cache_until_cleared():
+    """Repeat summary requests skip the DB until the caches are cleared."""
+    from app.responses import clear_response_caches
+
+    result = MagicMock()
+    result.all.return_value = []
+    session = AsyncMock()
+    session.get_bind = MagicMock()
+    session.execute.return_value = result
+
+    async with _client(session) as c:
+        first = await c.get("/api/divergence/summary")
+        second = await c.get("/api/divergence/summary")
+        assert session.execute.await_count == 1
+        assert second.json() == first.json() == []
+
+        # A different location is a different cache entry
+        await c.get("/api/divergence/summary?lat=40.71&lon=-74.01")
+        assert session.execute.await_count == 2
+
+        clear_response_caches()
+        await c.get("/api/divergence/summary")
+        assert session.execute.await_count == 3
+
+
 async def test_divergence_summary_with_data():
     """Returns one DivergenceSummary entry for each variable that has data."""
 
-    def _spread_row(spread_val):
+    def _spread_row(variable, spread_val):
         row = MagicMock()
+        row.variable = variable
         row.spread = spread_val
         return row
 
-    def _result_with_rows(rows):
-        r = MagicMock()
-        r.all.return_value = rows
-        return r
-
-    session = AsyncMock()
-    # Four variables: precip has spread data, others empty
-    session.execute.side_effect = [
-        _result_with_rows(  # precip
-            [_spread_row(1.0), _spread_row(2.0), _spread_row(3.0)]
-        ),
-        _result_with_rows([]),  # wind_speed
-        _result_with_rows([]),  # mslp
-        _result_with_rows([]),  # hgt_500
+    result = MagicMock()
+    # Only precip has spread data; the other variables are absent
+    result.all.return_value = [
+        _spread_row("precip", 1.0),
+        _spread_row("precip", 2.0),
+        _spread_row("precip", 3.0),
     ]
+    session = AsyncMock()
+    session.get_bind = MagicMock()
+    session.execute.return_value = result
 
     async with _client(session) as c:
         resp = await c.get("/api/divergence/summary")
@@ -261,6 +398,7 @@ async def test_divergence_summary_with_data():
     assert data[0]["min_spread"] == 1.0
     assert data[0]["num_points"] == 3
     assert "GFS" in data[0]["models_compared"]
+    session.execute.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -306,3 +444,42 @@ async def test_list_runs_model_name_uppercased():
     assert resp.status_code == 200
     # Verify the query was executed (uppercase conversion happens inside the query)
     session.execute.assert_awaited_once()
+
+
+# ---------------------------------------------------------------------------
+# GET /api/verification/scores
+# ---------------------------------------------------------------------------
+
+
+async def test_verification_scores_postgres_aggregates_in_sql():
+    """On PostgreSQL the grouped self-join rows are returned as scores."""
+    row = MagicMock()
+    row.model_name = "GFS"
+    row.lead_hour = 6
+    row.mae = 1.23456
+    row.bias = -0.5
+    row.n = 4
+    result = MagicMock()
+    result.all.return_value = [row]
+
+    session = _make_session(result)
+    session.get_bind = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    async with _client(session) as c:
+        resp = await c.get(
+            "/api/verification/scores?lat=40.71&lon=-74.01&variable=precip"
+        )
+
+    assert resp.status_code == 200
+    assert resp.json()["scores"] == [
+        {
+            "model_name": "GFS",
+            "lead_hour": 6,
+            "mae": 1.2346,
+            "bias": -0.5,
+            "n_samples": 4,
+        }
+    ]
+    session.execute.assert_awaited_once()
+    sql = str(session.execute.await_args.args[0])
+    assert "GROUP BY" in sql and "make_interval" in sql
@@ -6,7 +6,7 @@ Database and fetcher interactions are fully mocked.
 """
 
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -49,6 +49,26 @@ def test_latest_cycle_rounds_down():
     assert cycle <= now.replace(minute=0, second=0, microsecond=0)
 
 
+def test_latest_cycle_matches_delay_and_interval():
+    """The memoised result equals rounding (now - delay) down to the interval."""
+    from app.services.scheduler import _latest_cycle
+
+    for interval, delay in ((6, 5), (12, 5), (6, 9)):
+        adjusted = datetime.now(timezone.utc) - timedelta(hours=delay)
+        expected = adjusted.replace(
+            hour=(adjusted.hour // interval) * interval,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        cycle = _latest_cycle(hour_interval=interval, availability_delay_hours=delay)
+        assert cycle == expected
+        assert (
+            _latest_cycle(hour_interval=interval, availability_delay_hours=delay)
+            is cycle
+        )
+
+
 # ---------------------------------------------------------------------------
 # ingest_and_process – idempotency
 # ---------------------------------------------------------------------------
@@ -64,7 +84,7 @@ async def test_ingest_skips_already_processed_run():
     existing_run = MagicMock()
     existing_run.status = RunStatus.complete
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_run
+    mock_result.one_or_none.return_value = existing_run
     mock_db.execute.return_value = mock_result
 
     mock_cm = MagicMock()
@@ -72,7 +92,7 @@ async def test_ingest_skips_already_processed_run():
     mock_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("app.database.async_session", return_value=mock_cm),
+        patch("app.services.scheduler.async_session", return_value=mock_cm),
         patch("app.services.ingestion.gfs.GFSFetcher") as mock_gfs_cls,
     ):
         from app.services.scheduler import ingest_and_process
@@ -103,7 +123,7 @@ async def test_ingest_sets_error_status_on_fetch_failure():
     mock_db.flush = AsyncMock()
     # Return no existing run for every execute() call
     no_result = MagicMock()
-    no_result.scalar_one_or_none.return_value = None
+    no_result.one_or_none.return_value = None
     mock_db.execute.return_value = no_result
 
     mock_cm = MagicMock()
@@ -115,9 +135,9 @@ async def test_ingest_sets_error_status_on_fetch_failure():
     mock_stmt.where.return_value = mock_stmt
 
     with (
-        patch("app.database.async_session", return_value=mock_cm),
-        patch("app.models.ModelRun", return_value=run_record),
-        patch("sqlalchemy.select", return_value=mock_stmt),
+        patch("app.services.scheduler.async_session", return_value=mock_cm),
+        patch("app.services.scheduler.ModelRun", return_value=run_record),
+        patch("app.services.scheduler.select", return_value=mock_stmt),
         patch(
             "app.services.ingestion.gfs.GFSFetcher.fetch",
             side_effect=RuntimeError("network down"),
@@ -144,14 +164,14 @@ async def test_ingest_returns_none_when_already_processed():
     existing_run = MagicMock()
     existing_run.status = RunStatus.complete
     mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_run
+    mock_result.one_or_none.return_value = existing_run
     mock_db.execute.return_value = mock_result
 
     mock_cm = MagicMock()
     mock_cm.__aenter__ = AsyncMock(return_value=mock_db)
     mock_cm.__aexit__ = AsyncMock(return_value=False)
 
-    with patch("app.database.async_session", return_value=mock_cm):
+    with patch("app.services.scheduler.async_session", return_value=mock_cm):
         from app.services.scheduler import ingest_and_process
 
         result = await ingest_and_process("GFS")
@@ -170,7 +190,7 @@ async def test_ingest_returns_none_on_fetch_error():
     mock_db.commit = AsyncMock()
     mock_db.flush = AsyncMock()
     no_result = MagicMock()
-    no_result.scalar_one_or_none.return_value = None
+    no_result.one_or_none.return_value = None
     mock_db.execute.return_value = no_result
 
     mock_cm = MagicMock()
@@ -181,9 +201,9 @@ async def test_ingest_returns_none_on_fetch_error():
     mock_stmt.where.return_value = mock_stmt
 
     with (
-        patch("app.database.async_session", return_value=mock_cm),
-        patch("app.models.ModelRun", return_value=run_record),
-        patch("sqlalchemy.select", return_value=mock_stmt),
+        patch("app.services.scheduler.async_session", return_value=mock_cm),
+        patch("app.services.scheduler.ModelRun", return_value=run_record),
+        patch("app.services.scheduler.select", return_value=mock_stmt),
         patch(
             "app.services.ingestion.gfs.GFSFetcher.fetch",
             side_effect=RuntimeError("network down"),
@@ -232,7 +252,7 @@ async def test_ingest_never_fetches_other_models():
     mock_db.flush = AsyncMock()
 
     no_result = MagicMock()
-    no_result.scalar_one_or_none.return_value = None
+    no_result.one_or_none.return_value = None
     no_result.scalars.return_value.all.return_value = []
     mock_db.execute.return_value = no_result
 
@@ -244,9 +264,9 @@ async def test_ingest_never_fetches_other_models():
     mock_stmt.where.return_value = mock_stmt
 
     with (
-        patch("app.database.async_session", return_value=mock_cm),
-        patch("app.models.ModelRun", return_value=run_record),
-        patch("sqlalchemy.select", return_value=mock_stmt),
+        patch("app.services.scheduler.async_session", return_value=mock_cm),
+        patch("app.services.scheduler.ModelRun", return_value=run_record),
+        patch("app.services.scheduler.select", return_value=mock_stmt),
         patch(
             "app.services.ingestion.gfs.GFSFetcher.fetch",
             return_value=fetched_data,
@@ -262,3 +282,173 @@ async def test_ingest_never_fetches_other_models():
     # NAM and HRRR fetchers should never be instantiated
     mock_nam_cls.assert_not_called()
     mock_hrrr_cls.assert_not_called()
+
+
+async def test_ingest_bulk_inserts_point_values(db):
+    """Point values are stored with one INSERT per lead hour, not db.add."""
+    import numpy as np
+    import xarray as xr
+    from sqlalchemy import func, select
+
+    from app.config import settings
+    from app.models import ModelPointValue, ModelRun
+
+    lat = np.arange(25.0, 50.0, 1.0)
+    lon = np.arange(-125.0, -65.0, 1.0)
+    fetched_data = {
+        fhr: xr.Dataset(
+            {
+                "precip": (("latitude", "longitude"), np.full((25, 60), fhr + 1.0)),
+                "mslp": (("latitude", "longitude"), np.full((25, 60), 1013.0)),
+            },
+            coords={"latitude": lat, "longitude": lon},
+        )
+        for fhr in (0, 6)
+    }
+
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=db)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.services.scheduler.async_session", return_value=session_cm),
+        patch("app.services.ingestion.gfs.GFSFetcher.fetch", return_value=fetched_data),
+        patch("app.services.scheduler._clean_herbie_cache"),
+        patch.object(db, "add", wraps=db.add) as add,
+    ):
+        from app.services.scheduler import ingest_and_process
+
+        await ingest_and_process("GFS", datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    # Only the ModelRun itself goes through the unit of work
+    assert [type(c.args[0]) for c in add.call_args_list] == [ModelRun]
+    count = await db.scalar(select(func.count()).select_from(ModelPointValue))
+    assert count == 2 * 2 * len(settings.monitor_points)
+    values = (
+        await db.scalars(
+            select(ModelPointValue.value).where(
+                ModelPointValue.variable == "precip", ModelPointValue.lead_hour == 6
+            )
+        )
+    ).all()
+    assert set(values) == {7.0}
+
+
+async def test_forced_reingest_replaces_existing_run(db):
+    """force=True deletes the old run and its point values before refetching."""
+    import numpy as np
+    import xarray as xr
+    from sqlalchemy import select
+
+    from app.models import ModelPointValue, ModelRun, RunStatus
+
+    init_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    old = ModelRun(
+        model_name="GFS",
+        init_time=init_time,
+        forecast_hours=[0],
+        status=RunStatus.complete,
+    )
+    db.add(old)
+    await db.commit()
+    db.add(
+        ModelPointValue(
+            run_id=old.id, variable="precip", lat=0.0, lon=0.0, lead_hour=0, value=1.0
+        )
+    )
+    await db.commit()
+    old_id = old.id
+
+    fetched_data = {
+        0: xr.Dataset(
+            {"precip": (("latitude", "longitude"), np.zeros((2, 2)))},
+            coords={"latitude": [39.0, 40.0], "longitude": [-75.0, -74.0]},
+        )
+    }
+    session_cm = MagicMock()
+    session_cm.__aenter__ = AsyncMock(return_value=db)
+    session_cm.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("app.services.scheduler.async_session", return_value=session_cm),
+        patch("app.services.ingestion.gfs.GFSFetcher.fetch", return_value=fetched_data),
+        patch("app.services.scheduler._clean_herbie_cache"),
+    ):
+        from app.services.scheduler import ingest_and_process
+
+        assert await ingest_and_process("GFS", init_time, force=True)
+
+    db.expunge_all()
+    runs = (await db.execute(select(ModelRun.id, ModelRun.status))).all()
+    assert len(runs) == 1
+    assert runs[0].id != old_id
+    assert runs[0].status == RunStatus.complete
+    run_ids = set((await db.scalars(select(ModelPointValue.run_id))).all())
+    assert run_ids == {runs[0].id}
+
+
+def test_monitor_point_coords_cached_until_points_change(monkeypatch):
+    from app.config import settings
+    from app.services.scheduler import _monitor_point_coords
+
+    first = _monitor_point_coords()
+    assert _monitor_point_coords()[0] is first[0]
+    assert not first[0].flags.writeable
+
+    monkeypatch.setattr(settings, "monitor_points", [(10.0, 20.0, "A")])
+    lats, lons = _monitor_point_coords()
+    assert lats.tolist() == [10.0]
+    assert lons.tolist() == [20.0]
+
+
+def test_clean_herbie_cache_removes_nested_subset_files(tmp_path, monkeypatch):
+    from pathlib import Path
+
+    from app.services.scheduler import _clean_herbie_cache
+
+    grib_dir = tmp_path / ".herbie" / "gfs" / "20240101"
+    grib_dir.mkdir(parents=True)
+    (grib_dir / "subset_abc__gfs.t00z.pgrb2.0p25.f006").write_bytes(b"x")
+    (tmp_path / ".herbie" / "subset_top").write_bytes(b"x")
+    (grib_dir / "gfs.t00z.pgrb2.0p25.f006.idx").write_text("idx")
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    _clean_herbie_cache()
+
+    remaining = sorted(p.name for p in (tmp_path / ".herbie").rglob("*"))
+    assert remaining == ["20240101", "gfs", "gfs.t00z.pgrb2.0p25.f006.idx"]
+
+
+# ---------------------------------------------------------------------------
+# _fetch_lead_hour – concurrent per-model fetches for divergence
+# ---------------------------------------------------------------------------
+
+
+async def test_fetch_lead_hour_overlaps_model_fetches():
+    """Both models' fetches run at once; a failing model is left out."""
+    import threading
+
+    from app.services.scheduler import _fetch_lead_hour
+
+    # Each fetch waits for the other, so a serial loop would time out
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetcher(value):
+        def fetch(init_time, lead_hours):
+            barrier.wait()
+            return {lead_hours[0]: value}
+
+        return MagicMock(fetch=fetch)
+
+    failing = MagicMock()
+    failing.fetch.side_effect = RuntimeError("404")
+    gfs, nam = MagicMock(), MagicMock()
+    gfs.load.return_value, nam.load.return_value = gfs, nam
+    fetchers = {"GFS": fetcher(gfs), "NAM": fetcher(nam), "HRRR": failing}
+
+    result = await _fetch_lead_hour(
+        fetchers, ["GFS", "NAM", "HRRR"], datetime(2024, 1, 1), 6
+    )
+
+    assert result == {"GFS": gfs, "NAM": nam}
+    gfs.load.assert_called_once_with()
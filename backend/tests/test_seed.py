@@ -158,3 +158,41 @@ async def test_seed_calls_recompute_divergence_after_models():
 
     # recompute_cycle_divergence is called at least once (for each unique init_time)
     assert mock_divergence.call_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_seed_launches_models_concurrently():
+    """Every model's ingestion is started before any of them finishes."""
+    import asyncio
+
+    mock_db = AsyncMock()
+    mock_result = MagicMock()
+    mock_result.scalar.return_value = 0
+    mock_db.execute.return_value = mock_result
+
+    mock_cm = MagicMock()
+    mock_cm.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_cm.__aexit__ = AsyncMock(return_value=False)
+
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def _ingest_side_effect(model, **kwargs):
+        started.append(model)
+        if len(started) == 6:
+            release.set()
+        await release.wait()
+        return {0: MagicMock()}
+
+    with (
+        patch("app.main.asyncio.sleep", new_callable=AsyncMock),
+        patch("app.database.async_session", return_value=mock_cm),
+        patch("app.main.settings"),
+        patch(_INGEST_PATH, new_callable=AsyncMock, side_effect=_ingest_side_effect),
+        patch(_DIVERGENCE_PATH, new_callable=AsyncMock),
+    ):
+        from app.main import _seed_initial_data
+
+        await asyncio.wait_for(_seed_initial_data(), timeout=5)
+
+    assert sorted(started) == sorted(["GFS", "NAM", "HRRR", "ECMWF", "AIGFS", "RRFS"])
@@ -0,0 +1,80 @@
+"""Tests for the frontend StaticFiles mount (app.static)."""
+
+import gzip
+import hashlib
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from app.static import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    CachedStaticFiles,
+)
+
+INDEX_HTML = b"<!doctype html><div id=root></div>"
+BUNDLE_JS = b"console.log('synoptic');"
+
+
+@pytest.fixture
+async def static_client(tmp_path):
+    (tmp_path / "index.html").write_bytes(INDEX_HTML)
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "index-3f9a1c.js").write_bytes(BUNDLE_JS)
+    (tmp_path / "assets" / "index-3f9a1c.js.gz").write_bytes(gzip.compress(BUNDLE_JS))
+
+    app = Starlette(
+        routes=[Mount("/", CachedStaticFiles(directory=tmp_path, html=True))]
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_fingerprinted_assets_are_immutable(static_client):
+    resp = await static_client.get(
+        "/assets/index-3f9a1c.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert resp.headers["etag"] == f'"{hashlib.sha256(BUNDLE_JS).hexdigest()}"'
+
+
+async def test_index_html_must_revalidate(static_client):
+    resp = await static_client.get("/")
+    assert resp.status_code == 200
+    assert resp.content == INDEX_HTML
+    assert resp.headers["cache-control"] == REVALIDATE_CACHE_CONTROL
+    assert resp.headers["etag"] == f'"{hashlib.sha256(INDEX_HTML).hexdigest()}"'
+
+
+async def test_matching_etag_returns_304(static_client):
+    etag = (await static_client.get("/")).headers["etag"]
+    resp = await static_client.get("/", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+
+async def test_precompressed_sibling_served_when_accepted(static_client):
+    resp = await static_client.get(
+        "/assets/index-3f9a1c.js", headers={"Accept-Encoding": "br;q=0, gzip"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert resp.headers["content-type"].startswith("text/javascript")
+    assert resp.headers["vary"] == "Accept-Encoding"
+    # httpx transparently decodes the gzip body.
+    assert resp.content == BUNDLE_JS
+    assert resp.headers["etag"] != f'"{hashlib.sha256(BUNDLE_JS).hexdigest()}"'
+
+
+async def test_identity_served_when_encoding_not_accepted(static_client):
+    resp = await static_client.get(
+        "/assets/index-3f9a1c.js", headers={"Accept-Encoding": "identity"}
+    )
+    assert resp.status_code == 200
+    assert "content-encoding" not in resp.headers
+    assert resp.headers["vary"] == "Accept-Encoding"
+    assert resp.content == BUNDLE_JS
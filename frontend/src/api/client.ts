@@ -33,7 +33,7 @@ export interface GridDivergenceData {
   init_time: string
   latitudes: number[]
   longitudes: number[]
-  values: number[][]
+  values: (number | null)[][]  // null where the grid has no data (NaN)
   bbox: { min_lat: number; max_lat: number; min_lon: number; max_lon: number }
 }
 
@@ -102,13 +102,45 @@ export function useDivergencePoint(params: {
   })
 }
 
+// Grid values as sent with encoding=uint16: base64 little-endian codes,
+// value = offset + code * scale, with `nodata` marking missing cells.
+interface QuantizedGrid {
+  dtype: 'uint16'
+  shape: [number, number]
+  scale: number
+  offset: number
+  nodata: number
+  data: string
+}
+
+function dequantizeGrid(q: QuantizedGrid): (number | null)[][] {
+  const bytes = Uint8Array.from(atob(q.data), c => c.charCodeAt(0))
+  const view = new DataView(bytes.buffer)
+  const [rows, cols] = q.shape
+  const out: (number | null)[][] = []
+  for (let i = 0; i < rows; i++) {
+    const row: (number | null)[] = new Array(cols)
+    for (let j = 0; j < cols; j++) {
+      const code = view.getUint16((i * cols + j) * 2, true)
+      row[j] = code === q.nodata ? null : q.offset + code * q.scale
+    }
+    out.push(row)
+  }
+  return out
+}
+
 export function useDivergenceGrid(params: {
   variable: string
   lead_hour: number
 }) {
   return useQuery({
     queryKey: ['divergence-grid', params],
-    queryFn: () => api.get<GridDivergenceData>('/divergence/grid', { params }).then(r => r.data),
+    queryFn: () =>
+      api
+        .get<Omit<GridDivergenceData, 'values'> & { values: QuantizedGrid }>('/divergence/grid', {
+          params: { ...params, encoding: 'uint16' },
+        })
+        .then(r => ({ ...r.data, values: dequantizeGrid(r.data.values) }) as GridDivergenceData),
   })
 }
 
@@ -36,7 +36,7 @@ export default function DivergenceOverlay({ data }: Props) {
     let max = -Infinity
     for (const row of values) {
       for (const v of row) {
-        if (isFinite(v)) {
+        if (v != null && isFinite(v)) {
           if (v < min) min = v
           if (v > max) max = v
         }
@@ -49,7 +49,7 @@ export default function DivergenceOverlay({ data }: Props) {
     for (let i = 0; i < latitudes.length; i++) {
       for (let j = 0; j < longitudes.length; j++) {
         const val = values[i]?.[j]
-        if (val === undefined || !isFinite(val)) continue
+        if (val == null || !isFinite(val)) continue
 
         const bounds: L.LatLngBoundsExpression = [
           [latitudes[i] - latStep / 2, longitudes[j] - lonStep / 2],
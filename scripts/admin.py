@@ -2,7 +2,7 @@
 """CLI script for SynopticSpread admin operations.
 
 Usage:
-    uv run scripts/admin.py status
+    uv run scripts/admin.py status [--exact]
     uv run scripts/admin.py trigger GFS [--time 2026-02-25T18:00:00]
     uv run scripts/admin.py trigger NAM
     uv run scripts/admin.py trigger ECMWF
@@ -27,10 +27,12 @@ def print_json(data: dict | list):
     print(json.dumps(data, indent=2))
 
 
-def status():
-    r = httpx.get(f"{BASE_URL}/status")
+def status(exact: bool = False):
+    r = httpx.get(f"{BASE_URL}/status", params={"exact": exact})
     r.raise_for_status()
     data = r.json()
+    if data.get("counts_estimated"):
+        print("(point metrics count is an estimate — pass --exact for an exact count)")
     print(f"Runs:            {data['runs']}")
     print(f"Point metrics:   {data['point_metrics']}")
     print(f"Grid snapshots:  {data['grid_snapshots']}")
@@ -84,7 +86,12 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    subparsers.add_parser("status", help="Show DB and file counts")
+    p_status = subparsers.add_parser("status", help="Show DB and file counts")
+    p_status.add_argument(
+        "--exact",
+        action="store_true",
+        help="Count point metrics exactly instead of using the PostgreSQL planner estimate (slower)",
+    )
 
     p_trigger = subparsers.add_parser("trigger", help="Queue model ingestion")
     p_trigger.add_argument(
@@ -112,7 +119,7 @@ def main():
 
     try:
         if args.command == "status":
-            status()
+            status(args.exact)
         elif args.command == "trigger":
             trigger(args.model, args.init_time)
         elif args.command == "clear":